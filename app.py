@@ -3,13 +3,15 @@ TalentScout Hiring Assistant - Main Application
 """
 
 import streamlit as st
-from utils.gemini_client import GeminiClient
+from utils.gemini_client import GeminiClient, warm_up
 from utils.conversation_manager import ConversationManager
-from config.settings import APP_TITLE, COMPANY_NAME, ConversationState, GEMINI_API_KEY
+from utils.session_store import session_store
+from utils.export import ExportFormat, EXPORT_MIME_TYPES, candidate_record, export_bytes, parquet_available
+from config.settings import APP_TITLE, COMPANY_NAME, ConversationState, GEMINI_API_KEY, LLM_BACKEND
 from utils.ui_components import (
     render_feature_cards, 
     render_progress_ring, 
-    render_typing_indicator,
+    render_streaming_response,
     render_success_animation
 )
 import time
@@ -259,10 +261,42 @@ def initialize_session_state():
         st.session_state.conversation_manager = None
         st.session_state.conversation_started = False
         st.session_state.user_input_key = 0
+        st.session_state.session_token = None
+        st.session_state.restore_checked = False
+
+def restore_session():
+    # Resume the interview checkpointed under the session token in the URL, if any
+    token = st.experimental_get_query_params().get("session", [None])[0]
+    if not token or session_store is None:
+        return
+    client = GeminiClient()
+    restored = session_store.load(token, client)
+    if restored is None:
+        return
+    st.session_state.gemini_client = client
+    st.session_state.conversation_manager, st.session_state.messages = restored
+    st.session_state.conversation_started = True
+    st.session_state.session_token = token
+
+def checkpoint_session():
+    if session_store is not None and st.session_state.session_token:
+        session_store.save(
+            st.session_state.session_token,
+            st.session_state.conversation_manager,
+            st.session_state.messages
+        )
 
 def check_api_key():
+    if LLM_BACKEND == "local":
+        return True
     return bool(GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here")
 
+@st.cache_resource
+def warm_llm_backend():
+    # Runs once per server process; every session shares the configured model
+    warm_up()
+    return True
+
 def start_conversation():
     try:
         st.session_state.gemini_client = GeminiClient()
@@ -270,10 +304,18 @@ def start_conversation():
         st.session_state.conversation_started = True
         greeting = st.session_state.conversation_manager.process_message("")
         st.session_state.messages.append({"role": "assistant", "content": greeting})
+        if session_store is not None:
+            st.session_state.session_token = session_store.new_token()
+            st.experimental_set_query_params(session=st.session_state.session_token)
+            checkpoint_session()
     except Exception as e:
         st.error(f"Error: {e}")
 
 def reset_conversation():
+    if session_store is not None and st.session_state.session_token:
+        session_store.delete(st.session_state.session_token)
+    st.session_state.session_token = None
+    st.experimental_set_query_params()
     st.session_state.messages = []
     st.session_state.conversation_manager = None
     st.session_state.conversation_started = False
@@ -292,6 +334,13 @@ def main():
         st.error("API key not configured. Please check your .env file.")
         return
     
+    warm_llm_backend()
+    
+    # Restoring builds a client, so it waits until the key is known to be set
+    if not st.session_state.restore_checked:
+        st.session_state.restore_checked = True
+        restore_session()
+    
     # Sidebar with enhanced UI
     with st.sidebar:
         st.markdown("### Interview Dashboard")
@@ -329,13 +378,28 @@ def main():
             st.markdown("---")
             
             # Actions
+            formats = [ExportFormat.JSONL, ExportFormat.CSV]
+            if parquet_available():
+                formats.append(ExportFormat.PARQUET)
+            export_format = st.selectbox("Export format", formats, format_func=str.upper)
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("Reset", use_container_width=True):
                     reset_conversation()
             with col2:
-                if st.button("Export", use_container_width=True):
-                    st.info("Export feature coming soon!")
+                export_requested = st.button("Export", use_container_width=True)
+            # Built only when asked for, not on every rerun
+            if export_requested:
+                record = candidate_record(
+                    mgr.to_dict(), st.session_state.messages, st.session_state.session_token
+                )
+                st.download_button(
+                    f"Download {export_format.upper()}",
+                    data=export_bytes([record], export_format),
+                    file_name=f"candidate_{st.session_state.session_token or 'session'}.{export_format}",
+                    mime=EXPORT_MIME_TYPES[export_format],
+                    use_container_width=True
+                )
         else:
             st.markdown("""
                 <div class="info-card">
@@ -407,15 +471,17 @@ def main():
             if user_input:
                 # Display user message immediately
                 st.session_state.messages.append({"role": "user", "content": user_input})
+                with st.chat_message("user"):
+                    st.markdown(user_input)
                 
-                # Show typing indicator
+                # Stream the reply token by token
                 with st.chat_message("assistant"):
-                    render_typing_indicator()
-                
-                with st.spinner("Processing your response..."):
-                    response = st.session_state.conversation_manager.process_message(user_input)
+                    response = render_streaming_response(
+                        st.session_state.conversation_manager.process_message_stream(user_input)
+                    )
                 
                 st.session_state.messages.append({"role": "assistant", "content": response})
+                checkpoint_session()
                 st.rerun()
         else:
             # Interview completed with animation
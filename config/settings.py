@@ -13,11 +13,166 @@ APP_TITLE = os.getenv("APP_TITLE", "TalentScout Hiring Assistant")
 COMPANY_NAME = os.getenv("COMPANY_NAME", "TalentScout")
 MAX_CONTEXT_MESSAGES = int(os.getenv("MAX_CONTEXT_MESSAGES", "10"))
 
+# Conversation context sent with prompts: recent messages verbatim plus a rolling summary of older ones
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))
+CONTEXT_SUMMARY_TOKEN_BUDGET = int(os.getenv("CONTEXT_SUMMARY_TOKEN_BUDGET", "300"))
+CONTEXT_MESSAGE_TOKEN_LIMIT = int(os.getenv("CONTEXT_MESSAGE_TOKEN_LIMIT", "300"))  # Longer messages are clipped
+
 # Model Configuration
 GEMINI_MODEL = "gemini-2.5-flash"  # Fast, stable, and efficient for conversations
 TEMPERATURE = 0.7
 MAX_OUTPUT_TOKENS = 8192  # Increased to handle multiple technology questions
 
+# Generation profiles
+class GenerationProfile:
+    """Enum for named generation settings, picked per call."""
+    DEFAULT = "default"
+    SHORT_REPLY = "short_reply"
+    QUESTION = "question"
+    STRUCTURED = "structured"
+
+# Output budgets include the model's thinking tokens, so they sit well above the visible reply length
+GENERATION_PROFILES = {
+    GenerationProfile.DEFAULT: {
+        "temperature": TEMPERATURE,
+        "max_output_tokens": MAX_OUTPUT_TOKENS,
+        "stop_sequences": [],
+    },
+    # Greetings, closings and short answers to process questions
+    GenerationProfile.SHORT_REPLY: {
+        "temperature": 0.7,
+        "max_output_tokens": int(os.getenv("SHORT_REPLY_MAX_OUTPUT_TOKENS", "1024")),
+        "stop_sequences": ["\nCandidate:"],
+    },
+    # A single interview question, optionally with a brief acknowledgment
+    GenerationProfile.QUESTION: {
+        "temperature": 0.7,
+        "max_output_tokens": int(os.getenv("QUESTION_MAX_OUTPUT_TOKENS", "1536")),
+        "stop_sequences": ["\nCandidate:"],
+    },
+    # JSON question plans and question bank batches
+    GenerationProfile.STRUCTURED: {
+        "temperature": 0.4,
+        "max_output_tokens": int(os.getenv("STRUCTURED_MAX_OUTPUT_TOKENS", "4096")),
+        "stop_sequences": [],
+    },
+}
+
+# Backend: "gemini" for the live API, "local" for the deterministic offline backend
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini").lower()
+LOCAL_BACKEND_SEED = int(os.getenv("LOCAL_BACKEND_SEED", "0"))
+LOCAL_BACKEND_LATENCY_MEDIAN_SECONDS = float(os.getenv("LOCAL_BACKEND_LATENCY_MEDIAN_SECONDS", "0.8"))
+LOCAL_BACKEND_LATENCY_SIGMA = float(os.getenv("LOCAL_BACKEND_LATENCY_SIGMA", "0.5"))
+LOCAL_BACKEND_FAILURE_RATE = float(os.getenv("LOCAL_BACKEND_FAILURE_RATE", "0"))
+LOCAL_BACKEND_RATE_LIMIT_RATE = float(os.getenv("LOCAL_BACKEND_RATE_LIMIT_RATE", "0"))
+
+# Maximum number of async Gemini calls in flight per process
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+
+# Process-wide rate limits (0 disables a limit); background calls leave a reserve for interactive turns
+RATE_LIMIT_REQUESTS_PER_MINUTE = float(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "1000"))
+RATE_LIMIT_TOKENS_PER_MINUTE = float(os.getenv("RATE_LIMIT_TOKENS_PER_MINUTE", "1000000"))
+RATE_LIMIT_BACKGROUND_RESERVE = float(os.getenv("RATE_LIMIT_BACKGROUND_RESERVE", "0.2"))
+
+# Retry and Circuit Breaker Configuration
+RETRY_BASE_DELAY_SECONDS = float(os.getenv("RETRY_BASE_DELAY_SECONDS", "0.5"))
+RETRY_MAX_DELAY_SECONDS = float(os.getenv("RETRY_MAX_DELAY_SECONDS", "8"))
+RATE_LIMIT_BASE_DELAY_SECONDS = float(os.getenv("RATE_LIMIT_BASE_DELAY_SECONDS", "2"))
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))  # Retries earned per request
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "1"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "30"))
+
+# Hedged requests: resend a slow interactive call and take whichever copy answers first
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))  # Latency percentile that triggers the hedge
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))  # Samples needed before the percentile is trusted
+HEDGE_LATENCY_WINDOW = int(os.getenv("HEDGE_LATENCY_WINDOW", "200"))  # Recent attempts the percentile is taken over
+HEDGE_INITIAL_DELAY_SECONDS = float(os.getenv("HEDGE_INITIAL_DELAY_SECONDS", "3"))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "0.25"))
+HEDGE_MAX_WORKERS = int(os.getenv("HEDGE_MAX_WORKERS", "32"))
+
+# Metrics Configuration
+METRICS_DUMP_PATH = os.getenv("METRICS_DUMP_PATH", "")  # Written at exit when set
+METRICS_RECENT_RECORDS = int(os.getenv("METRICS_RECENT_RECORDS", "1000"))
+
+# Micro-benchmarks run with `python -m utils.benchmark`; slower than baseline by more than the threshold is a regression
+BENCHMARK_BASELINE_PATH = os.getenv("BENCHMARK_BASELINE_PATH", "data/benchmark_baseline.json")
+BENCHMARK_REGRESSION_THRESHOLD = float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "0.15"))
+
+# Response Cache Configuration
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "86400"))
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "")  # Empty keeps the cache in memory only
+
+# Plan every technical question in one call when the tech stack is submitted
+QUESTION_PLAN_ENABLED = os.getenv("QUESTION_PLAN_ENABLED", "false").lower() == "true"
+
+# Offline question bank built with `python -m utils.question_bank`
+QUESTION_BANK_PATH = os.getenv(
+    "QUESTION_BANK_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "question_bank.json")
+)
+
+# Interview checkpoints written after every turn so sessions survive restarts. They hold
+# candidate details, so they are off unless a path is set (e.g. data/sessions.db)
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", "")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "604800"))
+EXPORT_ROW_GROUP_SIZE = int(os.getenv("EXPORT_ROW_GROUP_SIZE", "1000"))  # Rows buffered per columnar row group
+
+# Generate the next technical question in the background while the candidate answers
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() == "true"
+PREFETCH_MAX_WORKERS = int(os.getenv("PREFETCH_MAX_WORKERS", "8"))
+
+# Score technical answers in the background, a few answers per model call
+SCORING_ENABLED = os.getenv("SCORING_ENABLED", "true").lower() == "true"
+SCORING_BATCH_SIZE = int(os.getenv("SCORING_BATCH_SIZE", "3"))
+SCORING_MAX_WORKERS = int(os.getenv("SCORING_MAX_WORKERS", "4"))
+
+# Interview API server run with `python -m utils.api_server`
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("API_ALLOWED_ORIGINS", "").split(",") if origin.strip()]
+API_SESSION_IDLE_SECONDS = int(os.getenv("API_SESSION_IDLE_SECONDS", "1800"))  # Idle sessions leave memory; checkpoints remain
+API_MAX_MESSAGE_CHARS = int(os.getenv("API_MAX_MESSAGE_CHARS", "4000"))
+API_STREAM_WORKERS = int(os.getenv("API_STREAM_WORKERS", "32"))  # Threads running streamed turns
+
+# Prompt types
+class PromptType:
+    """Enum for the kinds of prompts sent to the model."""
+    GREETING = "greeting"
+    EXIT = "exit"
+    TECH_QUESTIONS = "tech_questions"
+    QUESTION_PLAN = "question_plan"
+    FOLLOWUP = "followup"
+    PREFETCH_QUESTION = "prefetch_question"
+    WRAP_UP_ANSWER = "wrap_up_answer"
+    ANSWER_SCORING = "answer_scoring"
+
+# Only prompts whose answer does not depend on free-form candidate text are cached
+CACHEABLE_PROMPT_TYPES = [
+    PromptType.GREETING,
+    PromptType.EXIT,
+    PromptType.TECH_QUESTIONS,
+    PromptType.QUESTION_PLAN,
+]
+
+# Prompts nobody is waiting on; they yield to candidate turns under rate limiting
+BACKGROUND_PROMPT_TYPES = [
+    PromptType.PREFETCH_QUESTION,
+    PromptType.ANSWER_SCORING,
+]
+
+# Prompts a candidate is waiting on, which are worth hedging
+HEDGE_PROMPT_TYPES = [
+    PromptType.GREETING,
+    PromptType.EXIT,
+    PromptType.TECH_QUESTIONS,
+    PromptType.FOLLOWUP,
+    PromptType.WRAP_UP_ANSWER,
+]
+
 # Conversation States
 class ConversationState:
     """Enum for conversation states."""
@@ -33,9 +188,25 @@ class ConversationState:
     WRAP_UP = "wrap_up"
     ENDED = "ended"
 
+# Per-turn latency budget by state; a model call that would miss it is replaced by a local response
+TURN_DEADLINES_ENABLED = os.getenv("TURN_DEADLINES_ENABLED", "true").lower() == "true"
+TURN_DEADLINE_DEFAULT_SECONDS = float(os.getenv("TURN_DEADLINE_DEFAULT_SECONDS", "8"))
+TURN_DEADLINE_SECONDS = {
+    ConversationState.GREETING: float(os.getenv("TURN_DEADLINE_GREETING_SECONDS", "6")),
+    ConversationState.COLLECT_TECH_STACK: float(os.getenv("TURN_DEADLINE_TECH_STACK_SECONDS", "10")),
+    ConversationState.TECHNICAL_QA: float(os.getenv("TURN_DEADLINE_TECHNICAL_QA_SECONDS", "8")),
+    ConversationState.WRAP_UP: float(os.getenv("TURN_DEADLINE_WRAP_UP_SECONDS", "6")),
+}
+
 # Exit keywords
 EXIT_KEYWORDS = ["bye", "exit", "quit", "stop", "end", "goodbye", "no thanks"]
 
+# Intent model shipped with the project, trained with `python -m utils.intent`
+INTENT_MODEL_PATH = os.getenv(
+    "INTENT_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "intent_model.json")
+)
+
 # Tech stacks for validation (common technologies)
 COMMON_TECH_STACKS = [
     "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Go", "Rust",
@@ -43,3 +214,32 @@ COMMON_TECH_STACKS = [
     "Node.js", "Express", "Next.js", "SQL", "PostgreSQL", "MySQL", "MongoDB",
     "Redis", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "Linux"
 ]
+
+# Alternate spellings of COMMON_TECH_STACKS entries; case, spaces, dots and hyphens are ignored when matching
+TECH_ALIASES = {
+    "Python": ["py", "python3", "cpython"],
+    "Java": ["jdk", "openjdk", "java se"],
+    "JavaScript": ["js", "es6", "ecmascript", "vanilla js"],
+    "TypeScript": ["ts"],
+    "C++": ["cpp", "cplusplus", "c plus plus"],
+    "C#": ["csharp", "c sharp"],
+    "Go": ["golang"],
+    "Rust": ["rustlang"],
+    "React": ["reactjs", "react.js"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue": ["vuejs", "vue.js"],
+    "FastAPI": ["fast api"],
+    "Spring Boot": ["springboot", "spring"],
+    "Node.js": ["node", "nodejs"],
+    "Express": ["expressjs", "express.js"],
+    "Next.js": ["next", "nextjs"],
+    "PostgreSQL": ["postgres", "postgre", "psql", "pg"],
+    "MongoDB": ["mongo"],
+    "Kubernetes": ["k8s", "kube"],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "GCP": ["google cloud", "google cloud platform"],
+}
+
+# Tech stack entries matched with less confidence are kept as the candidate wrote them
+TECH_MATCH_MIN_CONFIDENCE = float(os.getenv("TECH_MATCH_MIN_CONFIDENCE", "0.75"))
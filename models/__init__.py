@@ -1,6 +1,6 @@
 """Data models for the hiring assistant."""
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr, field_validator, Field
+from pydantic import BaseModel, EmailStr, field_validator, Field, ValidationError
 import re
 import phonenumbers
 
@@ -16,6 +16,7 @@ class CandidateInfo(BaseModel):
     current_location: Optional[str] = None
     tech_stack: Optional[List[str]] = None
     technical_responses: Optional[dict] = Field(default_factory=dict)
+    scored_answers: List["ScoredAnswer"] = Field(default_factory=list)
     
     @field_validator('full_name')
     @classmethod
@@ -71,17 +72,8 @@ class CandidateInfo(BaseModel):
         return v.strip()
     
     def to_dict(self) -> dict:
-        """Convert model to dictionary."""
-        return {
-            "full_name": self.full_name,
-            "email": self.email,
-            "phone": self.phone,
-            "years_experience": self.years_experience,
-            "desired_positions": self.desired_positions,
-            "current_location": self.current_location,
-            "tech_stack": self.tech_stack,
-            "technical_responses": self.technical_responses
-        }
+        """Convert model to a JSON-compatible dictionary."""
+        return self.model_dump(mode="json")
     
     def is_complete(self) -> bool:
         """Check if all required information is collected."""
@@ -108,3 +100,125 @@ class CandidateInfo(BaseModel):
         ]
         completed = sum(1 for field in fields if field is not None)
         return int((completed / len(fields)) * 100)
+
+
+class ScoredAnswer(BaseModel):
+    """A technical answer with the question it answered and its score.
+    
+    Score and feedback stay None until background scoring finishes.
+    """
+    
+    technology: str
+    question: str
+    answer: str
+    score: Optional[int] = None
+    feedback: Optional[str] = None
+
+
+class AnswerScore(BaseModel):
+    """Score for one answer in a scoring batch."""
+    
+    index: int
+    score: int
+    feedback: Optional[str] = None
+    
+    @field_validator('score')
+    @classmethod
+    def validate_score(cls, v: int) -> int:
+        """Clamp the score to the 0-10 scale."""
+        return max(0, min(10, v))
+
+
+class AnswerScoreSheet(BaseModel):
+    """Scores for a batch of answers, generated in one call."""
+    
+    scores: List[AnswerScore] = Field(default_factory=list)
+    
+    @classmethod
+    def from_response(cls, text: str, count: int) -> "AnswerScoreSheet":
+        """
+        Parse and validate a model response into scores.
+        
+        Entries whose index is outside the batch are dropped.
+        
+        Args:
+            text: Raw model response, optionally wrapped in a code fence
+            count: Number of answers in the batch
+            
+        Returns:
+            The validated scores, empty if the response could not be parsed
+        """
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return cls()
+        try:
+            sheet = cls.model_validate_json(text[start:end + 1])
+        except ValidationError:
+            return cls()
+        return cls(scores=[score for score in sheet.scores if 0 <= score.index < count])
+
+
+class PlannedQuestion(BaseModel):
+    """A technical question prepared ahead of time.
+    
+    A question of None marks a slot to be generated live for the technology.
+    """
+    
+    technology: str
+    question: Optional[str] = None
+    topic: Optional[str] = None
+    
+    @field_validator('technology', 'question')
+    @classmethod
+    def validate_not_blank(cls, v: Optional[str]) -> Optional[str]:
+        """Validate that the field has content."""
+        if v is None:
+            return v
+        if not v.strip():
+            raise ValueError('Field must not be blank')
+        return v.strip()
+
+
+class QuestionPlan(BaseModel):
+    """Every technical question for an interview, generated in one call."""
+    
+    questions: List[PlannedQuestion] = Field(default_factory=list)
+    
+    @classmethod
+    def from_response(cls, text: str, tech_stack: List[str], questions_per_tech: int) -> "QuestionPlan":
+        """
+        Parse and validate a model response into a plan.
+        
+        Questions about technologies outside ``tech_stack`` are dropped and
+        each technology keeps at most ``questions_per_tech`` questions.
+        
+        Args:
+            text: Raw model response, optionally wrapped in a code fence
+            tech_stack: The candidate's technologies
+            questions_per_tech: Maximum questions kept per technology
+            
+        Returns:
+            The validated plan, empty if the response could not be parsed
+        """
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return cls()
+        try:
+            plan = cls.model_validate_json(text[start:end + 1])
+        except ValidationError:
+            return cls()
+        
+        # Use the candidate's spelling of each technology
+        canonical = {tech.lower(): tech for tech in tech_stack}
+        counts = {}
+        questions = []
+        for item in plan.questions:
+            tech = canonical.get(item.technology.lower())
+            if tech is None or item.question is None or counts.get(tech, 0) >= questions_per_tech:
+                continue
+            counts[tech] = counts.get(tech, 0) + 1
+            questions.append(PlannedQuestion(technology=tech, question=item.question, topic=item.topic))
+        return cls(questions=questions)
+
+
+CandidateInfo.model_rebuild()
@@ -1,4 +1,5 @@
 """System prompts for the hiring assistant."""
+from config.settings import GenerationProfile
 
 SYSTEM_PROMPT = """You are a professional hiring assistant for TalentScout, a leading technology recruitment agency. Your role is to conduct initial candidate screenings in a friendly, professional, and encouraging manner.
 
@@ -46,6 +47,7 @@ The greeting should:
 - Be concise (3-4 sentences maximum)
 
 Generate the greeting now:"""
+GREETING_PROFILE = GenerationProfile.SHORT_REPLY
 
 FALLBACK_PROMPT = """The candidate said: "{user_input}"
 
@@ -56,6 +58,7 @@ This message seems to be off-topic or unclear in the context of a hiring screeni
 4. Maintains a friendly and professional tone
 
 Generate the response:"""
+FALLBACK_PROFILE = GenerationProfile.SHORT_REPLY
 
 EXIT_CONFIRMATION_PROMPT = """The candidate indicated they want to end the conversation by saying: "{user_input}"
 
@@ -67,6 +70,7 @@ Generate a professional closing message that:
 5. Keeps it brief and positive
 
 Generate the closing message:"""
+EXIT_CONFIRMATION_PROFILE = GenerationProfile.SHORT_REPLY
 
 TECH_STACK_ACKNOWLEDGMENT = """The candidate provided the following tech stack: {tech_stack}
 
@@ -77,3 +81,4 @@ Generate a brief, encouraging acknowledgment that:
 4. Maintains enthusiasm
 
 Generate the acknowledgment:"""
+TECH_STACK_ACKNOWLEDGMENT_PROFILE = GenerationProfile.SHORT_REPLY
@@ -1,4 +1,19 @@
 """Technical question generation prompts."""
+from config.settings import GenerationProfile
+
+
+def get_experience_level(years_experience: int) -> str:
+    """
+    Map years of experience to the level questions are pitched at.
+    
+    Args:
+        years_experience: Candidate's years of experience
+        
+    Returns:
+        "beginner", "intermediate" or "advanced"
+    """
+    return "beginner" if years_experience < 2 else "intermediate" if years_experience < 5 else "advanced"
+
 
 def generate_technical_questions_prompt(tech_stack: list, years_experience: int) -> str:
     """
@@ -11,7 +26,7 @@ def generate_technical_questions_prompt(tech_stack: list, years_experience: int)
     Returns:
         Formatted prompt for question generation
     """
-    experience_level = "beginner" if years_experience < 2 else "intermediate" if years_experience < 5 else "advanced"
+    experience_level = get_experience_level(years_experience)
     
     # Limit to first 3-4 technologies to avoid token limits
     limited_stack = tech_stack[:4] if len(tech_stack) > 4 else tech_stack
@@ -36,7 +51,75 @@ Generate the response now:"""
     return prompt
 
 
-def generate_followup_question_prompt(tech: str, previous_answer: str, years_experience: int) -> str:
+TECHNICAL_QUESTIONS_PROFILE = GenerationProfile.QUESTION
+
+
+def generate_question_plan_prompt(tech_stack: list, years_experience: int, questions_per_tech: int) -> str:
+    """
+    Generate prompt for planning every technical question in one call.
+    
+    Args:
+        tech_stack: Technologies to cover, in the order they should be asked
+        years_experience: Candidate's years of experience
+        questions_per_tech: Number of questions for each technology
+        
+    Returns:
+        Prompt asking for a JSON question plan
+    """
+    experience_level = get_experience_level(years_experience)
+    tech_list = ", ".join(tech_stack)
+    
+    prompt = f"""You are planning a technical screening interview for a candidate with {years_experience} years of experience ({experience_level} level).
+
+Their tech stack includes: {tech_list}
+
+Write exactly {questions_per_tech} interview questions for EACH technology listed above. Each question should:
+1. Be appropriate for {experience_level} level
+2. Be answerable in a few sentences of conversation
+3. Cover a different topic than the other questions for the same technology
+4. Be a single question, without any greeting or acknowledgment
+
+Group the questions by technology, in the order the technologies are listed.
+
+Respond with ONLY a JSON object in this exact format, with no extra text:
+{{"questions": [{{"technology": "<technology name as listed>", "question": "<question text>"}}]}}"""
+    
+    return prompt
+
+
+QUESTION_PLAN_PROFILE = GenerationProfile.STRUCTURED
+
+
+def generate_question_bank_prompt(tech: str, experience_level: str, count: int) -> str:
+    """
+    Generate prompt for a batch of reusable question bank entries.
+    
+    Args:
+        tech: The technology to write questions about
+        experience_level: "beginner", "intermediate" or "advanced"
+        count: Number of questions to write
+        
+    Returns:
+        Prompt asking for JSON question bank entries
+    """
+    prompt = f"""You are building a bank of reusable technical screening questions.
+
+Write {count} interview questions about {tech} for {experience_level} level candidates. Each question should:
+1. Cover a different topic (for example a language feature, tool, practice or design concern)
+2. Be answerable in a few sentences of conversation
+3. Stand on its own, without any greeting or reference to earlier answers
+
+Respond with ONLY a JSON object in this exact format, with no extra text:
+{{"questions": [{{"technology": "{tech}", "topic": "<short topic name>", "question": "<question text>"}}]}}"""
+    
+    return prompt
+
+
+QUESTION_BANK_PROFILE = GenerationProfile.STRUCTURED
+
+
+def generate_followup_question_prompt(tech: str, previous_answer: str, years_experience: int,
+                                       conversation_context: str = "") -> str:
     """
     Generate a follow-up question based on candidate's answer.
     
@@ -44,11 +127,13 @@ def generate_followup_question_prompt(tech: str, previous_answer: str, years_exp
         tech: The technology being discussed
         previous_answer: Candidate's previous answer
         years_experience: Years of experience
+        conversation_context: Summary and recent messages of the interview so far
         
     Returns:
         Prompt for generating follow-up question
     """
-    prompt = f"""The candidate just answered a question about {tech}:
+    context_section = f"{conversation_context}\n\n" if conversation_context else ""
+    prompt = f"""{context_section}The candidate just answered a question about {tech}:
 "{previous_answer}"
 
 Based on their answer, generate ONE relevant follow-up question that:
@@ -64,30 +149,72 @@ Generate the follow-up question:"""
     return prompt
 
 
-def validate_technical_answer_prompt(question: str, answer: str) -> str:
+FOLLOWUP_QUESTION_PROFILE = GenerationProfile.QUESTION
+
+
+def generate_next_question_prompt(tech: str, years_experience: int, previous_question: str) -> str:
+    """
+    Generate prompt for the next question, written before the current answer arrives.
+    
+    Args:
+        tech: The technology the next question is about
+        years_experience: Years of experience
+        previous_question: The question the candidate is currently answering
+        
+    Returns:
+        Prompt for generating the next question
+    """
+    experience_level = get_experience_level(years_experience)
+    
+    prompt = f"""You are conducting a technical interview for a candidate with {years_experience} years of experience ({experience_level} level).
+
+The candidate is currently answering this question:
+"{previous_question}"
+
+Generate the NEXT interview question, about {tech}, that:
+1. Covers a different topic than the current question
+2. Is appropriate for {experience_level} level
+3. Is a single, conversational question
+4. Does NOT acknowledge or refer to the candidate's answer, since it is not known yet
+
+Generate only the question:"""
+    
+    return prompt
+
+
+NEXT_QUESTION_PROFILE = GenerationProfile.QUESTION
+
+
+def generate_answer_scoring_prompt(answers: list, years_experience: int) -> str:
     """
-    Generate prompt to validate and provide feedback on technical answer.
+    Generate prompt to score several technical answers in one call.
     
     Args:
-        question: The question asked
-        answer: Candidate's answer
+        answers: (technology, question, answer) triples, in order
+        years_experience: Years of experience
         
     Returns:
-        Prompt for answer validation
+        Prompt for scoring the answers as JSON
     """
-    prompt = f"""Question asked: "{question}"
-Candidate's answer: "{answer}"
+    experience_level = get_experience_level(years_experience)
+    items = "\n\n".join(
+        f"[{index}] Technology: {tech}\nQuestion: \"{question}\"\nAnswer: \"{answer}\""
+        for index, (tech, question, answer) in enumerate(answers)
+    )
+    
+    prompt = f"""You are reviewing answers from a screening for a candidate with {years_experience} years of experience ({experience_level} level).
 
-Provide brief, encouraging feedback that:
-1. Acknowledges their answer
-2. If correct, praises them
-3. If partially correct, gently highlights what's good
-4. If unclear, asks for clarification
-5. Keeps it to 1-2 sentences
-6. Maintains a positive, supportive tone
+Score each answer below from 0 to 10 for accuracy and depth, judged against what is expected at {experience_level} level:
+- 0: No relevant content, or the candidate did not know
+- 5: Partially correct or shallow
+- 10: Complete, accurate and well explained
 
-DO NOT provide the correct answer or lecture them. Just acknowledge and move forward.
+{items}
 
-Generate the feedback:"""
+Return ONLY a JSON object in this exact format, with one entry per answer:
+{{"scores": [{{"index": 0, "score": 7, "feedback": "One sentence for the recruiter on strengths and gaps."}}]}}"""
     
     return prompt
+
+
+ANSWER_SCORING_PROFILE = GenerationProfile.STRUCTURED
@@ -0,0 +1,62 @@
+"""Shared fixtures for the test suite."""
+from typing import List, Dict, Optional, Callable
+from utils.conversation_manager import ConversationManager
+import asyncio
+import threading
+import time
+import pytest
+
+
+class StubClient:
+    """
+    Client that answers without a model.
+
+    Replies come from ``replies`` by prompt type (a callable receives the
+    prompt), and ``delays`` holds seconds to wait before answering each
+    prompt type. Every call is recorded in ``calls`` as (prompt_type, prompt).
+    """
+
+    def __init__(self, replies: Optional[Dict[Optional[str], object]] = None,
+                 delays: Optional[Dict[Optional[str], float]] = None):
+        self.replies = replies or {}
+        self.delays = delays or {}
+        self.calls: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def _reply(self, prompt: str, prompt_type: Optional[str]) -> str:
+        with self._lock:
+            self.calls.append((prompt_type, prompt))
+        reply = self.replies.get(prompt_type, f"{prompt_type} reply")
+        return reply(prompt) if callable(reply) else reply
+
+    def generate_content(self, prompt: str, prompt_type: Optional[str] = None, **kwargs) -> str:
+        time.sleep(self.delays.get(prompt_type, 0))
+        return self._reply(prompt, prompt_type)
+
+    async def generate_content_async(self, prompt: str, prompt_type: Optional[str] = None, **kwargs) -> str:
+        await asyncio.sleep(self.delays.get(prompt_type, 0))
+        return self._reply(prompt, prompt_type)
+
+    def generate_content_stream(self, prompt: str, prompt_type: Optional[str] = None, **kwargs):
+        yield self.generate_content(prompt, prompt_type)
+
+    def types_called(self) -> List[Optional[str]]:
+        """Prompt types of every call so far, in order."""
+        return [prompt_type for prompt_type, _ in self.calls]
+
+
+@pytest.fixture
+def stub_client() -> StubClient:
+    return StubClient()
+
+
+@pytest.fixture
+def make_manager(stub_client) -> Callable[..., ConversationManager]:
+    """Build a manager on ``stub_client`` in a given state with candidate fields set."""
+    def build(state: str, client: Optional[StubClient] = None, **candidate) -> ConversationManager:
+        manager = ConversationManager(client or stub_client)
+        manager.state = state
+        for field_name, value in candidate.items():
+            setattr(manager.candidate, field_name, value)
+        return manager
+    return build
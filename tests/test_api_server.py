@@ -0,0 +1,110 @@
+"""HTTP and WebSocket API."""
+from tornado.testing import AsyncHTTPTestCase, gen_test
+from tornado.websocket import websocket_connect
+from config.settings import ConversationState
+from utils.api_server import SessionRegistry, make_app
+from tests.conftest import StubClient
+import json
+
+
+class ApiServerTest(AsyncHTTPTestCase):
+
+    def get_app(self):
+        self.registry = SessionRegistry(store=None, client_factory=StubClient)
+        return make_app(self.registry)
+
+    def request(self, method: str, path: str, body=None):
+        if body is not None and not isinstance(body, (str, bytes)):
+            body = json.dumps(body)
+        if body is None and method == "POST":
+            body = ""
+        response = self.fetch(path, method=method, body=body)
+        return response, json.loads(response.body) if response.body else None
+
+    def create_session(self) -> str:
+        response, data = self.request("POST", "/sessions")
+        self.assertEqual(response.code, 201)
+        return data["session"]
+
+    def test_create_session_returns_the_greeting(self):
+        response, data = self.request("POST", "/sessions")
+
+        self.assertEqual(response.code, 201)
+        self.assertEqual(data["state"], ConversationState.COLLECT_NAME)
+        self.assertTrue(data["reply"])
+        self.assertEqual(len(self.registry), 1)
+
+    def test_message_is_answered_and_recorded(self):
+        token = self.create_session()
+
+        response, data = self.request("POST", f"/sessions/{token}/messages", {"message": "Ada Lovelace"})
+
+        self.assertEqual(response.code, 200)
+        self.assertEqual(data["state"], ConversationState.COLLECT_EMAIL)
+        _, details = self.request("GET", f"/sessions/{token}")
+        self.assertEqual(details["candidate"]["full_name"], "Ada Lovelace")
+        self.assertEqual([m["role"] for m in details["messages"]], ["assistant", "user", "assistant"])
+
+    def test_unknown_session_is_404(self):
+        response, data = self.request("POST", "/sessions/missing/messages", {"message": "hi"})
+
+        self.assertEqual(response.code, 404)
+        self.assertEqual(data["error"], "Unknown or expired session")
+
+    def test_bad_bodies_are_400(self):
+        token = self.create_session()
+
+        for body in ["not json", {"message": "  "}, {"text": "hi"}, ["hi"]]:
+            response, data = self.request("POST", f"/sessions/{token}/messages", body)
+            self.assertEqual(response.code, 400, body)
+            self.assertIn("error", data)
+
+    def test_ended_session_is_409(self):
+        token = self.create_session()
+        self.registry._sessions[token].manager.state = ConversationState.ENDED
+
+        response, data = self.request("POST", f"/sessions/{token}/messages", {"message": "hello"})
+
+        self.assertEqual(response.code, 409)
+        self.assertEqual(data["error"], "The interview has ended")
+
+    def test_deleted_session_is_gone(self):
+        token = self.create_session()
+
+        response, _ = self.request("DELETE", f"/sessions/{token}")
+
+        self.assertEqual(response.code, 204)
+        self.assertEqual(self.request("GET", f"/sessions/{token}")[0].code, 404)
+
+    def test_health_counts_sessions(self):
+        self.create_session()
+
+        _, data = self.request("GET", "/health")
+
+        self.assertEqual(data, {"status": "ok", "sessions": 1})
+
+    @gen_test
+    async def test_stream_sends_chunks_then_done(self):
+        session = await self.registry.create()
+        url = self.get_url(f"/sessions/{session.token}/stream").replace("http", "ws", 1)
+        connection = await websocket_connect(url)
+
+        connection.write_message(json.dumps({"message": ""}))
+        error = json.loads(await connection.read_message())
+        connection.write_message(json.dumps({"message": "Ada Lovelace"}))
+        frames = []
+        while not frames or frames[-1]["type"] != "done":
+            frames.append(json.loads(await connection.read_message()))
+        connection.close()
+
+        self.assertEqual(error["type"], "error")
+        chunks = "".join(frame["text"] for frame in frames if frame["type"] == "chunk")
+        self.assertEqual(chunks, frames[-1]["reply"])
+        self.assertEqual(frames[-1]["state"], ConversationState.COLLECT_EMAIL)
+
+    @gen_test
+    async def test_stream_for_unknown_session_is_closed(self):
+        connection = await websocket_connect(self.get_url("/sessions/missing/stream").replace("http", "ws", 1))
+
+        self.assertIsNone(await connection.read_message())
+        self.assertEqual(connection.close_code, 4404)
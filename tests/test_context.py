@@ -0,0 +1,93 @@
+"""Ring buffer and token-budgeted context window."""
+from utils.context import ContextWindow, RingBuffer, clip_to_tokens
+from utils.llm_backends import estimate_tokens
+import pytest
+
+
+def _message(n: int):
+    return ("user", f"message {n}", 2)
+
+
+def test_ring_buffer_evicts_the_oldest_item_when_full():
+    buffer = RingBuffer(3)
+    evicted = [buffer.append(_message(n)) for n in range(5)]
+
+    assert evicted == [None, None, None, _message(0), _message(1)]
+    assert list(buffer) == [_message(2), _message(3), _message(4)]
+    assert len(buffer) == buffer.capacity == 3
+
+
+def test_ring_buffer_pops_in_order_and_wraps_around():
+    buffer = RingBuffer(2)
+    buffer.append(_message(0))
+    buffer.append(_message(1))
+    assert buffer.popleft() == _message(0)
+    buffer.append(_message(2))
+
+    assert list(buffer) == [_message(1), _message(2)]
+
+
+def test_ring_buffer_clear_and_empty_pop():
+    buffer = RingBuffer(2)
+    buffer.append(_message(0))
+    buffer.clear()
+
+    assert len(buffer) == 0 and list(buffer) == []
+    with pytest.raises(IndexError):
+        buffer.popleft()
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_clip_cuts_long_text_at_a_word():
+    text = "word " * 100
+
+    clipped = clip_to_tokens(text, 10)
+
+    assert clipped.endswith(" …")
+    assert estimate_tokens(clipped) <= 11
+    assert clip_to_tokens("short", 10) == "short"
+
+
+def test_window_stays_within_budget_over_a_long_conversation():
+    window = ContextWindow(token_budget=200, summary_budget=60, message_token_limit=50, max_messages=6)
+    for n in range(100):
+        window.add("assistant", f"Question {n}: how would you design system {n}?")
+        window.add("user", f"Answer {n}. " + "detail " * 30)
+
+    assert window.tokens <= 200
+    assert len(window.messages()) <= 6
+    assert "earlier messages omitted" in window.render()
+
+
+def test_evicted_assistant_turns_keep_their_question():
+    window = ContextWindow(token_budget=400, summary_budget=100, max_messages=2)
+    window.add("assistant", "Thanks. What is a Python decorator?")
+    window.add("user", "A function wrapping another.")
+    window.add("user", "Anything else?")
+
+    rendered = window.render()
+
+    assert "Assistant asked: What is a Python decorator?" in rendered
+    assert "Candidate: Anything else?" in rendered
+
+
+def test_render_can_leave_out_the_latest_messages():
+    window = ContextWindow()
+    window.add("assistant", "Hello")
+    window.add("user", "Hi there")
+
+    assert "Hi there" not in window.render(skip_latest=1)
+    assert window.render(skip_latest=2) == ""
+
+
+def test_window_round_trips_through_a_dict():
+    window = ContextWindow(token_budget=200, summary_budget=60, max_messages=3)
+    for n in range(10):
+        window.add("user", f"Answer number {n}.")
+
+    restored = ContextWindow(token_budget=200, summary_budget=60, max_messages=3)
+    restored.load_dict(window.to_dict())
+
+    assert restored.to_dict() == window.to_dict()
+    assert restored.render() == window.render()
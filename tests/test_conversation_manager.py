@@ -0,0 +1,101 @@
+"""Behaviour of ConversationManager turns on a stubbed client."""
+from config.settings import ConversationState, PromptType, TURN_DEADLINE_SECONDS
+from tests.conftest import StubClient
+import asyncio
+import time
+
+ANSWER = "I would profile the service first and then cache the slow lookups behind a TTL."
+
+
+def _interviewing(make_manager, client):
+    manager = make_manager(ConversationState.TECHNICAL_QA, client,
+                           full_name="Ada Lovelace", years_experience=5, tech_stack=["Python", "React"])
+    manager.questions_asked = 1
+    manager._last_question = "Tell me about the GIL."
+    return manager
+
+
+def test_unfinished_prefetch_is_awaited_instead_of_generating_live(make_manager):
+    client = StubClient(replies={PromptType.PREFETCH_QUESTION: "What is a context manager?"},
+                        delays={PromptType.PREFETCH_QUESTION: 0.2})
+    manager = _interviewing(make_manager, client)
+    manager._start_prefetch(manager._last_question)
+
+    reply = manager.process_message(ANSWER)
+
+    assert reply == "Thanks for your answer! What is a context manager?"
+    assert PromptType.FOLLOWUP not in client.types_called()
+
+
+def test_unfinished_prefetch_is_awaited_in_async_turns(make_manager):
+    client = StubClient(replies={PromptType.PREFETCH_QUESTION: "What is a context manager?"},
+                        delays={PromptType.PREFETCH_QUESTION: 0.2})
+    manager = _interviewing(make_manager, client)
+    manager._start_prefetch(manager._last_question)
+
+    reply = asyncio.run(manager.process_message_async(ANSWER))
+
+    assert reply == "Thanks for your answer! What is a context manager?"
+    assert PromptType.FOLLOWUP not in client.types_called()
+
+
+def test_prefetch_missing_the_deadline_serves_the_fallback(make_manager, monkeypatch):
+    monkeypatch.setitem(TURN_DEADLINE_SECONDS, ConversationState.TECHNICAL_QA, 0.1)
+    client = StubClient(delays={PromptType.PREFETCH_QUESTION: 1.0, PromptType.FOLLOWUP: 1.0})
+    manager = _interviewing(make_manager, client)
+    manager._start_prefetch(manager._last_question)
+
+    reply = manager.process_message(ANSWER)
+
+    assert reply == manager._generate_fallback_followup("Python")
+    assert manager.turn_degraded
+
+
+def _missed_followup(make_manager, monkeypatch):
+    """A manager whose last follow-up missed the deadline and finished afterwards."""
+    monkeypatch.setitem(TURN_DEADLINE_SECONDS, ConversationState.TECHNICAL_QA, 0.05)
+    monkeypatch.setattr("utils.conversation_manager.PREFETCH_ENABLED", False)
+    client = StubClient(replies={PromptType.FOLLOWUP: lambda prompt: f"Follow-up #{len(client.calls)}"},
+                        delays={PromptType.FOLLOWUP: 0.2})
+    manager = _interviewing(make_manager, client)
+    # One technology, so the next question is about the same one
+    manager.candidate.tech_stack = ["Python"]
+    manager.max_questions_per_tech = 5
+    manager.process_message(ANSWER)
+    assert manager.turn_degraded
+    client.delays = {}
+    time.sleep(0.3)
+    return manager, client
+
+
+def test_late_followup_serves_the_same_answer_resent(make_manager, monkeypatch):
+    manager, client = _missed_followup(make_manager, monkeypatch)
+
+    reply = manager.process_message(ANSWER)
+
+    assert reply == "Follow-up #1"
+    assert client.types_called().count(PromptType.FOLLOWUP) == 1
+
+
+def test_late_followup_is_not_reused_for_a_different_answer(make_manager, monkeypatch):
+    manager, client = _missed_followup(make_manager, monkeypatch)
+
+    reply = manager.process_message("A different answer about descriptors and the attribute lookup chain.")
+
+    assert reply == "Follow-up #2"
+    manager.process_message("Yet another answer, this time about generators and lazy evaluation.")
+    assert manager._late_results == {}
+
+
+def test_stream_failing_before_any_text_serves_the_fallback(make_manager):
+    class BrokenStreamClient(StubClient):
+        def generate_content_stream(self, prompt, prompt_type=None, **kwargs):
+            raise ConnectionError("reset by peer")
+            yield
+
+    manager = make_manager(ConversationState.GREETING, BrokenStreamClient())
+
+    reply = "".join(manager.process_message_stream(""))
+
+    assert reply == manager._generate_fallback_greeting()
+    assert manager.state == ConversationState.COLLECT_NAME
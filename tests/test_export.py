@@ -0,0 +1,99 @@
+"""Candidate exports from the session store."""
+from config.settings import ConversationState
+from utils.export import ExportFormat, candidate_record, export_bytes, iter_csv, session_records
+from utils.session_store import SessionStore
+from tests.conftest import StubClient
+from utils.conversation_manager import ConversationManager
+import csv
+import io
+import json
+import pytest
+
+
+def _finished_manager(name: str) -> ConversationManager:
+    manager = ConversationManager(StubClient())
+    manager.state = ConversationState.ENDED
+    manager.candidate.full_name = name
+    manager.candidate.tech_stack = ["Python", "Go"]
+    return manager
+
+
+@pytest.fixture
+def store(tmp_path) -> SessionStore:
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    for index in range(25):
+        store.save(f"token-{index:02d}", _finished_manager(f"Candidate {index}"),
+                   [{"role": "user", "content": f"message {index}"}])
+    unfinished = _finished_manager("Still Going")
+    unfinished.state = ConversationState.TECHNICAL_QA
+    store.save("token-zz", unfinished)
+    return store
+
+
+def test_jsonl_export_streams_completed_interviews(store):
+    lines = export_bytes(session_records(store), ExportFormat.JSONL).decode("utf-8").splitlines()
+
+    records = [json.loads(line) for line in lines]
+    assert len(records) == 25
+    assert records[0]["full_name"] == "Candidate 0"
+    assert records[0]["tech_stack"] == ["Python", "Go"]
+    assert records[0]["transcript"] == [{"role": "user", "content": "message 0"}]
+
+
+def test_all_interviews_can_be_exported(store):
+    assert len(list(session_records(store, completed_only=False))) == 26
+
+
+def test_csv_has_a_header_even_without_records():
+    rows = list(csv.reader(io.StringIO("".join(iter_csv([])))))
+
+    assert rows[0][:3] == ["session", "state", "full_name"]
+    assert len(rows) == 1
+
+
+def test_csv_flattens_lists_and_nests_json():
+    record = candidate_record(_finished_manager("Ada Lovelace").to_dict(), [], session="token")
+
+    header, row = csv.reader(io.StringIO("".join(iter_csv([record]))))
+    values = dict(zip(header, row))
+
+    assert values["tech_stack"] == "Python; Go"
+    assert json.loads(values["transcript"]) == []
+
+
+def test_checkpoints_are_written_while_an_export_is_reading(store):
+    # Another process's store, as when the app checkpoints during a CLI export
+    writer = SessionStore(store.path)
+    snapshots = store.iter_snapshots(batch_size=5)
+    next(snapshots)
+
+    assert writer.save("token-new", _finished_manager("Late Arrival"))
+    assert writer.save("token-03", _finished_manager("Renamed"))
+
+    tokens = ["token-00"] + [token for token, _ in snapshots]
+    assert tokens == sorted(set(tokens))
+    assert "token-new" in tokens
+
+
+def test_parquet_cli_fails_early_without_pyarrow(store, monkeypatch, tmp_path):
+    from utils import export
+
+    monkeypatch.setattr("utils.session_store.session_store", store)
+    monkeypatch.setattr(export, "parquet_available", lambda: False)
+    output = tmp_path / "candidates.parquet"
+
+    with pytest.raises(SystemExit):
+        export.main(["--format", "parquet", "--output", str(output)])
+    assert not output.exists()
+
+
+def test_parquet_round_trip(store, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet", exc_type=ImportError)
+    from utils.export import write_parquet
+
+    path = str(tmp_path / "candidates.parquet")
+    count = write_parquet(session_records(store), path, row_group_size=10)
+
+    table = pq.read_table(path)
+    assert count == table.num_rows == 25
+    assert pq.ParquetFile(path).num_row_groups == 3
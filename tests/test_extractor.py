@@ -0,0 +1,118 @@
+"""Extraction of several intake fields from one message."""
+from config.settings import ConversationState
+from utils.extractor import extract_candidate_fields
+import pytest
+
+LABELLED = {"full_name", "tech_stack"}
+
+
+def test_full_introduction_fills_every_field():
+    fields = extract_candidate_fields(
+        "Hi, I'm Priya Sharma, priya.sharma@example.com, +14155552671, 6 years of experience, "
+        "applying for Backend Engineer, based in Berlin, my stack is Python, React",
+        labelled_only=LABELLED
+    )
+
+    assert fields == {
+        "full_name": "Priya Sharma",
+        "email": "priya.sharma@example.com",
+        "phone": "+1 415-555-2671",
+        "years_experience": 6,
+        "desired_positions": ["Backend Engineer"],
+        "current_location": "Berlin",
+        "tech_stack": ["Python", "React"],
+    }
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("I have 5 years of experience with Python", {"years_experience": 5}),
+    ("5 years, Python, React", {"years_experience": 5}),
+    ("New York, NY", {"current_location": "New York, NY"}),
+])
+def test_unlabelled_names_and_stacks_are_not_taken_out_of_turn(text, expected):
+    assert extract_candidate_fields(text, labelled_only=LABELLED) == expected
+
+
+def test_unlabelled_fields_are_taken_when_allowed():
+    assert extract_candidate_fields("5 years, Python, React") == {"years_experience": 5, "tech_stack": ["Python", "React"]}
+    assert extract_candidate_fields("Ada Lovelace, ada@example.com") == {
+        "full_name": "Ada Lovelace", "email": "ada@example.com"
+    }
+
+
+def test_lead_ins_pick_the_field():
+    assert extract_candidate_fields("I'm based in Berlin") == {"current_location": "Berlin"}
+    assert extract_candidate_fields("I am from Paris, France") == {"current_location": "Paris, France"}
+    assert extract_candidate_fields("I'm Ada Lovelace", labelled_only=LABELLED) == {"full_name": "Ada Lovelace"}
+
+
+def test_known_and_invalid_fields_are_dropped():
+    assert extract_candidate_fields("ada@example.com, 5 years", skip=["email"]) == {"years_experience": 5}
+    assert "email" not in extract_candidate_fields("not-an-email@, 5 years")
+
+
+def test_experience_answer_mentioning_a_technology_keeps_the_stack_question(make_manager):
+    manager = make_manager(ConversationState.COLLECT_EXPERIENCE, full_name="Ada Lovelace")
+
+    manager.process_message("I have 5 years of experience with Python")
+
+    assert manager.state == ConversationState.COLLECT_POSITION
+    assert manager.candidate.years_experience == 5
+    assert manager.candidate.tech_stack is None
+
+
+def test_several_fields_skip_ahead_to_the_first_missing_step(make_manager):
+    manager = make_manager(ConversationState.COLLECT_NAME)
+
+    reply = manager.process_message("I'm Ada Lovelace, ada@example.com, +14155552671")
+
+    assert manager.state == ConversationState.COLLECT_EXPERIENCE
+    assert reply.startswith("Thanks, Ada Lovelace! I've noted your name, email and phone number.")
+
+
+def test_location_stops_at_the_rest_of_the_sentence(make_manager):
+    manager = make_manager(ConversationState.COLLECT_LOCATION, full_name="Ada Lovelace")
+
+    manager.process_message("I live in New York and have 3 years of experience")
+
+    assert manager.candidate.current_location == "New York"
+    assert manager.candidate.years_experience == 3
+
+
+def test_known_name_is_not_taken_as_a_place(make_manager):
+    manager = make_manager(ConversationState.COLLECT_EMAIL, full_name="John Doe")
+
+    manager.process_message("John Doe, john@x.com, +1 415 555 2671, 5 years, Backend, Berlin, Python/Go")
+
+    assert manager.candidate.current_location == "Berlin"
+    assert manager.candidate.email == "john@x.com"
+    assert manager.candidate.desired_positions == ["Backend"]
+
+
+def test_text_around_contact_details_is_not_a_place(make_manager):
+    manager = make_manager(ConversationState.COLLECT_PHONE, full_name="Ada Lovelace")
+
+    manager.process_message("call me at 415-555-2671 or mail j@x.com")
+
+    assert manager.candidate.current_location is None
+    assert manager.candidate.email == "j@x.com"
+
+
+def test_role_text_drops_filler_words(make_manager):
+    manager = make_manager(ConversationState.COLLECT_EXPERIENCE, full_name="Ada Lovelace")
+
+    manager.process_message("3 years, mostly as a backend engineer")
+
+    assert manager.candidate.desired_positions == ["backend engineer"]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("ada@example.com, 5 years, San Francisco, CA", {"email": "ada@example.com", "years_experience": 5}),
+    ("ada@example.com, 5 years, based in San Francisco, CA",
+     {"email": "ada@example.com", "years_experience": 5, "current_location": "San Francisco, CA"}),
+    ("ada@example.com, 5 years, Berlin", {"email": "ada@example.com", "years_experience": 5, "current_location": "Berlin"}),
+])
+def test_places_out_of_turn_need_a_lead_or_an_unambiguous_segment(text, expected):
+    labelled = LABELLED | {"current_location"}
+
+    assert extract_candidate_fields(text, skip=["full_name"], labelled_only=labelled) == expected
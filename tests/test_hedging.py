@@ -0,0 +1,79 @@
+"""Hedge delays and backup attempts."""
+from collections import deque
+from utils.hedging import HedgePolicy
+import asyncio
+import itertools
+import time
+
+
+def _policy(**overrides) -> HedgePolicy:
+    options = dict(enabled=True, prompt_types=["followup"], min_samples=5, initial_delay=3.0, min_delay=0.01)
+    options.update(overrides)
+    return HedgePolicy(**options)
+
+
+def test_only_enabled_eligible_prompt_types_are_hedged():
+    assert _policy(enabled=False).delay_for("followup") is None
+    assert _policy().delay_for("greeting") is None
+    assert _policy().delay_for("followup") == 3.0
+
+
+def test_delay_interpolates_between_recent_samples():
+    policy = _policy(percentile=95)
+    policy._latency["followup"] = deque([0.1 * n for n in range(1, 11)], maxlen=policy.window)
+
+    # Between the ninth (0.9 s) and tenth (1.0 s) samples rather than a bucket edge
+    assert abs(policy.delay_for("followup") - 0.955) < 1e-9
+
+
+def test_delay_follows_only_the_latest_window():
+    policy = _policy(window=5)
+    policy._latency["followup"] = deque(maxlen=policy.window)
+    policy._latency["followup"].extend([5.0] * 5 + [0.2] * 5)
+
+    assert policy.delay_for("followup") == 0.2
+
+
+def test_slow_primary_is_hedged_and_backup_wins():
+    policy = _policy()
+    attempts = itertools.count()
+
+    def call():
+        if next(attempts) == 0:
+            time.sleep(0.5)
+            return "primary"
+        return "backup"
+
+    result, hedged = policy.run(call, "followup", 0.05, lambda: True)
+
+    assert (result, hedged) == ("backup", True)
+    assert policy.stats()["followup"]["backup_wins"] == 1
+
+
+def test_fast_primary_is_not_hedged():
+    policy = _policy()
+
+    result, hedged = policy.run(lambda: "primary", "followup", 0.5, lambda: True)
+
+    assert (result, hedged) == ("primary", False)
+
+
+def test_async_backup_wins_and_primary_is_cancelled():
+    policy = _policy()
+    attempts = itertools.count()
+    cancelled = []
+
+    async def call():
+        if next(attempts) == 0:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "primary"
+        return "backup"
+
+    result, hedged = asyncio.run(policy.run_async(call, "followup", 0.05, lambda: True))
+
+    assert (result, hedged) == ("backup", True)
+    assert cancelled == [True]
@@ -0,0 +1,75 @@
+"""Intent classification of candidate messages."""
+from config.settings import ConversationState
+from utils.intent import Intent, IntentClassifier, IntentResult, NaiveBayesModel, intent_classifier
+import pytest
+
+
+@pytest.mark.parametrize("text", [
+    "bye", "Bye!", "exit", "no thanks", "ok bye, thanks", "Thank you, goodbye!",
+    "I want to stop", "stop please", "Let's end this interview", "I'd like to quit now",
+])
+def test_bare_goodbyes_exit_on_the_rules(text):
+    assert intent_classifier.classify(text) == IntentResult(Intent.EXIT, 1.0)
+
+
+@pytest.mark.parametrize("text", [
+    "Front end developer", "Front-end engineer", "Senior front end engineer", "End to end testing",
+    "Lead back end developer", "Full stack or front end roles", "Backend engineer",
+    "Let us continue", "Please continue", "Let's go",
+    "I am done with the answer", "I'm done with that question", "Done with my answer",
+])
+def test_exit_keywords_inside_answers_do_not_exit(text):
+    assert intent_classifier.classify(text).intent != Intent.EXIT
+
+
+@pytest.mark.parametrize("text", [
+    "I don't want to continue", "I have to go now", "I have to leave now, sorry", "I'm done here",
+    "I'm done with the interview", "I am done, goodbye",
+])
+def test_longer_exit_requests_exit_when_the_model_agrees(text):
+    assert intent_classifier.classify(text).intent == Intent.EXIT
+
+
+def test_exit_keyword_in_a_longer_message_needs_the_model():
+    rules_only = IntentClassifier(model=None)
+
+    assert rules_only.classify("stop").intent == Intent.EXIT
+    assert rules_only.classify("Senior front end engineer").intent == Intent.ANSWER
+    assert rules_only.classify("End to end testing").intent == Intent.ANSWER
+
+
+def test_questions_and_off_topic_messages():
+    assert intent_classifier.classify("What are the next steps?").intent == Intent.QUESTION
+    assert intent_classifier.classify("Can we stop?").intent == Intent.EXIT
+    assert intent_classifier.classify("").intent == Intent.ANSWER
+
+
+def test_model_round_trips_through_disk(tmp_path):
+    model = NaiveBayesModel.train([("bye now", "exit"), ("I used Python", "answer")])
+    path = tmp_path / "model.json"
+    model.save(str(path))
+
+    loaded = NaiveBayesModel.load(str(path))
+
+    assert loaded.predict("bye") == pytest.approx(model.predict("bye"))
+
+
+def test_position_with_an_exit_keyword_keeps_the_interview_going(make_manager):
+    manager = make_manager(ConversationState.COLLECT_POSITION, full_name="Ada Lovelace")
+
+    reply = manager.process_message("Senior front end engineer")
+
+    assert manager.state == ConversationState.COLLECT_LOCATION
+    assert manager.candidate.desired_positions == ["Senior front end engineer"]
+    assert "Senior front end engineer" in reply
+
+
+def test_finishing_an_answer_keeps_the_interview_going(make_manager):
+    manager = make_manager(ConversationState.TECHNICAL_QA, full_name="Ada Lovelace", years_experience=5,
+                           tech_stack=["Python"])
+    manager.prefetch_enabled = False
+    manager.questions_asked = 1
+
+    manager.process_message("I am done with the answer")
+
+    assert manager.state == ConversationState.TECHNICAL_QA
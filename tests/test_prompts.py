@@ -0,0 +1,22 @@
+"""Every prompt declares the generation profile it is sent with."""
+from config.settings import GENERATION_PROFILES
+import prompts
+import prompts.question_generator as question_generator
+
+
+def _profile_name(prompt_name: str) -> str:
+    base = prompt_name[len("generate_"):] if prompt_name.startswith("generate_") else prompt_name
+    base = base.upper()
+    return (base[:-len("_PROMPT")] if base.endswith("_PROMPT") else base) + "_PROFILE"
+
+
+def test_every_prompt_has_a_profile():
+    names = [name for name in vars(prompts) if name.isupper() and not name.endswith("_PROFILE")
+             and name != "SYSTEM_PROMPT"]
+    names += [name for name in vars(question_generator) if name.startswith("generate_") and name.endswith("_prompt")]
+    # Profiles follow their prompts in the module that defines them
+    modules = {**vars(prompts), **vars(question_generator)}
+
+    missing = [name for name in names if modules.get(_profile_name(name)) not in GENERATION_PROFILES]
+
+    assert names and missing == []
@@ -0,0 +1,79 @@
+"""Question bank draws, persistence and fallback to the model."""
+from config.settings import ConversationState, QUESTION_BANK_PATH
+from utils.question_bank import BANK_FORMAT_VERSION, QuestionBank
+import json
+import os
+import random
+
+
+def _bank() -> QuestionBank:
+    return QuestionBank({
+        "Python": {
+            "beginner": [["basics", f"Python question {n}?"] for n in range(3)],
+            "advanced": [["internals", "How does the GIL work?"]],
+        },
+    })
+
+
+def test_draws_do_not_repeat_within_a_technology_and_level():
+    bank = _bank()
+    asked = set()
+    rng = random.Random(1)
+
+    first = bank.draw("Python", "beginner", 2, asked, rng)
+    second = bank.draw("Python", "beginner", 2, asked, rng)
+
+    questions = [q.question for q in first + second]
+    assert len(questions) == 3 == len(set(questions))
+    assert bank.draw("Python", "beginner", 2, asked, rng) == []
+    assert [q.question for q in bank.draw("Python", "advanced", 2, asked, rng)] == ["How does the GIL work?"]
+
+
+def test_lookup_ignores_case_and_keeps_the_candidates_spelling():
+    drawn = _bank().draw("python", "beginner", 1)
+
+    assert drawn[0].technology == "python"
+    assert drawn[0].topic == "basics"
+    assert _bank().has("PYTHON", "beginner")
+    assert not _bank().has("Rust", "beginner")
+
+
+def test_round_trip_through_a_file(tmp_path):
+    path = str(tmp_path / "bank" / "questions.json")
+    bank = _bank()
+    bank.add("Go", "beginner", [("concurrency", "What is a goroutine?")])
+    bank.save(path)
+
+    loaded = QuestionBank.load(path)
+
+    assert len(loaded) == len(bank) == 5
+    assert [q.question for q in loaded.draw("Go", "beginner", 5)] == ["What is a goroutine?"]
+
+
+def test_missing_corrupt_or_outdated_files_load_an_empty_bank(tmp_path):
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json", encoding="utf-8")
+    outdated = tmp_path / "outdated.json"
+    outdated.write_text(json.dumps({"version": BANK_FORMAT_VERSION + 1, "questions": {}}), encoding="utf-8")
+
+    for path in [str(tmp_path / "missing.json"), str(corrupt), str(outdated), ""]:
+        assert len(QuestionBank.load(path)) == 0
+
+
+def test_default_path_does_not_depend_on_the_working_directory():
+    if "QUESTION_BANK_PATH" not in os.environ:
+        assert os.path.isabs(QUESTION_BANK_PATH)
+
+
+def test_technologies_missing_from_the_bank_are_left_to_the_model(make_manager, monkeypatch):
+    monkeypatch.setattr("utils.conversation_manager.question_bank", _bank())
+    monkeypatch.setattr("utils.conversation_manager.QUESTION_PLAN_ENABLED", False)
+    manager = make_manager(ConversationState.COLLECT_TECH_STACK, years_experience=1,
+                           tech_stack=["Python", "Rust"])
+    manager.max_questions_per_tech = 2
+
+    list(manager._build_question_queue(["Python", "Rust"]))
+
+    assert [(q.technology, q.question is not None) for q in manager.question_queue] == [
+        ("Python", True), ("Python", True), ("Rust", False), ("Rust", False)
+    ]
@@ -0,0 +1,82 @@
+"""Request and token budgets, priority classes and the background reserve."""
+from utils.rate_limiter import Priority, RateLimiter
+import asyncio
+import threading
+import time
+
+
+def test_unconfigured_limiter_lets_everything_through():
+    limiter = RateLimiter()
+
+    assert not limiter.enabled
+    assert limiter.try_acquire(10_000)
+    assert limiter.acquire(10_000) == 0.0
+
+
+def test_request_budget_is_spent_then_refused():
+    limiter = RateLimiter(requests_per_minute=3)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_background_calls_leave_the_reserve_to_interactive_ones():
+    limiter = RateLimiter(requests_per_minute=10, background_reserve=0.2)
+
+    background = [limiter.try_acquire(priority=Priority.BACKGROUND) for _ in range(10)]
+
+    assert background.count(True) == 8
+    assert limiter.try_acquire(priority=Priority.INTERACTIVE)
+    assert limiter.try_acquire(priority=Priority.INTERACTIVE)
+    assert not limiter.try_acquire(priority=Priority.INTERACTIVE)
+
+
+def test_output_tokens_put_the_bucket_into_debt():
+    limiter = RateLimiter(tokens_per_minute=600)
+    limiter.debit(700)
+
+    assert limiter.stats()["tokens_available"] < 0
+    assert not limiter.try_acquire(1)
+
+
+def test_acquire_waits_for_the_bucket_to_refill():
+    limiter = RateLimiter(tokens_per_minute=6000)
+    assert limiter.try_acquire(6000)
+
+    waited = limiter.acquire(10)
+
+    assert 0.05 < waited < 1.0
+    assert limiter.stats()["wait_seconds"][Priority.INTERACTIVE]["count"] == 1
+
+
+def test_interactive_waiter_goes_before_an_earlier_background_one():
+    limiter = RateLimiter(tokens_per_minute=6000, background_reserve=0, poll_interval=0.01)
+    assert limiter.try_acquire(6000)
+    order = []
+
+    def wait_for_turn(priority: str):
+        limiter.acquire(10, priority)
+        order.append(priority)
+
+    background = threading.Thread(target=wait_for_turn, args=(Priority.BACKGROUND,))
+    background.start()
+    while limiter.queue_depth(Priority.BACKGROUND) == 0:
+        time.sleep(0.001)
+    wait_for_turn(Priority.INTERACTIVE)
+    background.join(5)
+
+    assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+
+def test_try_acquire_does_not_jump_the_queue():
+    limiter = RateLimiter(tokens_per_minute=6000, poll_interval=0.01)
+    assert limiter.try_acquire(6000)
+
+    async def scenario():
+        waiter = asyncio.ensure_future(limiter.acquire_async(10))
+        await asyncio.sleep(0.02)
+        jumped = limiter.try_acquire(0)
+        await waiter
+        return jumped
+
+    assert asyncio.run(scenario()) is False
+    assert limiter.queue_depth() == 0
@@ -0,0 +1,140 @@
+"""Error classification, backoff, the retry budget and the circuit breaker."""
+from google.api_core import exceptions as api_exceptions
+from utils.gemini_client import GeminiClient
+from utils.llm_backends import LocalBackend, LocalResponse, LocalStreamResponse
+from utils.metrics import llm_metrics
+from utils.resilience import ErrorClass, CircuitBreaker, RetryBudget, backoff_delay, classify_error
+import time
+
+
+def test_errors_are_classified_by_how_they_should_be_retried():
+    assert classify_error(api_exceptions.TooManyRequests("slow down")) == ErrorClass.RATE_LIMITED
+    assert classify_error(api_exceptions.BadRequest("bad prompt")) == ErrorClass.FATAL
+    assert classify_error(api_exceptions.ServiceUnavailable("try later")) == ErrorClass.RETRYABLE
+    assert classify_error(TimeoutError()) == ErrorClass.RETRYABLE
+
+
+def test_backoff_is_jittered_below_a_capped_exponential(monkeypatch):
+    monkeypatch.setattr("utils.resilience.RETRY_BASE_DELAY_SECONDS", 1.0)
+    monkeypatch.setattr("utils.resilience.RETRY_MAX_DELAY_SECONDS", 5.0)
+
+    for attempt, ceiling in [(0, 1.0), (2, 4.0), (10, 5.0)]:
+        delays = [backoff_delay(attempt) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+
+
+def test_retry_budget_runs_dry_and_is_refilled_by_traffic():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, capacity=2)
+
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.exhausted == 1
+
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+
+
+def test_retry_budget_refills_over_time():
+    budget = RetryBudget(ratio=0, min_per_second=100, capacity=1)
+    assert budget.try_spend()
+    time.sleep(0.02)
+
+    assert budget.try_spend()
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_breaker_lets_one_trial_through_after_the_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_trial_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["opened"] == 2
+
+
+class _BrokenStream(LocalStreamResponse):
+    """Stream that fails after its first chunk."""
+
+    def __iter__(self):
+        yield LocalResponse(self._text[:self._chunk_size])
+        raise api_exceptions.ServiceUnavailable("connection reset")
+
+
+class _BrokenStreamBackend(LocalBackend):
+    def generate_content(self, contents, *, stream=False, **kwargs):
+        text = self.reply_for(str(contents))
+        return _BrokenStream(text, 0, 0, 0, self.chunk_size)
+
+
+def test_interrupted_stream_is_recorded_and_counts_against_the_breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    monkeypatch.setattr("utils.gemini_client.circuit_breaker", breaker)
+    client = GeminiClient(backend=_BrokenStreamBackend(latency_median=0, chunk_size=5))
+    llm_metrics.reset()
+
+    chunks = list(client.generate_content_stream("Tell me about yourself"))
+
+    assert len(chunks) == 1
+    assert llm_metrics.recent[-1].finish_reason == "INTERRUPTED"
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+class _FlakyBackend(LocalBackend):
+    """Backend whose first call fails."""
+
+    def __init__(self):
+        super().__init__(latency_median=0)
+        self.calls = 0
+
+    def generate_content(self, contents, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise api_exceptions.ServiceUnavailable("try later")
+        return super().generate_content(contents, **kwargs)
+
+
+def test_failed_attempts_are_recorded_not_printed(monkeypatch, capsys):
+    monkeypatch.setattr("utils.gemini_client.circuit_breaker", CircuitBreaker())
+    monkeypatch.setattr("utils.gemini_client.retry_budget", RetryBudget())
+    monkeypatch.setattr("utils.gemini_client.backoff_delay", lambda *args: 0)
+    client = GeminiClient(backend=_FlakyBackend())
+    llm_metrics.reset()
+
+    client.generate_content("Tell me about yourself")
+
+    record = llm_metrics.recent[-1]
+    assert (record.retries, record.failed_attempts) == (1, 1)
+    assert record.last_error == "ServiceUnavailable: 503 try later"
+    assert llm_metrics.snapshot()["untyped"]["failed_attempts"] == 1
+    assert capsys.readouterr().out == ""
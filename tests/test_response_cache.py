@@ -0,0 +1,64 @@
+"""Response cache keys, expiry, eviction and the disk tier."""
+from utils.gemini_client import ResponseCache
+import time
+
+
+def test_key_ignores_whitespace_and_case_but_not_config():
+    key = ResponseCache.make_key("Tell me  about\nPython", {"temperature": 0.2})
+
+    assert key == ResponseCache.make_key("tell me about python", {"temperature": 0.2})
+    assert key != ResponseCache.make_key("tell me about python", {"temperature": 0.7})
+    assert key != ResponseCache.make_key("tell me about rust", {"temperature": 0.2})
+
+
+def test_hit_and_miss_are_counted():
+    cache = ResponseCache()
+    cache.set("a", "reply")
+
+    assert cache.get("a") == "reply"
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "size": 1}
+
+
+def test_expired_entries_are_dropped():
+    cache = ResponseCache(ttl_seconds=0.01)
+    cache.set("a", "reply")
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "first")
+    cache.set("b", "second")
+    cache.get("a")
+    cache.set("c", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    ResponseCache(disk_path=path).set("a", "reply")
+
+    restarted = ResponseCache(disk_path=path)
+
+    assert restarted.get("a") == "reply"
+    assert restarted.stats()["disk_hits"] == 1
+    # Promoted to memory, so the next read does not touch the disk
+    assert restarted.get("a") == "reply"
+    assert restarted.stats()["hits"] == 1
+
+
+def test_clear_empties_every_tier(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(disk_path=path)
+    cache.set("a", "reply")
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert ResponseCache(disk_path=path).get("a") is None
@@ -0,0 +1,63 @@
+"""Background scoring of technical answers."""
+from config.settings import ConversationState, PromptType
+from tests.conftest import StubClient
+import json
+
+ANSWERS = [
+    "I would use a generator so the rows are streamed instead of loaded at once.",
+    "Context managers guarantee cleanup through __enter__ and __exit__ even on errors.",
+    "I memoize expensive selectors and split the component tree so renders stay cheap.",
+    "Asyncio runs coroutines on one thread and switches between them at await points.",
+    "Hooks let function components keep state and run effects after rendering.",
+]
+
+
+def _score_sheet(prompt: str) -> str:
+    count = prompt.count("Answer:")
+    return json.dumps({"scores": [{"index": i, "score": 7 + i, "feedback": f"note {i}"} for i in range(count)]})
+
+
+def _interview(make_manager, monkeypatch, client):
+    monkeypatch.setattr("utils.conversation_manager.PREFETCH_ENABLED", False)
+    manager = make_manager(ConversationState.TECHNICAL_QA, client,
+                           full_name="Ada Lovelace", years_experience=5, tech_stack=["Python", "React"])
+    manager.questions_asked = 1
+    manager._last_question, manager._last_question_tech = "Tell me about generators.", "Python"
+    return manager
+
+
+def test_answers_are_filed_under_the_technology_they_were_asked_about(make_manager, monkeypatch):
+    manager = _interview(make_manager, monkeypatch, StubClient())
+
+    for answer in ANSWERS:
+        manager.process_message(answer)
+
+    assert [answer.technology for answer in manager.candidate.scored_answers] == \
+        ["Python", "Python", "React", "Python", "React"]
+    assert manager.candidate.technical_responses == {
+        "Python": [ANSWERS[0], ANSWERS[1], ANSWERS[3]], "React": [ANSWERS[2], ANSWERS[4]]
+    }
+
+
+def test_scores_land_on_their_answers_in_batches(make_manager, monkeypatch):
+    client = StubClient(replies={PromptType.ANSWER_SCORING: _score_sheet})
+    manager = _interview(make_manager, monkeypatch, client)
+
+    for answer in ANSWERS:
+        manager.process_message(answer)
+    assert manager.state == ConversationState.WRAP_UP
+
+    assert manager.wait_for_scores(timeout=5)
+    assert [answer.score for answer in manager.candidate.scored_answers] == [7, 8, 9, 7, 8]
+    assert client.types_called().count(PromptType.ANSWER_SCORING) == 2
+
+
+def test_failed_scoring_leaves_answers_unscored(make_manager, monkeypatch):
+    client = StubClient(replies={PromptType.ANSWER_SCORING: ""})
+    manager = _interview(make_manager, monkeypatch, client)
+
+    for answer in ANSWERS:
+        manager.process_message(answer)
+
+    assert manager.wait_for_scores(timeout=5)
+    assert all(answer.score is None for answer in manager.candidate.scored_answers)
@@ -0,0 +1,71 @@
+"""Interview checkpoints in the session store."""
+from concurrent.futures import Future
+from config.settings import ConversationState
+from utils.session_store import SessionStore
+from tests.conftest import StubClient
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path) -> SessionStore:
+    return SessionStore(str(tmp_path / "sessions.db"), ttl_seconds=60)
+
+
+def _manager(make_manager):
+    return make_manager(ConversationState.COLLECT_EMAIL, full_name="Ada Lovelace")
+
+
+def test_checkpoint_restores_state_and_transcript(store, make_manager):
+    manager = _manager(make_manager)
+    manager.add_to_history("assistant", "Could you please provide your email address?")
+    messages = [{"role": "assistant", "content": "Hi! What's your name?"}, {"role": "user", "content": "Ada"}]
+    store.save("token", manager, messages)
+
+    restored, restored_messages = store.load("token", StubClient())
+
+    assert restored.state == ConversationState.COLLECT_EMAIL
+    assert restored.candidate.full_name == "Ada Lovelace"
+    assert restored.conversation_history == manager.conversation_history
+    assert restored_messages == messages
+
+
+def test_missing_expired_and_deleted_sessions_are_not_restored(store, make_manager):
+    store.save("token", _manager(make_manager))
+
+    assert store.load("other", StubClient()) is None
+
+    store.ttl_seconds = -1
+    assert store.load("token", StubClient()) is None
+    assert store.prune() == 1
+
+    store.ttl_seconds = 60
+    store.save("token", _manager(make_manager))
+    store.delete("token")
+    assert store.load("token", StubClient()) is None
+
+
+def test_finished_prefetch_is_added_to_its_checkpoint(store, make_manager):
+    manager = make_manager(ConversationState.TECHNICAL_QA, tech_stack=["Python"])
+    manager._prefetch, manager._prefetch_tech = Future(), "Python"
+    store.save("token", manager)
+
+    manager._prefetch.set_result("What does the GIL protect?")
+
+    restored, _ = store.load("token", StubClient())
+    assert restored.to_dict()["prefetched"] == ["Python", "What does the GIL protect?"]
+
+
+def test_newer_checkpoint_wins_over_a_late_prefetch(store, make_manager):
+    manager = make_manager(ConversationState.TECHNICAL_QA, tech_stack=["Python"])
+    prefetch = Future()
+    manager._prefetch, manager._prefetch_tech = prefetch, "Python"
+    store.save("token", manager)
+    manager._prefetch = None
+    manager.questions_asked = 2
+    store.save("token", manager)
+
+    prefetch.set_result("A stale question")
+
+    restored, _ = store.load("token", StubClient())
+    assert restored.questions_asked == 2
+    assert restored.to_dict()["prefetched"] is None
@@ -0,0 +1,74 @@
+"""Coalescing of identical requests in flight."""
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import PromptType
+from utils.gemini_client import GeminiClient, ResponseCache, SingleFlight
+from utils.llm_backends import LocalBackend
+import threading
+import time
+
+
+def test_first_caller_leads_and_later_callers_share_its_result():
+    flights = SingleFlight()
+    future, leader = flights.join("key")
+    joined, joined_leader = flights.join("key")
+
+    assert leader and not joined_leader
+    assert joined is future
+    assert flights.stats() == {"in_flight": 1, "coalesced": 1}
+
+    flights.finish("key", future, "reply")
+
+    assert joined.result() == "reply"
+    assert flights.stats()["in_flight"] == 0
+
+
+def test_a_finished_key_starts_a_new_flight():
+    flights = SingleFlight()
+    future, _ = flights.join("key")
+    flights.finish("key", future, "reply")
+
+    _, leader = flights.join("key")
+
+    assert leader
+
+
+def test_other_keys_fly_separately():
+    flights = SingleFlight()
+    first, _ = flights.join("a")
+    second, leader = flights.join("b")
+
+    assert leader and second is not first
+
+
+class _CountingBackend(LocalBackend):
+    """Backend that holds every call until released and counts them."""
+
+    def __init__(self):
+        super().__init__(latency_median=0)
+        self.calls = 0
+        self.release = threading.Event()
+
+    def generate_content(self, contents, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        return super().generate_content(contents, **kwargs)
+
+
+def test_identical_cacheable_calls_reach_the_model_once(monkeypatch):
+    flights = SingleFlight()
+    monkeypatch.setattr("utils.gemini_client.single_flight", flights)
+    backend = _CountingBackend()
+    client = GeminiClient(cache=ResponseCache(), backend=backend)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(client.generate_content, "Greet the candidate", prompt_type=PromptType.GREETING)
+                   for _ in range(4)]
+        # Let every caller join before the leader's call returns
+        deadline = time.monotonic() + 5
+        while flights.coalesced < len(futures) - 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        backend.release.set()
+        replies = [future.result() for future in futures]
+
+    assert backend.calls == 1
+    assert len(set(replies)) == 1
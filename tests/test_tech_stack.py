@@ -0,0 +1,52 @@
+"""Normalization of tech stack entries."""
+from utils.tech_stack import MatchMethod, TechStackNormalizer, bounded_edit_distance, tech_normalizer
+import pytest
+
+
+@pytest.mark.parametrize("text, canonical, method", [
+    ("python", "Python", MatchMethod.EXACT),
+    ("nodejs", "Node.js", MatchMethod.EXACT),
+    ("python 3.11", "Python", MatchMethod.VERSION),
+    ("Vue3", "Vue", MatchMethod.VERSION),
+    ("kubern", "Kubernetes", MatchMethod.PREFIX),
+    ("pyhton", "Python", MatchMethod.FUZZY),
+    ("Raect", "React", MatchMethod.FUZZY),
+    ("Kubernets", "Kubernetes", MatchMethod.FUZZY),
+    ("Typescirpt", "TypeScript", MatchMethod.FUZZY),
+])
+def test_spellings_resolve_to_canonical_names(text, canonical, method):
+    match = tech_normalizer.normalize(text)
+
+    assert (match.canonical, match.method) == (canonical, method)
+
+
+@pytest.mark.parametrize("text", ["NestJS", "MSSQL", "MS SQL", "Jython", "Cython", "Preact"])
+def test_distinct_technologies_near_a_known_name_stay_verbatim(text):
+    match = tech_normalizer.normalize(text)
+
+    assert (match.canonical, match.method) == (text, MatchMethod.UNKNOWN)
+
+
+def test_stack_keeps_neighbouring_technologies_apart():
+    stack = tech_normalizer.normalize_stack(["React", "Preact", "NestJS", "Next.js", "MySQL", "MSSQL"])
+
+    assert [match.canonical for match in stack] == ["React", "Preact", "NestJS", "Next.js", "MySQL", "MSSQL"]
+
+
+def test_stack_drops_repeated_technologies():
+    stack = tech_normalizer.normalize_stack(["python3", "Python", "py", "  Rust  "])
+
+    assert [match.canonical for match in stack] == ["Python", "Rust"]
+
+
+def test_aliases_can_be_added():
+    normalizer = TechStackNormalizer(technologies=["PostgreSQL"], aliases={})
+    normalizer.add_alias("PostgreSQL", "pg")
+
+    assert normalizer.normalize("PG").canonical == "PostgreSQL"
+
+
+def test_bounded_edit_distance_counts_transpositions_and_gives_up_past_the_limit():
+    assert bounded_edit_distance("pyhton", "python", 1) == 1
+    assert bounded_edit_distance("kubernets", "kubernetes", 1) == 1
+    assert bounded_edit_distance("angular", "vue", 2) is None
@@ -0,0 +1,388 @@
+"""HTTP and WebSocket API for interview sessions, independent of Streamlit.
+
+Start the server with:
+
+    python -m utils.api_server --port 8000
+
+Endpoints:
+
+    POST   /sessions                     start an interview; returns the greeting
+    GET    /sessions/{token}             state, candidate details and transcript
+    POST   /sessions/{token}/messages    send {"message": ...}; returns the reply
+    DELETE /sessions/{token}             end and forget the session
+    WS     /sessions/{token}/stream      send {"message": ...}; reply arrives in chunks
+    GET    /health                       liveness and session count
+
+Sessions live in memory and are checkpointed to the session store after
+every turn, so a restarted server resumes them on first use.
+"""
+from typing import List, Dict, Optional, Callable, Any
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import (
+    API_HOST,
+    API_PORT,
+    API_ALLOWED_ORIGINS,
+    API_SESSION_IDLE_SECONDS,
+    API_MAX_MESSAGE_CHARS,
+    API_STREAM_WORKERS,
+    ConversationState,
+)
+from utils.conversation_manager import ConversationManager
+from utils.gemini_client import GeminiClient, warm_up
+from utils.session_store import SessionStore, session_store
+import argparse
+import asyncio
+import json
+import time
+import tornado.ioloop
+import tornado.web
+import tornado.websocket
+
+# Runs the blocking, streamed turns that feed WebSocket clients
+_stream_executor = ThreadPoolExecutor(max_workers=API_STREAM_WORKERS, thread_name_prefix="api-stream")
+
+
+class TurnRejectedError(Exception):
+    """Raised when a session cannot take a message: it has ended or is still answering the previous one."""
+    pass
+
+
+class InterviewSession:
+    """One interview: its manager, the transcript shown to the candidate and a turn lock."""
+
+    def __init__(self, token: str, manager: ConversationManager, messages: Optional[List[Dict[str, str]]] = None):
+        self.token = token
+        self.manager = manager
+        self.messages: List[Dict[str, str]] = messages or []
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    def summary(self) -> Dict[str, Any]:
+        """Where the interview stands."""
+        return {
+            "session": self.token,
+            "state": self.manager.state,
+            "state_description": self.manager.get_state_description(),
+            "completion": self.manager.candidate.get_completion_percentage(),
+            "ended": self.manager.state == ConversationState.ENDED,
+        }
+
+    def details(self) -> Dict[str, Any]:
+        """The summary plus candidate details and transcript."""
+        return {**self.summary(), "candidate": self.manager.candidate.to_dict(), "messages": self.messages}
+
+    async def reply(self, message: str) -> str:
+        """Run one turn without streaming."""
+        reply = await self.manager.process_message_async(message)
+        self._record(message, reply)
+        return reply
+
+    async def stream_reply(self, message: str, on_chunk: Callable[[str], None]) -> str:
+        """
+        Run one turn, passing each chunk of the reply to ``on_chunk`` as it is generated.
+
+        The turn always runs to the end, even if the client goes away, so the
+        manager's state stays consistent.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = self.manager.process_message_stream(message)
+        parts = []
+        while True:
+            chunk = await loop.run_in_executor(_stream_executor, next, chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            on_chunk(chunk)
+        reply = "".join(parts)
+        self._record(message, reply)
+        return reply
+
+    def _record(self, message: str, reply: str):
+        """Append a turn to the transcript and mark the session as used."""
+        if message:
+            self.messages.append({"role": "user", "content": message})
+        self.messages.append({"role": "assistant", "content": reply})
+        self.last_used = time.monotonic()
+
+
+class SessionRegistry:
+    """
+    The sessions this process is serving.
+
+    Sessions not in memory are restored from their last checkpoint, and
+    sessions idle for longer than ``idle_seconds`` are dropped from memory
+    (their checkpoints remain). Behind a load balancer, requests for one
+    token must reach the same instance while it holds the session.
+    """
+
+    def __init__(self, store: Optional[SessionStore] = None, idle_seconds: float = 1800,
+                 client_factory: Callable[[], GeminiClient] = GeminiClient):
+        """
+        Initialize the registry.
+
+        Args:
+            store: Checkpoint store; None keeps sessions in memory only
+            idle_seconds: Time without a turn after which a session leaves memory
+            client_factory: Builds the client for each session
+        """
+        self.store = store
+        self.idle_seconds = idle_seconds
+        self.client_factory = client_factory
+        self._sessions: Dict[str, InterviewSession] = {}
+
+    def __len__(self) -> int:
+        """Number of sessions held in memory."""
+        return len(self._sessions)
+
+    async def create(self) -> InterviewSession:
+        """Start an interview and run its greeting."""
+        session = InterviewSession(SessionStore.new_token(), ConversationManager(self.client_factory()))
+        self._sessions[session.token] = session
+        async with session.lock:
+            await session.reply("")
+            await self.checkpoint(session)
+        return session
+
+    async def get(self, token: str) -> Optional[InterviewSession]:
+        """Return a session from memory or its checkpoint, or None if there is neither."""
+        session = self._sessions.get(token)
+        if session is not None or self.store is None:
+            return session
+        loop = asyncio.get_running_loop()
+        restored = await loop.run_in_executor(None, self.store.load, token, self.client_factory())
+        if restored is None:
+            return None
+        # Another request may have restored it while the checkpoint was loading
+        return self._sessions.setdefault(token, InterviewSession(token, *restored))
+
+    async def checkpoint(self, session: InterviewSession):
+        """Write the session's checkpoint off the event loop."""
+        if self.store is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.store.save, session.token, session.manager, session.messages)
+
+    async def delete(self, token: str):
+        """Forget a session and its checkpoint."""
+        self._sessions.pop(token, None)
+        if self.store is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.store.delete, token)
+
+    def evict_idle(self) -> int:
+        """Drop idle sessions from memory, returning how many were dropped."""
+        cutoff = time.monotonic() - self.idle_seconds
+        idle = [token for token, session in self._sessions.items()
+                if session.last_used < cutoff and not session.lock.locked()]
+        for token in idle:
+            del self._sessions[token]
+        return len(idle)
+
+
+class _JSONHandler(tornado.web.RequestHandler):
+    """Base handler that speaks JSON, including for errors."""
+
+    def initialize(self, registry: SessionRegistry):
+        """Receive the registry passed in the route's keyword arguments."""
+        self.registry = registry
+
+    def set_default_headers(self):
+        """Send JSON, with CORS headers for allowed origins."""
+        self.set_header("Content-Type", "application/json")
+        origin = self.request.headers.get("Origin")
+        if origin and ("*" in API_ALLOWED_ORIGINS or origin in API_ALLOWED_ORIGINS):
+            self.set_header("Access-Control-Allow-Origin", origin)
+            self.set_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
+            self.set_header("Access-Control-Allow-Headers", "Content-Type")
+            self.set_header("Vary", "Origin")
+
+    def options(self, *args):
+        """Answer CORS preflight requests."""
+        self.set_status(204)
+        self.finish()
+
+    def write_error(self, status_code: int, **kwargs):
+        """Report errors as ``{"error": reason}``."""
+        self.finish({"error": self._reason})
+
+    async def session_or_404(self, token: str) -> InterviewSession:
+        """Return the session for ``token``, or fail the request with 404."""
+        session = await self.registry.get(token)
+        if session is None:
+            raise tornado.web.HTTPError(404, reason="Unknown or expired session")
+        return session
+
+    def message_from_body(self) -> str:
+        """Return the candidate message in the JSON body, or fail the request with 400."""
+        try:
+            body = json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise tornado.web.HTTPError(400, reason="Body must be JSON")
+        try:
+            return _validate_message(body)
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, reason=str(e))
+
+
+def _validate_message(body: Any) -> str:
+    """Return the candidate message in a request body, or raise ValueError."""
+    message = body.get("message") if isinstance(body, dict) else None
+    if not isinstance(message, str) or not message.strip():
+        raise ValueError('Expected a non-empty "message" string')
+    if len(message) > API_MAX_MESSAGE_CHARS:
+        raise ValueError(f"Messages are limited to {API_MAX_MESSAGE_CHARS} characters")
+    return message
+
+
+async def _checked_turn(registry: SessionRegistry, session: InterviewSession, run: Callable) -> str:
+    """Run a turn under the session lock and checkpoint it."""
+    if session.manager.state == ConversationState.ENDED:
+        raise TurnRejectedError("The interview has ended")
+    if session.lock.locked():
+        raise TurnRejectedError("The previous message is still being answered")
+    async with session.lock:
+        reply = await run()
+        await registry.checkpoint(session)
+    return reply
+
+
+class SessionsHandler(_JSONHandler):
+    """Starts interviews."""
+
+    async def post(self):
+        """Start an interview and return its greeting."""
+        session = await self.registry.create()
+        self.set_status(201)
+        self.finish({**session.summary(), "reply": session.messages[-1]["content"]})
+
+
+class SessionHandler(_JSONHandler):
+    """Reads and deletes one interview."""
+
+    async def get(self, token: str):
+        """Return the session's state, candidate details and transcript."""
+        session = await self.session_or_404(token)
+        self.finish(session.details())
+
+    async def delete(self, token: str):
+        """End and forget the session; unknown tokens are not an error."""
+        await self.registry.delete(token)
+        self.set_status(204)
+        self.finish()
+
+
+class MessagesHandler(_JSONHandler):
+    """Answers candidate messages in one response."""
+
+    async def post(self, token: str):
+        """Run one turn and return the reply, or 409 if the session cannot take it."""
+        session = await self.session_or_404(token)
+        message = self.message_from_body()
+        try:
+            reply = await _checked_turn(self.registry, session, lambda: session.reply(message))
+        except TurnRejectedError as e:
+            raise tornado.web.HTTPError(409, reason=str(e))
+        self.finish({**session.summary(), "reply": reply})
+
+
+class StreamHandler(tornado.websocket.WebSocketHandler):
+    """
+    Streams replies over a WebSocket.
+
+    Each ``{"message": ...}`` frame is answered with ``{"type": "chunk"}``
+    frames as the reply is generated, then one ``{"type": "done"}`` frame
+    carrying the full reply and the session summary. Problems are reported
+    as ``{"type": "error"}`` frames; the connection stays open.
+    """
+
+    def initialize(self, registry: SessionRegistry):
+        """Receive the registry passed in the route's keyword arguments."""
+        self.registry = registry
+        self.session: Optional[InterviewSession] = None
+
+    def check_origin(self, origin: str) -> bool:
+        """Accept configured origins as well as same-origin connections."""
+        if "*" in API_ALLOWED_ORIGINS or origin in API_ALLOWED_ORIGINS:
+            return True
+        return super().check_origin(origin)
+
+    async def open(self, token: str):
+        """Attach the connection to its session, closing it with 4404 if there is none."""
+        self.session = await self.registry.get(token)
+        if self.session is None:
+            self.close(4404, "Unknown or expired session")
+
+    async def on_message(self, data: str):
+        """Stream the reply to one ``{"message": ...}`` frame."""
+        if self.session is None:
+            return
+        try:
+            message = _validate_message(json.loads(data))
+        except ValueError as e:
+            self._send({"type": "error", "error": str(e)})
+            return
+        session = self.session
+
+        def send_chunk(chunk: str):
+            self._send({"type": "chunk", "text": chunk})
+
+        try:
+            reply = await _checked_turn(self.registry, session, lambda: session.stream_reply(message, send_chunk))
+        except TurnRejectedError as e:
+            self._send({"type": "error", "error": str(e)})
+            return
+        self._send({"type": "done", "reply": reply, **session.summary()})
+
+    def _send(self, frame: Dict[str, Any]):
+        """Send a frame unless the client has gone away."""
+        if self.ws_connection is None or self.ws_connection.is_closing():
+            return
+        self.write_message(json.dumps(frame))
+
+
+class HealthHandler(_JSONHandler):
+    """Liveness probe for load balancers."""
+
+    def get(self):
+        """Report that the server is up and how many sessions it holds."""
+        self.finish({"status": "ok", "sessions": len(self.registry)})
+
+
+def make_app(registry: Optional[SessionRegistry] = None) -> tornado.web.Application:
+    """Build the API application around ``registry`` (a new one on the shared session store by default)."""
+    # An empty registry is falsy, so test for None explicitly
+    if registry is None:
+        registry = SessionRegistry(session_store, API_SESSION_IDLE_SECONDS)
+    routes = [
+        (r"/health", HealthHandler),
+        (r"/sessions", SessionsHandler),
+        (r"/sessions/([\w-]+)", SessionHandler),
+        (r"/sessions/([\w-]+)/messages", MessagesHandler),
+        (r"/sessions/([\w-]+)/stream", StreamHandler),
+    ]
+    app = tornado.web.Application([(pattern, handler, {"registry": registry}) for pattern, handler in routes])
+    app.registry = registry
+    return app
+
+
+async def serve(host: str = API_HOST, port: int = API_PORT):
+    """Run the API server until the process is stopped."""
+    warm_up()
+    app = make_app()
+    app.listen(port, address=host)
+    # Check for idle sessions once a minute
+    tornado.ioloop.PeriodicCallback(app.registry.evict_idle, 60_000).start()
+    print(f"Interview API listening on http://{host}:{port}")
+    await asyncio.Event().wait()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for the API server."""
+    parser = argparse.ArgumentParser(description="Serve interview sessions over HTTP and WebSocket.")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,577 @@
+"""Micro-benchmarks for the per-turn hot path, with stored baselines.
+
+No baseline is committed, since timings only compare on the machine and
+Python version that recorded them. Record one first, then compare later
+runs against it:
+
+    python -m utils.benchmark --save-baseline
+    python -m utils.benchmark
+
+A benchmark whose best time per call grows by more than
+``BENCHMARK_REGRESSION_THRESHOLD`` over the baseline is flagged as a
+regression, and the run exits with status 1. Without a baseline every
+benchmark is reported as new.
+"""
+from typing import List, Dict, Optional, Callable, Tuple, Any
+from dataclasses import dataclass, asdict
+from config.settings import BENCHMARK_BASELINE_PATH, BENCHMARK_REGRESSION_THRESHOLD, ConversationState
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark, per call."""
+    name: str
+    group: str
+    loops: int
+    median_ns: float
+    min_ns: float
+    stdev_ns: float
+
+
+@dataclass
+class Comparison:
+    """A result set against its baseline."""
+    name: str
+    current_ns: float
+    baseline_ns: Optional[float]
+    ratio: Optional[float]
+    status: str
+
+
+class ComparisonStatus:
+    """Enum for how a result compares to its baseline."""
+    OK = "ok"
+    REGRESSION = "regression"
+    IMPROVED = "improved"
+    NEW = "new"
+
+
+# name -> (group, factory); a factory does its setup and returns the call to time
+_REGISTRY: Dict[str, Tuple[str, Callable[[], Callable[[], Any]]]] = {}
+
+
+def benchmark(name: str, group: str):
+    """Register a benchmark factory under ``name``."""
+    def register(factory: Callable[[], Callable[[], Any]]):
+        _REGISTRY[name] = (group, factory)
+        return factory
+    return register
+
+
+# Shared fixtures
+
+_ANSWER = (
+    "In our payments service I used asyncio with a bounded semaphore so bursts of webhook calls could not "
+    "exhaust the connection pool. Each handler validated the payload with pydantic, wrote to PostgreSQL in "
+    "one transaction and published an event, and retries were idempotent because every request carried a "
+    "key we stored with the row. The hardest part was testing partial failures, which we did by injecting "
+    "faults at the database and broker boundaries."
+)
+_QUESTION = "How would you keep a Python service responsive when a downstream dependency slows down?"
+_TECH_STACK = ["Python", "React", "PostgreSQL", "Docker"]
+
+
+class _StubClient:
+    """Client that answers instantly with the local backend's canned replies."""
+
+    def __init__(self):
+        from utils.llm_backends import LocalBackend
+
+        self._backend = LocalBackend(latency_median=0)
+
+    def generate_content(self, prompt: str, **kwargs) -> str:
+        return self._backend.reply_for(prompt)
+
+    async def generate_content_async(self, prompt: str, **kwargs) -> str:
+        return self._backend.reply_for(prompt)
+
+    def generate_content_stream(self, prompt: str, **kwargs):
+        yield self._backend.reply_for(prompt)
+
+
+def _manager(state: str = ConversationState.GREETING, **candidate):
+    """
+    A manager on the stub client, in ``state`` with the given candidate fields.
+
+    Prefetch and background scoring are off, so timed loops measure only the
+    turn itself rather than also queueing work on other threads.
+    """
+    from utils.conversation_manager import ConversationManager
+
+    manager = ConversationManager(_StubClient())
+    manager.prefetch_enabled = False
+    manager.scoring_enabled = False
+    manager.state = state
+    for field_name, value in candidate.items():
+        setattr(manager.candidate, field_name, value)
+    return manager
+
+
+def _drain(manager, steps):
+    """Run a handler's steps to the end, fulfilling model calls with blocking client calls."""
+    from utils.conversation_manager import LLMRequest
+
+    if isinstance(steps, str):
+        return steps
+    reply = None
+    while True:
+        try:
+            step = steps.send(reply)
+        except StopIteration:
+            return
+        reply = manager._call_client(step) if isinstance(step, LLMRequest) else None
+
+
+def _interviewing_manager():
+    return _manager(
+        ConversationState.TECHNICAL_QA, full_name="Priya Sharma", years_experience=6, tech_stack=list(_TECH_STACK)
+    )
+
+
+# ConversationManager handlers, one message each, on a stubbed client
+
+@benchmark("handlers.greeting", "handlers")
+def _bench_greeting():
+    manager = _manager()
+    return lambda: _drain(manager, manager._handle_greeting())
+
+
+@benchmark("handlers.name", "handlers")
+def _bench_name():
+    manager = _manager(ConversationState.COLLECT_NAME)
+    return lambda: manager._handle_name_collection("Priya Sharma")
+
+
+@benchmark("handlers.email", "handlers")
+def _bench_email():
+    manager = _manager(ConversationState.COLLECT_EMAIL)
+    return lambda: manager._handle_email_collection("priya.sharma@example.com")
+
+
+@benchmark("handlers.phone", "handlers")
+def _bench_phone():
+    manager = _manager(ConversationState.COLLECT_PHONE)
+    return lambda: manager._handle_phone_collection("+14155552671")
+
+
+@benchmark("handlers.experience", "handlers")
+def _bench_experience():
+    manager = _manager(ConversationState.COLLECT_EXPERIENCE)
+    return lambda: manager._handle_experience_collection("about 6 years")
+
+
+@benchmark("handlers.position", "handlers")
+def _bench_position():
+    manager = _manager(ConversationState.COLLECT_POSITION)
+    return lambda: manager._handle_position_collection("Backend Engineer, Platform Engineer")
+
+
+@benchmark("handlers.location", "handlers")
+def _bench_location():
+    manager = _manager(ConversationState.COLLECT_LOCATION)
+    return lambda: manager._handle_location_collection("Berlin, Germany")
+
+
+@benchmark("handlers.multi_field", "handlers")
+def _bench_multi_field():
+    from models import CandidateInfo
+
+    manager = _manager(ConversationState.COLLECT_NAME)
+    message = ("Hi, I'm Priya Sharma, priya.sharma@example.com, +14155552671, 6 years of experience, "
+               "applying for Backend Engineer, based in Berlin")
+
+    def run():
+        manager.candidate = CandidateInfo()
+        return _drain(manager, manager._handle_multi_field(message, manager._extract_intake_fields(message)))
+    return run
+
+
+@benchmark("handlers.tech_stack", "handlers")
+def _bench_tech_stack():
+    manager = _manager(ConversationState.COLLECT_TECH_STACK, full_name="Priya Sharma", years_experience=6)
+    return lambda: _drain(manager, manager._handle_tech_stack_collection("python3, React, postgres, Docker"))
+
+
+@benchmark("handlers.technical_qa", "handlers")
+def _bench_technical_qa():
+    manager = _interviewing_manager()
+
+    def run():
+        manager.questions_asked = 0
+        manager.current_tech_index = 0
+        manager.candidate.technical_responses.clear()
+        manager.candidate.scored_answers.clear()
+        return _drain(manager, manager._handle_technical_qa(_ANSWER))
+    return run
+
+
+@benchmark("handlers.wrap_up_question", "handlers")
+def _bench_wrap_up_question():
+    manager = _manager(ConversationState.WRAP_UP, full_name="Priya Sharma")
+    return lambda: _drain(manager, manager._handle_wrap_up("What are the next steps in the hiring process?"))
+
+
+@benchmark("handlers.off_topic", "handlers")
+def _bench_off_topic():
+    manager = _interviewing_manager()
+    return lambda: manager._handle_off_topic("What's the weather like in Berlin today?")
+
+
+@benchmark("handlers.exit", "handlers")
+def _bench_exit():
+    manager = _interviewing_manager()
+    return lambda: _drain(manager, manager._handle_exit("I have to go now, goodbye"))
+
+
+@benchmark("turn.technical_qa_answer", "turn")
+def _bench_turn():
+    manager = _interviewing_manager()
+
+    def run():
+        manager.state = ConversationState.TECHNICAL_QA
+        manager.questions_asked = 0
+        manager.current_tech_index = 0
+        manager.candidate.technical_responses.clear()
+        manager.candidate.scored_answers.clear()
+        return manager.process_message(_ANSWER)
+    return run
+
+
+# CandidateInfo validation
+
+@benchmark("models.phone_valid", "models")
+def _bench_phone_valid():
+    from models import CandidateInfo
+
+    return lambda: CandidateInfo(phone="+14155552671")
+
+
+@benchmark("models.phone_national", "models")
+def _bench_phone_national():
+    from models import CandidateInfo
+
+    # No country code, so parsing fails and the plain-digits check decides
+    return lambda: CandidateInfo(phone="(415) 555-2671")
+
+
+@benchmark("models.email", "models")
+def _bench_email_validation():
+    from models import CandidateInfo
+
+    return lambda: CandidateInfo(email="priya.sharma@example.com")
+
+
+@benchmark("models.full_record", "models")
+def _bench_full_record():
+    from models import CandidateInfo
+
+    record = {
+        "full_name": "Priya Sharma", "email": "priya.sharma@example.com", "phone": "+14155552671",
+        "years_experience": 6, "desired_positions": ["Backend Engineer"], "current_location": "Berlin, Germany",
+        "tech_stack": list(_TECH_STACK),
+    }
+    return lambda: CandidateInfo.model_validate(record)
+
+
+# Prompt builders
+
+@benchmark("prompts.technical_questions", "prompts")
+def _bench_technical_questions_prompt():
+    from prompts.question_generator import generate_technical_questions_prompt
+
+    return lambda: generate_technical_questions_prompt(_TECH_STACK, 6)
+
+
+@benchmark("prompts.question_plan", "prompts")
+def _bench_question_plan_prompt():
+    from prompts.question_generator import generate_question_plan_prompt
+
+    return lambda: generate_question_plan_prompt(_TECH_STACK, 6, 3)
+
+
+@benchmark("prompts.followup", "prompts")
+def _bench_followup_prompt():
+    from prompts.question_generator import generate_followup_question_prompt
+    from utils.context import ContextWindow
+
+    context = ContextWindow()
+    for _ in range(10):
+        context.add("assistant", _QUESTION)
+        context.add("user", _ANSWER)
+    rendered = context.render(skip_latest=1)
+    return lambda: generate_followup_question_prompt("Python", _ANSWER, 6, rendered)
+
+
+@benchmark("prompts.next_question", "prompts")
+def _bench_next_question_prompt():
+    from prompts.question_generator import generate_next_question_prompt
+
+    return lambda: generate_next_question_prompt("Python", 6, _QUESTION)
+
+
+@benchmark("prompts.answer_scoring", "prompts")
+def _bench_answer_scoring_prompt():
+    from prompts.question_generator import generate_answer_scoring_prompt
+
+    answers = [(tech, _QUESTION, _ANSWER) for tech in _TECH_STACK[:3]]
+    return lambda: generate_answer_scoring_prompt(answers, 6)
+
+
+# Response parsing
+
+class _MultiPartResponse:
+    """Response whose ``text`` raises, as Gemini's does when there are several parts."""
+
+    def __init__(self, parts: List[str]):
+        from utils.llm_backends import _Candidate, FinishReason, _Part
+
+        self.candidates = [_Candidate("", FinishReason.STOP)]
+        self.candidates[0].content.parts = [_Part(text) for text in parts]
+
+    @property
+    def text(self):
+        raise ValueError("The `response.text` quick accessor only works for simple (single-`Part`) text responses.")
+
+
+@benchmark("client.extract_text_multi_part", "client")
+def _bench_extract_multi_part():
+    from utils.gemini_client import GeminiClient
+    from utils.llm_backends import LocalBackend
+
+    client = GeminiClient(backend=LocalBackend(latency_median=0))
+    response = _MultiPartResponse([f"Part {index} of a longer answer. " * 4 for index in range(8)])
+    return lambda: client._extract_text_from_response(response)
+
+
+@benchmark("client.extract_text_simple", "client")
+def _bench_extract_simple():
+    from utils.gemini_client import GeminiClient
+    from utils.llm_backends import LocalBackend, LocalResponse
+
+    client = GeminiClient(backend=LocalBackend(latency_median=0))
+    response = LocalResponse(_QUESTION)
+    return lambda: client._extract_text_from_response(response)
+
+
+# UI HTML builders
+
+_STAGES = [
+    "Initial Greeting", "Collecting Name", "Collecting Email", "Collecting Phone", "Collecting Experience",
+    "Collecting Position", "Collecting Location", "Collecting Tech Stack", "Technical Assessment",
+    "Wrapping Up", "Conversation Ended",
+]
+
+
+@benchmark("ui.progress_ring", "ui")
+def _bench_progress_ring():
+    from utils.ui_components import progress_ring_html
+
+    return lambda: progress_ring_html(57, "Complete")
+
+
+@benchmark("ui.stage_timeline", "ui")
+def _bench_stage_timeline():
+    from utils.ui_components import stage_timeline_html
+
+    return lambda: stage_timeline_html("Technical Assessment", _STAGES)
+
+
+@benchmark("ui.info_tooltip", "ui")
+def _bench_info_tooltip():
+    from utils.ui_components import info_tooltip_html
+
+    return lambda: info_tooltip_html("Completion", "Share of the required details collected so far")
+
+
+# Running and comparing
+
+def measure(name: str, call: Callable[[], Any], group: str = "", min_time: float = 0.2,
+            repeats: int = 5) -> BenchmarkResult:
+    """
+    Time a call.
+
+    The number of calls per repeat is chosen so one repeat takes at least
+    ``min_time`` seconds; per-call times are summarized across repeats.
+
+    Args:
+        name: Benchmark name
+        call: Zero-argument callable to time
+        group: Benchmark group
+        min_time: Shortest duration of one repeat in seconds
+        repeats: Number of repeats
+
+    Returns:
+        Per-call timing
+    """
+    timer = timeit.Timer(call)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_time:
+            break
+        loops *= 2
+    per_call = [total / loops * 1e9 for total in timer.repeat(repeat=repeats, number=loops)]
+    return BenchmarkResult(
+        name=name,
+        group=group,
+        loops=loops,
+        median_ns=statistics.median(per_call),
+        min_ns=min(per_call),
+        stdev_ns=statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    )
+
+
+def run_benchmarks(pattern: str = "", min_time: float = 0.2, repeats: int = 5) -> List[BenchmarkResult]:
+    """
+    Run every registered benchmark whose name contains ``pattern``.
+
+    A benchmark whose setup fails, for example because an optional
+    dependency is missing, is reported and skipped.
+    """
+    results = []
+    for name, (group, factory) in _REGISTRY.items():
+        if pattern not in name:
+            continue
+        try:
+            call = factory()
+        except Exception as e:
+            print(f"Skipping {name}: {str(e)}", file=sys.stderr)
+            continue
+        results.append(measure(name, call, group, min_time, repeats))
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float = BENCHMARK_REGRESSION_THRESHOLD) -> List[Comparison]:
+    """
+    Compare best times against a baseline.
+
+    The fastest repeat is used because it is the one least disturbed by
+    other work on the machine.
+
+    Args:
+        results: Current results by name, as stored by ``save_results``
+        baseline: Baseline results by name
+        threshold: Relative slowdown beyond which a result is a regression
+
+    Returns:
+        One comparison per current result
+    """
+    comparisons = []
+    for name, result in results.items():
+        current = result["min_ns"]
+        previous = baseline.get(name, {}).get("min_ns")
+        if not previous:
+            comparisons.append(Comparison(name, current, None, None, ComparisonStatus.NEW))
+            continue
+        ratio = current / previous
+        if ratio > 1 + threshold:
+            status = ComparisonStatus.REGRESSION
+        elif ratio < 1 / (1 + threshold):
+            status = ComparisonStatus.IMPROVED
+        else:
+            status = ComparisonStatus.OK
+        comparisons.append(Comparison(name, current, previous, ratio, status))
+    return comparisons
+
+
+def save_results(results: List[BenchmarkResult], path: str):
+    """Write results with the interpreter and machine that produced them."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    data = {
+        "created_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> Optional[Dict[str, Any]]:
+    """Read a file written by ``save_results``, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _format_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.1f} µs"
+    return f"{ns:.0f} ns"
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """Render comparisons as a plain-text table."""
+    lines = [f"{'benchmark':<36}{'best':>12}{'baseline':>12}{'change':>9}  status"]
+    for c in comparisons:
+        baseline = _format_ns(c.baseline_ns) if c.baseline_ns else "-"
+        change = f"{c.ratio - 1:+.1%}" if c.ratio is not None else "-"
+        lines.append(f"{c.name:<36}{_format_ns(c.current_ns):>12}{baseline:>12}{change:>9}  {c.status}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; returns 1 if any benchmark regressed."""
+    parser = argparse.ArgumentParser(description="Run the hot-path micro-benchmarks.")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--output", help="Also write this run's results to a file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "RESULTS"),
+                        help="Compare two stored result files without running anything")
+    parser.add_argument("--threshold", type=float, default=BENCHMARK_REGRESSION_THRESHOLD,
+                        help="Relative slowdown flagged as a regression")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Shortest duration of one repeat in seconds")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (group, _) in _REGISTRY.items():
+            print(f"{group:<10}{name}")
+        return 0
+
+    if args.compare:
+        baseline, current = (load_results(path) for path in args.compare)
+        if baseline is None or current is None:
+            parser.error("both result files must exist")
+        comparisons = compare(current["results"], baseline["results"], args.threshold)
+    else:
+        results = run_benchmarks(args.filter, args.min_time, args.repeats)
+        if args.output:
+            save_results(results, args.output)
+        baseline = None if args.save_baseline else load_results(args.baseline)
+        if args.save_baseline:
+            save_results(results, args.baseline)
+            print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        elif baseline is None:
+            print(f"No baseline at {args.baseline}; run with --save-baseline to record one", file=sys.stderr)
+        elif baseline.get("python") != platform.python_version():
+            print(f"Baseline was recorded on Python {baseline.get('python')}; comparisons may be skewed",
+                  file=sys.stderr)
+        comparisons = compare({result.name: asdict(result) for result in results},
+                              baseline["results"] if baseline else {}, args.threshold)
+
+    print(format_comparisons(comparisons))
+    regressions = [c.name for c in comparisons if c.status == ComparisonStatus.REGRESSION]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
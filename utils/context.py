@@ -0,0 +1,224 @@
+"""Token-budgeted conversation context for prompts."""
+from typing import List, Dict, Optional, Iterator, Tuple
+from utils.llm_backends import estimate_tokens
+import re
+
+# (role, content, tokens)
+Message = Tuple[str, str, int]
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+ROLE_LABELS = {"user": "Candidate", "assistant": "Assistant"}
+
+
+def clip_to_tokens(text: str, limit: int) -> str:
+    """
+    Shorten text to about ``limit`` tokens, cutting at a word boundary.
+
+    Args:
+        text: Text to clip
+        limit: Token limit
+
+    Returns:
+        The text itself if it fits, otherwise its head followed by an ellipsis
+    """
+    if estimate_tokens(text) <= limit:
+        return text
+    head = text[:max(0, limit * 4 - 2)]
+    cut = head.rfind(" ")
+    if cut > len(head) // 2:
+        head = head[:cut]
+    return head.rstrip() + " …"
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO over preallocated slots; appending to a full buffer evicts the oldest item."""
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity: Number of items held before the oldest is evicted
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._slots: List[Optional[Message]] = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of slots in the buffer."""
+        return len(self._slots)
+
+    def append(self, item: Message) -> Optional[Message]:
+        """Add an item, returning the item it evicted if the buffer was full."""
+        evicted = None
+        if self._size == len(self._slots):
+            evicted = self.popleft()
+        self._slots[(self._start + self._size) % len(self._slots)] = item
+        self._size += 1
+        return evicted
+
+    def popleft(self) -> Message:
+        """Remove and return the oldest item."""
+        if not self._size:
+            raise IndexError("pop from an empty RingBuffer")
+        item = self._slots[self._start]
+        self._slots[self._start] = None
+        self._start = (self._start + 1) % len(self._slots)
+        self._size -= 1
+        return item
+
+    def clear(self):
+        """Remove every item, keeping the slots allocated."""
+        for index in range(len(self._slots)):
+            self._slots[index] = None
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Message]:
+        for offset in range(self._size):
+            yield self._slots[(self._start + offset) % len(self._slots)]
+
+
+class ContextWindow:
+    """
+    Recent messages verbatim plus a rolling summary of older ones.
+
+    Messages live in a ring buffer whose raw text is held within
+    ``token_budget - summary_budget`` tokens; each message is clipped to
+    ``message_token_limit`` on the way in, so one long answer cannot crowd
+    out the rest. Messages pushed out of the buffer are folded into the
+    summary as one short line each, and the oldest summary lines give way
+    once the summary passes its own budget. Rendered contexts therefore
+    stay around ``token_budget`` however long the conversation runs.
+    """
+
+    def __init__(self, token_budget: int = 1500, summary_budget: int = 300,
+                 message_token_limit: int = 300, max_messages: int = 20, summary_line_tokens: int = 40):
+        """
+        Initialize the window.
+
+        Args:
+            token_budget: Tokens available to the rendered context
+            summary_budget: Part of the budget reserved for the summary
+            message_token_limit: Longest a single recent message may be
+            max_messages: Recent messages kept verbatim at most
+            summary_line_tokens: Longest a single summary line may be
+        """
+        if summary_budget >= token_budget:
+            raise ValueError("summary_budget must be smaller than token_budget")
+        self.raw_budget = token_budget - summary_budget
+        self.summary_budget = summary_budget
+        self.message_token_limit = min(message_token_limit, self.raw_budget)
+        self.summary_line_tokens = summary_line_tokens
+        self._recent = RingBuffer(max_messages)
+        self._recent_tokens = 0
+        self._summary = RingBuffer(max(1, summary_budget // 4))
+        self._summary_tokens = 0
+        self._omitted = 0
+
+    @property
+    def tokens(self) -> int:
+        """Tokens currently held by the summary and the recent messages."""
+        return self._summary_tokens + self._recent_tokens
+
+    def add(self, role: str, content: str):
+        """Append a message, summarizing whatever it pushes out."""
+        content = clip_to_tokens(content, self.message_token_limit)
+        message = (role, content, estimate_tokens(content))
+        evicted = self._recent.append(message)
+        self._recent_tokens += message[2]
+        if evicted is not None:
+            self._recent_tokens -= evicted[2]
+            self._summarize(evicted)
+        while self._recent_tokens > self.raw_budget and len(self._recent) > 1:
+            evicted = self._recent.popleft()
+            self._recent_tokens -= evicted[2]
+            self._summarize(evicted)
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Recent messages as role/content dicts, oldest first."""
+        return [{"role": role, "content": content} for role, content, _ in self._recent]
+
+    def render(self, skip_latest: int = 0) -> str:
+        """
+        Format the context for a prompt.
+
+        Args:
+            skip_latest: Number of newest messages to leave out, for prompts
+                that quote them separately
+
+        Returns:
+            The summary and recent messages, or an empty string if there are none
+        """
+        sections = []
+        if len(self._summary) or self._omitted:
+            lines = [content for _, content, _ in self._summary]
+            if self._omitted:
+                lines.insert(0, f"({self._omitted} earlier messages omitted)")
+            sections.append("Earlier in the conversation:\n" + "\n".join(lines))
+        recent = list(self._recent)[:max(0, len(self._recent) - skip_latest)]
+        if recent:
+            sections.append("Recent messages:\n" + "\n".join(
+                f"{ROLE_LABELS.get(role, role)}: {content}" for role, content, _ in recent
+            ))
+        return "\n\n".join(sections)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serializable form of the summary and recent messages."""
+        return {
+            "recent": [[role, content] for role, content, _ in self._recent],
+            "summary": [content for _, content, _ in self._summary],
+            "omitted": self._omitted,
+        }
+
+    def load_dict(self, data: Dict[str, object]):
+        """Replace the contents with a form produced by ``to_dict``."""
+        self.clear()
+        for content in data.get("summary", []):
+            entry = ("summary", content, estimate_tokens(content))
+            evicted = self._summary.append(entry)
+            self._summary_tokens += entry[2]
+            if evicted is not None:
+                self._summary_tokens -= evicted[2]
+                self._omitted += 1
+        for role, content in data.get("recent", []):
+            self.add(role, content)
+        self._omitted += data.get("omitted", 0)
+
+    def clear(self):
+        """Drop the summary and every recent message."""
+        self._recent.clear()
+        self._summary.clear()
+        self._recent_tokens = 0
+        self._summary_tokens = 0
+        self._omitted = 0
+
+    def _summarize(self, message: Message):
+        """Fold a message leaving the recent window into the summary."""
+        role, content, _ = message
+        sentences = [s for s in _SENTENCE_END.split(content.strip()) if s]
+        if role == "assistant":
+            # The question asked is what later turns refer back to
+            questions = [s for s in sentences if s.endswith("?")]
+            gist = f"Assistant asked: {questions[-1]}" if questions else f"Assistant: {sentences[0] if sentences else ''}"
+        else:
+            gist = f"{ROLE_LABELS.get(role, role)}: {sentences[0] if sentences else ''}"
+        line = clip_to_tokens(gist, self.summary_line_tokens)
+        entry = ("summary", line, estimate_tokens(line))
+
+        evicted = self._summary.append(entry)
+        self._summary_tokens += entry[2]
+        if evicted is not None:
+            self._summary_tokens -= evicted[2]
+            self._omitted += 1
+        while self._summary_tokens > self.summary_budget and len(self._summary) > 1:
+            evicted = self._summary.popleft()
+            self._summary_tokens -= evicted[2]
+            self._omitted += 1
@@ -1,22 +1,131 @@
 """Conversation manager for handling chat flow and state."""
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Generator, Callable, Union, Any
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from dataclasses import dataclass
+import asyncio
+import queue
+import random
 import re
-from models import CandidateInfo
-from config.settings import ConversationState, EXIT_KEYWORDS, MAX_CONTEXT_MESSAGES
-from utils.gemini_client import GeminiClient
+import time
+from models import CandidateInfo, PlannedQuestion, QuestionPlan, ScoredAnswer, AnswerScoreSheet
+from config.settings import (
+    ConversationState,
+    PromptType,
+    GenerationProfile,
+    MAX_CONTEXT_MESSAGES,
+    CONTEXT_TOKEN_BUDGET,
+    CONTEXT_SUMMARY_TOKEN_BUDGET,
+    CONTEXT_MESSAGE_TOKEN_LIMIT,
+    COMPANY_NAME,
+    QUESTION_PLAN_ENABLED,
+    PREFETCH_ENABLED,
+    PREFETCH_MAX_WORKERS,
+    SCORING_ENABLED,
+    SCORING_BATCH_SIZE,
+    SCORING_MAX_WORKERS,
+    LLM_MAX_CONCURRENCY,
+    TURN_DEADLINES_ENABLED,
+    TURN_DEADLINE_DEFAULT_SECONDS,
+    TURN_DEADLINE_SECONDS
+)
+from utils.gemini_client import GeminiClient, ErrorResponse
+from utils.question_bank import question_bank
+from utils.intent import Intent, intent_classifier
+from utils.context import ContextWindow, clip_to_tokens
+from utils.tech_stack import tech_normalizer
+from utils.extractor import extract_candidate_fields
 from prompts import (
     SYSTEM_PROMPT, 
     GREETING_PROMPT, 
     FALLBACK_PROMPT, 
     EXIT_CONFIRMATION_PROMPT,
-    TECH_STACK_ACKNOWLEDGMENT
+    TECH_STACK_ACKNOWLEDGMENT,
+    GREETING_PROFILE,
+    EXIT_CONFIRMATION_PROFILE
 )
 from prompts.question_generator import (
+    get_experience_level,
     generate_technical_questions_prompt,
-    generate_followup_question_prompt
+    generate_question_plan_prompt,
+    generate_next_question_prompt,
+    generate_followup_question_prompt,
+    generate_answer_scoring_prompt,
+    TECHNICAL_QUESTIONS_PROFILE,
+    QUESTION_PLAN_PROFILE,
+    NEXT_QUESTION_PROFILE,
+    FOLLOWUP_QUESTION_PROFILE,
+    ANSWER_SCORING_PROFILE
 )
 
 
+@dataclass
+class LLMRequest:
+    """A model call requested by a conversation handler.
+    
+    Handlers yield these instead of calling the client directly so the same
+    handler code can be driven in blocking or streaming mode.
+    """
+    prompt: str
+    prompt_type: Optional[str] = None
+    fallback: Optional[str] = None
+    display: bool = True  # False for internal calls whose text is not shown
+    profile: Optional[str] = None  # GenerationProfile; None uses the default
+    reuse_key: Optional[str] = None  # Lets a result that missed its deadline serve the same request next turn
+    pending: Optional[Future] = None  # A call already running for this request; awaited instead of a new one
+
+
+# Handlers yield text to show the candidate or an LLMRequest to fulfil; the
+# generated text for an LLMRequest is sent back into the handler.
+TurnSteps = Generator[Union[str, LLMRequest], Optional[str], None]
+
+# Shared by every ConversationManager in the process
+_prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS, thread_name_prefix="question-prefetch")
+_turn_executor = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY, thread_name_prefix="turn-call")
+_scoring_executor = ThreadPoolExecutor(max_workers=SCORING_MAX_WORKERS, thread_name_prefix="answer-scoring")
+
+# Marks the end of a stream pumped through a queue
+_STREAM_END = object()
+
+# Bumped whenever the serialized manager state changes shape
+STATE_FORMAT_VERSION = 1
+
+# Intake states in the order they are asked, with the CandidateInfo field each one fills
+INTAKE_STEPS = [
+    (ConversationState.COLLECT_NAME, "full_name"),
+    (ConversationState.COLLECT_EMAIL, "email"),
+    (ConversationState.COLLECT_PHONE, "phone"),
+    (ConversationState.COLLECT_EXPERIENCE, "years_experience"),
+    (ConversationState.COLLECT_POSITION, "desired_positions"),
+    (ConversationState.COLLECT_LOCATION, "current_location"),
+    (ConversationState.COLLECT_TECH_STACK, "tech_stack"),
+]
+
+INTAKE_QUESTIONS = {
+    ConversationState.COLLECT_NAME: "Could you please tell me your full name?",
+    ConversationState.COLLECT_EMAIL: "Could you please provide your email address?",
+    ConversationState.COLLECT_PHONE: "What's your phone number?",
+    ConversationState.COLLECT_EXPERIENCE: "How many years of professional experience do you have? (Please provide a number)",
+    ConversationState.COLLECT_POSITION: "What position(s) are you interested in? (You can list multiple positions separated by commas)",
+    ConversationState.COLLECT_LOCATION: "Where are you currently located?",
+    ConversationState.COLLECT_TECH_STACK: ("Now, let's talk about your technical skills.\n\n"
+                                           "Please list the programming languages, frameworks, databases, and tools you're proficient in. "
+                                           "(e.g., Python, React, PostgreSQL, Docker)"),
+}
+
+# Fields too easy to misread from an answer to another question, taken out of turn only when introduced
+LABELLED_FIELDS = ("full_name", "tech_stack", "current_location")
+
+FIELD_LABELS = {
+    "full_name": "name",
+    "email": "email",
+    "phone": "phone number",
+    "years_experience": "years of experience",
+    "desired_positions": "desired position",
+    "current_location": "location",
+    "tech_stack": "tech stack",
+}
+
+
 class ConversationManager:
     """Manages conversation flow and state transitions."""
     
@@ -30,23 +139,187 @@ class ConversationManager:
         self.client = gemini_client
         self.state = ConversationState.GREETING
         self.candidate = CandidateInfo()
-        self.conversation_history: List[Dict[str, str]] = []
+        self.context = ContextWindow(
+            token_budget=CONTEXT_TOKEN_BUDGET,
+            summary_budget=CONTEXT_SUMMARY_TOKEN_BUDGET,
+            message_token_limit=CONTEXT_MESSAGE_TOKEN_LIMIT,
+            max_messages=MAX_CONTEXT_MESSAGES * 2
+        )
         self.current_tech_index = 0
         self.questions_asked = 0
         self.max_questions_per_tech = 3
+        # Background work started by turns; off for callers that time or replay single turns
+        self.prefetch_enabled = PREFETCH_ENABLED
+        self.scoring_enabled = SCORING_ENABLED
+        self.question_queue: List[PlannedQuestion] = []
+        self._prefetch: Optional[Future] = None
+        self._prefetch_tech: Optional[str] = None
+        self._drawn_questions: set = set()
+        self._rng = random.Random()
+        self._turn_deadline: Optional[float] = None
+        self._turns = 0
+        self._late_results: Dict[str, tuple] = {}  # reuse_key -> (turn number, future or task)
+        self._last_question: Optional[str] = None
+        self._last_question_tech: Optional[str] = None  # Technology the last question was about
+        self._unscored: List[ScoredAnswer] = []
+        self._scoring: List[Future] = []
+        # Whether the latest turn served a local fallback in place of a failed model call
+        self.turn_degraded = False
         
-    def add_to_history(self, role: str, content: str):
-        """Add message to conversation history."""
-        self.conversation_history.append({"role": role, "content": content})
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the interview state for a checkpoint.
+        
+        A finished prefetch is kept so a restored interview does not generate
+        its next question again; prefetches still running are dropped.
+        
+        Returns:
+            JSON-compatible state, tagged with STATE_FORMAT_VERSION
+        """
+        prefetched = None
+        if self._prefetch is not None and self._prefetch.done() and not self._prefetch.cancelled():
+            try:
+                text = self._prefetch.result()
+            except Exception:
+                text = None
+            if text is not None and not self._is_failed_response(text):
+                prefetched = [self._prefetch_tech, text]
         
-        # Keep only last N messages for context
-        if len(self.conversation_history) > MAX_CONTEXT_MESSAGES * 2:
-            self.conversation_history = self.conversation_history[-MAX_CONTEXT_MESSAGES * 2:]
+        return {
+            "v": STATE_FORMAT_VERSION,
+            "state": self.state,
+            "candidate": self.candidate.to_dict(),
+            "context": self.context.to_dict(),
+            "tech_index": self.current_tech_index,
+            "asked": self.questions_asked,
+            "per_tech": self.max_questions_per_tech,
+            "queue": [[q.technology, q.question, q.topic] for q in self.question_queue],
+            "drawn": sorted(self._drawn_questions),
+            "prefetched": prefetched,
+            "last_question": self._last_question,
+            "last_question_tech": self._last_question_tech,
+        }
+    
+    def pending_prefetch(self) -> Optional[tuple]:
+        """Return (technology, future) of a prefetch still being generated, or None."""
+        if self._prefetch is None or self._prefetch.done():
+            return None
+        return self._prefetch_tech, self._prefetch
+    
+    def pending_scores(self) -> List[Future]:
+        """Return the scoring calls still running."""
+        return [future for future in self._scoring if not future.done()]
+    
+    def wait_for_scores(self, timeout: Optional[float] = None) -> bool:
+        """
+        Score any answers still waiting and block until every score is in.
+        
+        Args:
+            timeout: Seconds to wait at most; None waits indefinitely
+            
+        Returns:
+            True if no scoring call is still running
+        """
+        self.flush_scoring()
+        _, not_done = wait(self.pending_scores(), timeout=timeout)
+        return not not_done
     
-    def check_exit_intent(self, user_input: str) -> bool:
-        """Check if user wants to exit."""
-        user_lower = user_input.lower().strip()
-        return any(keyword in user_lower for keyword in EXIT_KEYWORDS)
+    def flush_scoring(self):
+        """Send every answer still waiting for a score to the scoring pool in one batch."""
+        batch, self._unscored = self._unscored, []
+        if not batch:
+            return
+        prompt = generate_answer_scoring_prompt(
+            [(answer.technology,
+              clip_to_tokens(answer.question, CONTEXT_MESSAGE_TOKEN_LIMIT),
+              clip_to_tokens(answer.answer, CONTEXT_MESSAGE_TOKEN_LIMIT)) for answer in batch],
+            self.candidate.years_experience or 0
+        )
+        future = _scoring_executor.submit(
+            self.client.generate_content, prompt,
+            prompt_type=PromptType.ANSWER_SCORING, profile=ANSWER_SCORING_PROFILE
+        )
+        future.add_done_callback(lambda done: self._apply_scores(batch, done))
+        self._scoring = self.pending_scores() + [future]
+    
+    @classmethod
+    def _apply_scores(cls, batch: List[ScoredAnswer], future: Future):
+        """Write a finished scoring call's results onto its answers."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        text = future.result()
+        # A failed call is already in the client metrics; its answers stay unscored
+        if cls._is_failed_response(text):
+            return
+        for item in AnswerScoreSheet.from_response(text, len(batch)).scores:
+            batch[item.index].score = item.score
+            batch[item.index].feedback = item.feedback
+    
+    def _record_answer(self, tech: str, answer: str):
+        """Keep an answer with the question it answered and queue it for scoring."""
+        scored = ScoredAnswer(technology=tech, question=self._last_question or "", answer=answer)
+        self.candidate.scored_answers.append(scored)
+        if not self.scoring_enabled:
+            return
+        self._unscored.append(scored)
+        if len(self._unscored) >= SCORING_BATCH_SIZE:
+            self.flush_scoring()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], gemini_client: GeminiClient) -> "ConversationManager":
+        """
+        Rebuild a manager from ``to_dict`` output.
+        
+        Args:
+            data: Serialized state
+            gemini_client: Instance of GeminiClient
+            
+        Returns:
+            The restored manager
+            
+        Raises:
+            ValueError: If the state was written by an unsupported format version
+        """
+        if data.get("v") != STATE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported conversation state version: {data.get('v')}")
+        
+        manager = cls(gemini_client)
+        manager.state = data["state"]
+        # Values were validated when they were collected
+        manager.candidate = CandidateInfo.model_construct(**data["candidate"])
+        manager.context.load_dict(data["context"])
+        manager.current_tech_index = data["tech_index"]
+        manager.questions_asked = data["asked"]
+        manager.max_questions_per_tech = data["per_tech"]
+        manager.question_queue = [
+            PlannedQuestion.model_construct(technology=tech, question=question, topic=topic)
+            for tech, question, topic in data["queue"]
+        ]
+        manager._drawn_questions = set(data["drawn"])
+        manager._last_question = data.get("last_question")
+        manager._last_question_tech = data.get("last_question_tech")
+        manager.candidate.scored_answers = [
+            ScoredAnswer.model_construct(**answer) for answer in data["candidate"].get("scored_answers", [])
+        ]
+        # Scoring still in flight at checkpoint time is lost with the process; score those answers again
+        if manager.scoring_enabled:
+            manager._unscored = [answer for answer in manager.candidate.scored_answers if answer.score is None]
+            if manager.state != ConversationState.TECHNICAL_QA:
+                manager.flush_scoring()
+        if data.get("prefetched"):
+            manager._prefetch_tech, text = data["prefetched"]
+            manager._prefetch = Future()
+            manager._prefetch.set_result(text)
+        return manager
+    
+    @property
+    def conversation_history(self) -> List[Dict[str, str]]:
+        """Recent messages kept verbatim; older ones only survive in the context summary."""
+        return self.context.messages()
+    
+    def add_to_history(self, role: str, content: str):
+        """Add message to conversation history."""
+        self.context.add(role, content)
     
     def process_message(self, user_input: str) -> str:
         """
@@ -58,16 +331,276 @@ class ConversationManager:
         Returns:
             Bot's response
         """
-        user_input = user_input.strip()
+        return "".join(self._run_turn(user_input, self._complete_request))
+    
+    def process_message_stream(self, user_input: str) -> Iterator[str]:
+        """
+        Process user message and yield the response as it is generated.
+        
+        The iterator must be consumed to the end; state transitions and
+        history updates happen as the turn progresses.
+        
+        Args:
+            user_input: User's message
+            
+        Yields:
+            Chunks of the bot's response
+        """
+        return self._run_turn(user_input, self._stream_request)
+    
+    def _run_turn(self, user_input: str,
+                  fulfil: Callable[[LLMRequest], Generator[str, None, str]]) -> Iterator[str]:
+        """Drive the handler for one turn, fulfilling its model calls with ``fulfil``."""
+        self._start_turn_clock()
+        steps = self._dispatch(user_input.strip())
+        reply = None
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration:
+                return
+            if isinstance(step, LLMRequest):
+                if step.display:
+                    reply = yield from fulfil(step)
+                else:
+                    reply = self._apply_fallback(step, self._call_client(step))
+            else:
+                reply = None
+                yield step
+    
+    async def process_message_async(self, user_input: str) -> str:
+        """
+        Process user message without blocking the event loop.
+        
+        Args:
+            user_input: User's message
+            
+        Returns:
+            Bot's response
+        """
+        self._start_turn_clock()
+        steps = self._dispatch(user_input.strip())
+        parts = []
+        reply = None
+        while True:
+            try:
+                step = steps.send(reply)
+            except StopIteration:
+                return "".join(parts)
+            if isinstance(step, LLMRequest):
+                reply = self._apply_fallback(step, await self._call_client_async(step))
+                if step.display:
+                    parts.append(reply)
+            else:
+                reply = None
+                parts.append(step)
+    
+    def _complete_request(self, request: LLMRequest) -> Generator[str, None, str]:
+        """Fulfil a model call with a single blocking request."""
+        text = self._apply_fallback(request, self._call_client(request))
+        yield text
+        return text
+    
+    def _call_client(self, request: LLMRequest) -> str:
+        """Make a blocking client call for a request, giving up at the turn deadline."""
+        if request.pending is not None:
+            try:
+                return request.pending.result(timeout=self._time_left())
+            except FutureTimeoutError:
+                return ErrorResponse("Turn deadline exceeded")
+            except Exception as e:
+                return ErrorResponse(f"Error generating content: {str(e)}")
+        
+        late = self._take_late_result(request)
+        if late is not None:
+            return late
+        
+        timeout = self._time_left()
+        if timeout is None:
+            return self.client.generate_content(request.prompt, prompt_type=request.prompt_type, profile=request.profile)
+        
+        future = _turn_executor.submit(
+            self.client.generate_content, request.prompt, prompt_type=request.prompt_type, profile=request.profile
+        )
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return self._miss_deadline(request, future)
+    
+    async def _call_client_async(self, request: LLMRequest) -> str:
+        """Async counterpart of ``_call_client``."""
+        if request.pending is not None:
+            try:
+                # Shielded so a prefetch outliving the deadline is not cancelled
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(request.pending)), self._time_left())
+            except asyncio.TimeoutError:
+                return ErrorResponse("Turn deadline exceeded")
+            except Exception as e:
+                return ErrorResponse(f"Error generating content: {str(e)}")
+        
+        late = self._take_late_result(request)
+        if late is not None:
+            return late
+        
+        call = self.client.generate_content_async(request.prompt, prompt_type=request.prompt_type, profile=request.profile)
+        timeout = self._time_left()
+        if timeout is None:
+            return await call
+        
+        task = asyncio.ensure_future(call)
+        try:
+            # Shielded so the call keeps running after the deadline
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return self._miss_deadline(request, task)
+    
+    def _stream_request(self, request: LLMRequest) -> Generator[str, None, str]:
+        """Fulfil a model call by streaming chunks as they arrive."""
+        late = self._take_late_result(request)
+        if late is not None:
+            yield late
+            return late
+        
+        chunks = []
+        for chunk in self._stream_with_deadline(request):
+            # Failures arrive as a single message chunk before any real text
+            if not chunks and request.fallback is not None and self._is_failed_response(chunk):
+                self.turn_degraded = True
+                yield request.fallback
+                return request.fallback
+            chunks.append(chunk)
+            yield chunk
+        return "".join(chunks)
+    
+    def _stream_with_deadline(self, request: LLMRequest) -> Iterator[str]:
+        """
+        Yield the client's stream, or a failure chunk if nothing arrives by the turn deadline.
+        
+        The deadline only bounds the wait for the first chunk; text already
+        shown is never cut off. A stream that misses it keeps running in the
+        background and its full text is kept as a late result.
+        """
+        stream = self.client.generate_content_stream(request.prompt, prompt_type=request.prompt_type,
+                                                     profile=request.profile)
+        timeout = self._time_left()
+        if timeout is None:
+            yield from stream
+            return
+        
+        chunks = queue.Queue()
+        full_text = Future()
+        
+        def pump():
+            parts = []
+            try:
+                for chunk in stream:
+                    parts.append(chunk)
+                    chunks.put(chunk)
+            except Exception as e:
+                # Nothing shown yet, so the request's fallback can still take over
+                if not parts:
+                    parts.append(ErrorResponse(f"Error generating content: {str(e)}"))
+                    chunks.put(parts[0])
+            finally:
+                chunks.put(_STREAM_END)
+                # A lone part may be the client's ErrorResponse; keep its type
+                full_text.set_result(parts[0] if len(parts) == 1 else "".join(parts))
+        
+        _turn_executor.submit(pump)
+        try:
+            chunk = chunks.get(timeout=timeout)
+        except queue.Empty:
+            yield self._miss_deadline(request, full_text)
+            return
+        while chunk is not _STREAM_END:
+            yield chunk
+            chunk = chunks.get()
+    
+    def _start_turn_clock(self):
+        """Set the deadline for the turn that is starting, based on the current state."""
+        self.turn_degraded = False
+        self._turns += 1
+        # Late results only serve the turn right after the one that gave up on them
+        self._late_results = {key: late for key, late in self._late_results.items() if late[0] >= self._turns - 1}
+        if not TURN_DEADLINES_ENABLED:
+            self._turn_deadline = None
+            return
+        budget = TURN_DEADLINE_SECONDS.get(self.state, TURN_DEADLINE_DEFAULT_SECONDS)
+        self._turn_deadline = time.monotonic() + budget
+    
+    def _time_left(self) -> Optional[float]:
+        """Seconds left before the turn deadline, or None if there is none."""
+        if self._turn_deadline is None:
+            return None
+        return max(0.0, self._turn_deadline - time.monotonic())
+    
+    def _miss_deadline(self, request: LLMRequest, pending: Any) -> ErrorResponse:
+        """
+        Give up waiting on a call that missed the turn deadline.
+        
+        Args:
+            request: The request being fulfilled
+            pending: Future or task of the call, which keeps running
+            
+        Returns:
+            A failure response, so the request's local fallback is served
+        """
+        if request.reuse_key is not None:
+            self._late_results[request.reuse_key] = (self._turns, pending)
+        return ErrorResponse("Turn deadline exceeded")
+    
+    def _take_late_result(self, request: LLMRequest) -> Optional[str]:
+        """Return a finished result that missed the previous turn's deadline for the same request."""
+        if request.reuse_key is None:
+            return None
+        _, pending = self._late_results.pop(request.reuse_key, (None, None))
+        if pending is None or not pending.done() or pending.cancelled():
+            return None
+        try:
+            text = pending.result()
+        except Exception:
+            return None
+        return None if self._is_failed_response(text) else text
+    
+    def _apply_fallback(self, request: LLMRequest, text: str) -> str:
+        """Swap in the request's fallback if the client call failed."""
+        if request.fallback is not None and self._is_failed_response(text):
+            self.turn_degraded = True
+            return request.fallback
+        return text
+    
+    @staticmethod
+    def _is_failed_response(text: str) -> bool:
+        """Check whether the client returned one of its failure messages."""
+        return not text or isinstance(text, ErrorResponse)
+    
+    def _dispatch(self, user_input: str) -> TurnSteps:
+        """Route the message to the handler for the current state."""
+        intent = intent_classifier.classify(user_input).intent
         
         # Check for exit intent
-        if self.check_exit_intent(user_input) and self.state != ConversationState.GREETING:
-            self.state = ConversationState.ENDED
-            prompt = EXIT_CONFIRMATION_PROMPT.format(user_input=user_input)
-            response = self.client.generate_content(prompt)
-            self.add_to_history("user", user_input)
-            self.add_to_history("assistant", response)
-            return response
+        if intent == Intent.EXIT and self.state != ConversationState.GREETING:
+            yield from self._handle_exit(user_input)
+            return
+        
+        # Off-topic messages get a local redirect instead of being taken as an answer
+        if intent == Intent.OFF_TOPIC and self.state in (ConversationState.TECHNICAL_QA, ConversationState.WRAP_UP):
+            yield self._handle_off_topic(user_input)
+            return
+        
+        response = self._route_state(user_input)
+        if isinstance(response, str):
+            yield response
+        else:
+            yield from response
+    
+    def _route_state(self, user_input: str) -> Union[str, TurnSteps]:
+        """Pick the handler for the current state."""
+        # A message carrying several intake fields fills them all at once
+        if self.state in INTAKE_QUESTIONS:
+            fields = self._extract_intake_fields(user_input)
+            if fields:
+                return self._handle_multi_field(user_input, fields)
         
         # Handle based on current state
         if self.state == ConversationState.GREETING:
@@ -102,11 +635,68 @@ class ConversationManager:
         
         return "I'm not sure how to respond to that. Could you please clarify?"
     
-    def _handle_greeting(self) -> str:
+    def _handle_exit(self, user_input: str) -> TurnSteps:
+        """Handle the candidate ending the conversation."""
+        self.state = ConversationState.ENDED
+        self.flush_scoring()
+        prompt = EXIT_CONFIRMATION_PROMPT.format(user_input=user_input)
+        response = yield LLMRequest(prompt, PromptType.EXIT, fallback=self._generate_fallback_closing(),
+                                    profile=EXIT_CONFIRMATION_PROFILE)
+        self.add_to_history("user", user_input)
+        self.add_to_history("assistant", response)
+    
+    def _handle_off_topic(self, user_input: str) -> str:
+        """Redirect an off-topic message without changing state."""
+        self.add_to_history("user", user_input)
+        if self.state == ConversationState.TECHNICAL_QA:
+            response = ("Let's keep our focus on the screening for now - you'll have a chance to ask "
+                        "questions at the end.\n\nWhenever you're ready, please answer the last question.")
+        else:
+            response = ("I can only help with questions about the role and our hiring process. "
+                        "Is there anything you'd like to know about those?")
+        self.add_to_history("assistant", response)
+        return response
+    
+    def _handle_greeting(self) -> TurnSteps:
         """Handle initial greeting."""
-        response = self.client.generate_content(GREETING_PROMPT)
+        response = yield LLMRequest(GREETING_PROMPT, PromptType.GREETING, fallback=self._generate_fallback_greeting(),
+                                    profile=GREETING_PROFILE)
         self.add_to_history("assistant", response)
         self.state = ConversationState.COLLECT_NAME
+    
+    def _extract_intake_fields(self, user_input: str) -> Dict[str, Any]:
+        """Return the unfilled intake fields in a message if it carries more than one."""
+        filled = [field for _, field in INTAKE_STEPS if getattr(self.candidate, field) not in (None, [])]
+        # "5 years with Python" must not answer the tech stack question before it is asked
+        current = dict(INTAKE_STEPS).get(self.state)
+        labelled_only = {field for field in LABELLED_FIELDS if field != current}
+        fields = extract_candidate_fields(user_input, skip=filled, labelled_only=labelled_only)
+        return fields if len(fields) > 1 else {}
+    
+    def _handle_multi_field(self, user_input: str, fields: Dict[str, Any]) -> Union[str, TurnSteps]:
+        """Store several intake fields and skip to the first state still unsatisfied."""
+        for field, value in fields.items():
+            setattr(self.candidate, field, value)
+        self.add_to_history("user", user_input)
+        
+        labels = [FIELD_LABELS[field] for _, field in INTAKE_STEPS if field in fields]
+        noted = ", ".join(labels[:-1]) + f" and {labels[-1]}"
+        thanks = f"Thanks, {self.candidate.full_name}!" if self.candidate.full_name else "Thanks!"
+        acknowledgment = f"{thanks} I've noted your {noted}.\n\n"
+        
+        next_state = next(
+            (state for state, field in INTAKE_STEPS if getattr(self.candidate, field) in (None, [])), None
+        )
+        if next_state is None:
+            self.state = ConversationState.COLLECT_TECH_STACK
+            tech_list = ", ".join(self.candidate.tech_stack)
+            return self._start_technical_qa(
+                self.candidate.tech_stack, f"{acknowledgment}I see you work with: {tech_list}.\n\n"
+            )
+        
+        self.state = next_state
+        response = acknowledgment + INTAKE_QUESTIONS[next_state]
+        self.add_to_history("assistant", response)
         return response
     
     def _handle_name_collection(self, user_input: str) -> str:
@@ -210,32 +800,141 @@ class ConversationManager:
             self.add_to_history("assistant", response)
             return response
     
-    def _handle_tech_stack_collection(self, user_input: str) -> str:
+    def _handle_tech_stack_collection(self, user_input: str) -> TurnSteps:
         """Handle tech stack collection."""
-        # Parse tech stack from input
-        tech_stack = [tech.strip() for tech in re.split(r'[,;\n]', user_input) if tech.strip()]
-        self.candidate.tech_stack = tech_stack
+        # Parse tech stack from input, mapping each entry to its canonical name
+        entries = [tech.strip() for tech in re.split(r'[,;\n]', user_input) if tech.strip()]
+        tech_stack = [match.canonical for match in tech_normalizer.normalize_stack(entries)]
         self.add_to_history("user", user_input)
         
         # Generate acknowledgment
         tech_list = ", ".join(tech_stack)
         acknowledgment = f"Impressive tech stack! I see you work with: {tech_list}.\n\n"
+        yield from self._start_technical_qa(tech_stack, acknowledgment)
+    
+    def _start_technical_qa(self, tech_stack: list, acknowledgment: str) -> TurnSteps:
+        """Open the technical round for ``tech_stack``, leading with ``acknowledgment``."""
+        self.candidate.tech_stack = tech_stack
+        yield acknowledgment
         
-        # Generate technical questions
-        prompt = generate_technical_questions_prompt(tech_stack, self.candidate.years_experience or 0)
-        questions_response = self.client.generate_content(prompt)
+        yield from self._build_question_queue(tech_stack)
         
-        # Fallback if AI fails
-        if not questions_response or "couldn't generate" in questions_response.lower() or "error" in questions_response.lower():
-            questions_response = self._generate_fallback_questions(tech_stack)
+        first_tech_index = 0
+        if self.question_queue and self.question_queue[0].question is not None:
+            first = self.question_queue.pop(0)
+            first_tech_index = tech_stack.index(first.technology)
+            questions_response = (f"Great! Let's dive into some technical questions.\n\n"
+                                  f"Let's start with {first.technology}. {first.question}")
+            yield questions_response
+        else:
+            # The first technology has no prepared questions; ask about it live
+            if self.question_queue:
+                self.question_queue.pop(0)
+            # Generate technical questions, falling back to local questions if AI fails
+            prompt = generate_technical_questions_prompt(tech_stack, self.candidate.years_experience or 0)
+            questions_response = yield LLMRequest(
+                prompt, PromptType.TECH_QUESTIONS, fallback=self._generate_fallback_questions(tech_stack),
+                profile=TECHNICAL_QUESTIONS_PROFILE
+            )
         
         response = acknowledgment + questions_response
         self.add_to_history("assistant", response)
         self.state = ConversationState.TECHNICAL_QA
-        self.current_tech_index = 0
+        self.current_tech_index = first_tech_index
         self.questions_asked = 1
+        self._last_question = questions_response
+        self._last_question_tech = tech_stack[first_tech_index]
+        self._start_prefetch(questions_response)
+    
+    def _total_questions_needed(self) -> int:
+        """Number of technical questions in the whole interview."""
+        return min(len(self.candidate.tech_stack or []) * self.max_questions_per_tech, 15)
+    
+    def _build_question_queue(self, tech_stack: list) -> TurnSteps:
+        """
+        Queue the interview's questions, drawing from the question bank first.
         
-        return response
+        Technologies missing from the bank are planned in one model call when
+        planning is enabled; any remaining slots are queued as live slots. If
+        nothing was prepared the queue stays empty and every question is live.
+        """
+        # Only prepare questions for as many technologies as the interview will reach
+        covered = tech_stack[:max(1, self._total_questions_needed() // self.max_questions_per_tech)]
+        level = get_experience_level(self.candidate.years_experience or 0)
+        prepared = {
+            tech: question_bank.draw(tech, level, self.max_questions_per_tech, self._drawn_questions, self._rng)
+            for tech in covered
+        }
+        
+        missing = [tech for tech in covered if not prepared[tech]]
+        if missing and QUESTION_PLAN_ENABLED:
+            planned = yield from self._plan_questions(missing)
+            for question in planned:
+                prepared[question.technology].append(question)
+        
+        queue = []
+        for tech in covered:
+            queue.extend(prepared[tech])
+            queue.extend(PlannedQuestion(technology=tech)
+                         for _ in range(self.max_questions_per_tech - len(prepared[tech])))
+        self.question_queue = queue if any(q.question is not None for q in queue) else []
+    
+    def _plan_questions(self, technologies: list) -> Generator[LLMRequest, Optional[str], List[PlannedQuestion]]:
+        """Plan questions for ``technologies`` in a single structured model call."""
+        prompt = generate_question_plan_prompt(
+            technologies, self.candidate.years_experience or 0, self.max_questions_per_tech
+        )
+        plan_text = yield LLMRequest(prompt, PromptType.QUESTION_PLAN, display=False, profile=QUESTION_PLAN_PROFILE)
+        if isinstance(plan_text, ErrorResponse):
+            return []
+        return QuestionPlan.from_response(plan_text, technologies, self.max_questions_per_tech).questions
+    
+    def _needs_adaptive_followup(self, answer: str) -> bool:
+        """Check whether an answer calls for a live follow-up instead of the next planned question."""
+        answer_lower = answer.lower()
+        if len(answer.split()) < 5 or "?" in answer:
+            return True
+        return any(phrase in answer_lower for phrase in ["not sure", "don't know", "dont know", "no idea", "never used"])
+    
+    def _start_prefetch(self, current_question: str):
+        """Start generating the next question in the background while the candidate answers."""
+        self._discard_prefetch()
+        if not self.prefetch_enabled or not self.candidate.tech_stack:
+            return
+        # The next answer ends the technical round, so no question will be needed
+        if self.questions_asked + 1 >= self._total_questions_needed():
+            return
+        
+        if self.question_queue:
+            # Prepared questions need no prefetch; live slots name their technology
+            if self.question_queue[0].question is not None:
+                return
+            tech = self.question_queue[0].technology
+        else:
+            tech = self.candidate.tech_stack[self.current_tech_index % len(self.candidate.tech_stack)]
+        prompt = generate_next_question_prompt(tech, self.candidate.years_experience or 0, current_question)
+        self._prefetch_tech = tech
+        self._prefetch = _prefetch_executor.submit(
+            self.client.generate_content, prompt,
+            prompt_type=PromptType.PREFETCH_QUESTION, profile=NEXT_QUESTION_PROFILE
+        )
+    
+    def _take_prefetch(self, tech: str) -> Optional[Future]:
+        """Claim the prefetch for ``tech``, finished or not; any other prefetch is cancelled."""
+        future, prefetched_tech = self._prefetch, self._prefetch_tech
+        self._prefetch = None
+        self._prefetch_tech = None
+        if future is not None and prefetched_tech != tech:
+            future.cancel()
+            return None
+        return future
+    
+    def _discard_prefetch(self):
+        """Drop any pending prefetch."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+        self._prefetch = None
+        self._prefetch_tech = None
     
     def _generate_fallback_questions(self, tech_stack: list) -> str:
         """Generate simple fallback questions if AI fails."""
@@ -247,53 +946,125 @@ class ConversationManager:
                 f"Let's start with {first_tech}. Can you tell me about a recent project "
                 f"where you used {first_tech}? What was your role and what challenges did you face?")
     
-    def _handle_technical_qa(self, user_input: str) -> str:
+    def _generate_fallback_greeting(self) -> str:
+        """Greeting used when the AI is unavailable."""
+        return (f"Hello, and welcome to {COMPANY_NAME}! I'm your hiring assistant, and I'll be conducting "
+                f"your initial screening today. I'll ask a few questions about your background and "
+                f"technical skills - feel free to ask me anything along the way.\n\n"
+                f"To get started, could you please tell me your full name?")
+    
+    def _generate_fallback_followup(self, tech: str) -> str:
+        """Follow-up question used when the AI is unavailable."""
+        return (f"Thanks for sharing that! Let's look at {tech} from another angle. "
+                f"Can you describe a tricky problem you solved with {tech} and how you approached it?")
+    
+    def _generate_fallback_process_answer(self) -> str:
+        """Answer to process questions used when the AI is unavailable."""
+        return ("That's a great question. Our recruiting team will review your screening and "
+                "reach out within 2-3 business days with details on next steps and the timeline.")
+    
+    def _generate_fallback_closing(self) -> str:
+        """Closing message used when the AI is unavailable."""
+        return ("Thank you for your time today! Any information you've shared will be reviewed by "
+                "our recruiting team, and we'll be in touch about next steps. Best of luck!")
+    
+    def _handle_technical_qa(self, user_input: str) -> TurnSteps:
         """Handle technical Q&A."""
         self.add_to_history("user", user_input)
         
-        # Store the answer
+        # Store the answer under the technology its question was about
         if self.candidate.tech_stack:
-            tech = self.candidate.tech_stack[min(self.current_tech_index, len(self.candidate.tech_stack) - 1)]
+            tech = self._last_question_tech or self.candidate.tech_stack[0]
             if tech not in self.candidate.technical_responses:
                 self.candidate.technical_responses[tech] = []
             self.candidate.technical_responses[tech].append(user_input)
+            self._record_answer(tech, user_input)
         
         # Check if we should continue with questions
         self.questions_asked += 1
-        total_questions_needed = min(len(self.candidate.tech_stack or []) * self.max_questions_per_tech, 15)
+        total_questions_needed = self._total_questions_needed()
         
         if self.questions_asked >= total_questions_needed:
             # Move to wrap up
+            self._discard_prefetch()
+            self.flush_scoring()
             self.state = ConversationState.WRAP_UP
             response = (f"Thank you for your detailed answers! 🎉\n\n"
                        f"You've done great in this initial screening. "
                        f"Our team will review your responses and get back to you within 2-3 business days.\n\n"
                        f"Is there anything you'd like to ask about the position or our process?")
             self.add_to_history("assistant", response)
-            return response
+            yield response
+            return
         
-        # Generate next question
+        # Serve the next queued question unless the answer needs a live follow-up
+        if self.question_queue and not self._needs_adaptive_followup(user_input):
+            planned = self.question_queue.pop(0)
+            current_tech = self._last_question_tech
+            self.current_tech_index = self.candidate.tech_stack.index(planned.technology)
+            # Live slots fall through to a generated question for their technology
+            if planned.question is not None:
+                if planned.technology == current_tech:
+                    response = f"Thanks for your answer! Let's go a bit deeper on {planned.technology}. {planned.question}"
+                else:
+                    response = f"Thanks for your answer! Now let's move on to {planned.technology}. {planned.question}"
+                self.add_to_history("assistant", response)
+                self._last_question = planned.question
+                self._last_question_tech = planned.technology
+                yield response
+                return
+        
+        # Generate next question, using the prefetched one unless the answer needs a live follow-up
         if self.candidate.tech_stack:
             tech = self.candidate.tech_stack[self.current_tech_index % len(self.candidate.tech_stack)]
-            prompt = generate_followup_question_prompt(tech, user_input, self.candidate.years_experience or 0)
-            response = self.client.generate_content(prompt)
+            prefetch = None if self._needs_adaptive_followup(user_input) else self._take_prefetch(tech)
+            self._discard_prefetch()
+            
+            prefetched = None
+            if prefetch is not None:
+                # The prefetch has a head start on any live call, so wait for it until the deadline
+                prefetched = yield LLMRequest("", PromptType.PREFETCH_QUESTION, display=False, pending=prefetch)
             
-            self.current_tech_index += 1
+            if not self._is_failed_response(prefetched):
+                response = f"Thanks for your answer! {prefetched.strip()}"
+                yield response
+            else:
+                # The answer is quoted on its own, so the context leaves it out
+                prompt = generate_followup_question_prompt(
+                    tech, clip_to_tokens(user_input, CONTEXT_MESSAGE_TOKEN_LIMIT),
+                    self.candidate.years_experience or 0, self.context.render(skip_latest=1)
+                )
+                # Keyed by the answer, so only a resent answer can pick up a follow-up that arrived late
+                response = yield LLMRequest(prompt, PromptType.FOLLOWUP, fallback=self._generate_fallback_followup(tech),
+                                            profile=FOLLOWUP_QUESTION_PROFILE,
+                                            reuse_key=f"{PromptType.FOLLOWUP}:{tech}:{hash(user_input)}")
+            
+            # Queued questions pick their own technology; stay on this one until then
+            if not self.question_queue:
+                self.current_tech_index += 1
             self.add_to_history("assistant", response)
-            return response
+            self._last_question = response
+            self._last_question_tech = tech
+            self._start_prefetch(response)
+            return
         
-        return "Thank you for your answer. Let's continue."
+        yield "Thank you for your answer. Let's continue."
     
-    def _handle_wrap_up(self, user_input: str) -> str:
+    def _handle_wrap_up(self, user_input: str) -> TurnSteps:
         """Handle wrap-up phase."""
         self.add_to_history("user", user_input)
         
         # Check if they have a question
-        if "?" in user_input or any(word in user_input.lower() for word in ["what", "when", "where", "how", "why", "who"]):
+        if intent_classifier.classify(user_input).intent == Intent.QUESTION:
             # Generate answer to their question
-            context = f"The candidate asked: {user_input}\n\nProvide a brief, helpful answer about the hiring process, timeline, or next steps. Keep it professional and encouraging."
-            response = self.client.generate_content(context)
-            response += "\n\nIs there anything else you'd like to know?"
+            conversation = self.context.render(skip_latest=1)
+            context = (f"{conversation}\n\n" if conversation else "") + \
+                      f"The candidate asked: {clip_to_tokens(user_input, CONTEXT_MESSAGE_TOKEN_LIMIT)}\n\nProvide a brief, helpful answer about the hiring process, timeline, or next steps. Keep it professional and encouraging."
+            answer = yield LLMRequest(context, PromptType.WRAP_UP_ANSWER, fallback=self._generate_fallback_process_answer(),
+                                      profile=GenerationProfile.SHORT_REPLY)
+            follow_up = "\n\nIs there anything else you'd like to know?"
+            yield follow_up
+            response = answer + follow_up
         else:
             # Final goodbye
             response = (f"Thank you so much for your time today, {self.candidate.full_name}!\n\n"
@@ -301,9 +1072,9 @@ class ConversationManager:
                        f"Have a wonderful day!\n\n"
                        f"Best regards,\nTalentScout Team")
             self.state = ConversationState.ENDED
+            yield response
         
         self.add_to_history("assistant", response)
-        return response
     
     def get_state_description(self) -> str:
         """Get human-readable state description."""
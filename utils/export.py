@@ -0,0 +1,277 @@
+"""Streaming export of candidates and transcripts to JSONL, CSV and Parquet.
+
+Export every completed interview in the session store with:
+
+    python -m utils.export --format jsonl --output candidates.jsonl
+
+Records are produced and written one at a time (Parquet buffers one row
+group), so memory use does not grow with the number of interviews.
+"""
+from typing import List, Dict, Optional, Iterable, Iterator, Any, IO
+from config.settings import ConversationState, EXPORT_ROW_GROUP_SIZE
+import argparse
+import csv
+import io
+import json
+import sys
+
+
+class ExportFormat:
+    """Enum for export file formats."""
+    JSONL = "jsonl"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+EXPORT_MIME_TYPES = {
+    ExportFormat.JSONL: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+# Flat columns shared by CSV and Parquet, in output order
+COLUMNS = [
+    "session", "state", "full_name", "email", "phone", "years_experience", "desired_positions",
+    "current_location", "tech_stack", "answer_count", "average_score", "scored_answers", "transcript",
+]
+
+
+def candidate_record(snapshot: Dict[str, Any], messages: Optional[List[Dict[str, str]]] = None,
+                     session: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build one export record from a serialized interview.
+
+    Args:
+        snapshot: Output of ``ConversationManager.to_dict``
+        messages: Transcript shown to the candidate
+        session: Session token, if the interview has one
+
+    Returns:
+        Record with the candidate's fields, scored answers and transcript
+    """
+    candidate = snapshot.get("candidate", {})
+    answers = candidate.get("scored_answers") or []
+    scores = [answer["score"] for answer in answers if answer.get("score") is not None]
+    return {
+        "session": session,
+        "state": snapshot.get("state"),
+        "full_name": candidate.get("full_name"),
+        "email": candidate.get("email"),
+        "phone": candidate.get("phone"),
+        "years_experience": candidate.get("years_experience"),
+        "desired_positions": candidate.get("desired_positions") or [],
+        "current_location": candidate.get("current_location"),
+        "tech_stack": candidate.get("tech_stack") or [],
+        "answer_count": len(answers),
+        "average_score": round(sum(scores) / len(scores), 2) if scores else None,
+        "scored_answers": [
+            {key: answer.get(key) for key in ("technology", "question", "answer", "score", "feedback")}
+            for answer in answers
+        ],
+        "transcript": [{"role": m["role"], "content": m["content"]} for m in messages or []],
+    }
+
+
+def session_records(store, completed_only: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Stream export records for the interviews in a session store.
+
+    Args:
+        store: SessionStore to read
+        completed_only: Skip interviews that have not ended
+
+    Yields:
+        One record per interview
+    """
+    for token, snapshot in store.iter_snapshots():
+        manager = snapshot.get("manager", {})
+        if completed_only and manager.get("state") != ConversationState.ENDED:
+            continue
+        yield candidate_record(manager, snapshot.get("messages"), session=token)
+
+
+def iter_jsonl(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as JSON lines, one line per record."""
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _flat_row(record: Dict[str, Any]) -> List[Any]:
+    """Flatten a record for CSV: lists joined, nested values as JSON."""
+    row = []
+    for column in COLUMNS:
+        value = record.get(column)
+        if column in ("desired_positions", "tech_stack"):
+            value = "; ".join(value)
+        elif column in ("scored_answers", "transcript"):
+            value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        row.append("" if value is None else value)
+    return row
+
+
+def iter_csv(records: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialize records as CSV text, header first, one chunk per row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in _rows(records):
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _rows(records: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+    """The header row followed by one flat row per record."""
+    yield COLUMNS
+    for record in records:
+        yield _flat_row(record)
+
+
+def _parquet_schema():
+    """Column types for Parquet; nested values stay nested."""
+    import pyarrow as pa
+
+    text_list = pa.list_(pa.string())
+    return pa.schema([
+        ("session", pa.string()),
+        ("state", pa.string()),
+        ("full_name", pa.string()),
+        ("email", pa.string()),
+        ("phone", pa.string()),
+        ("years_experience", pa.int32()),
+        ("desired_positions", text_list),
+        ("current_location", pa.string()),
+        ("tech_stack", text_list),
+        ("answer_count", pa.int32()),
+        ("average_score", pa.float64()),
+        ("scored_answers", pa.list_(pa.struct([
+            ("technology", pa.string()),
+            ("question", pa.string()),
+            ("answer", pa.string()),
+            ("score", pa.int32()),
+            ("feedback", pa.string()),
+        ]))),
+        ("transcript", pa.list_(pa.struct([("role", pa.string()), ("content", pa.string())]))),
+    ])
+
+
+def write_parquet(records: Iterable[Dict[str, Any]], sink: Any, row_group_size: int = EXPORT_ROW_GROUP_SIZE) -> int:
+    """
+    Write records to Parquet, buffering at most one row group.
+
+    Requires ``pyarrow``, which is an optional dependency.
+
+    Args:
+        records: Records to write
+        sink: File path or binary file object
+        row_group_size: Records per row group
+
+    Returns:
+        Number of records written
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = _parquet_schema()
+    count = 0
+    batch: List[Dict[str, Any]] = []
+    with pq.ParquetWriter(sink, schema) as writer:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= row_group_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch or not count:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def parquet_available() -> bool:
+    """Check whether the optional Parquet dependency is installed."""
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def export_records(records: Iterable[Dict[str, Any]], fmt: str, sink: IO) -> int:
+    """
+    Stream records to an open file in the given format.
+
+    Args:
+        records: Records to write
+        fmt: ExportFormat value
+        sink: Text file for JSONL and CSV (opened with ``newline=""``), binary file for Parquet
+
+    Returns:
+        Number of records written
+    """
+    if fmt == ExportFormat.PARQUET:
+        return write_parquet(records, sink)
+    serializers = {ExportFormat.JSONL: iter_jsonl, ExportFormat.CSV: iter_csv}
+    if fmt not in serializers:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    for chunk in serializers[fmt](counted()):
+        sink.write(chunk)
+    return count
+
+
+def export_bytes(records: Iterable[Dict[str, Any]], fmt: str) -> bytes:
+    """Export records into memory, for single-session downloads."""
+    if fmt == ExportFormat.PARQUET:
+        buffer = io.BytesIO()
+        write_parquet(records, buffer)
+        return buffer.getvalue()
+    text = io.StringIO(newline="")
+    export_records(records, fmt, text)
+    return text.getvalue().encode("utf-8")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for bulk exports from the session store."""
+    from utils.session_store import session_store
+
+    parser = argparse.ArgumentParser(description="Export stored interviews.")
+    parser.add_argument("--format", choices=[ExportFormat.JSONL, ExportFormat.CSV, ExportFormat.PARQUET],
+                        default=ExportFormat.JSONL)
+    parser.add_argument("--output", help="File to write (defaults to stdout for JSONL and CSV)")
+    parser.add_argument("--all", action="store_true", help="Include interviews that have not ended")
+    args = parser.parse_args(argv)
+
+    if session_store is None:
+        parser.error("SESSION_STORE_PATH is not set")
+    if args.format == ExportFormat.PARQUET and not parquet_available():
+        parser.error("Parquet export requires pyarrow (pip install pyarrow)")
+    records = session_records(session_store, completed_only=not args.all)
+    if args.format == ExportFormat.PARQUET:
+        if not args.output:
+            parser.error("--output is required for parquet")
+        count = write_parquet(records, args.output)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            count = export_records(records, args.format, f)
+    else:
+        count = export_records(records, args.format, sys.stdout)
+    print(f"Exported {count} interviews", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Local extraction of candidate details from free-form messages."""
+from typing import List, Dict, Optional, Any, Iterable
+from pydantic import ValidationError
+from models import CandidateInfo
+from utils.tech_stack import tech_normalizer, MatchMethod
+import re
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE = re.compile(r"(?<![\w@])\+?\d[\d\s().-]{6,}\d(?![\w@])")
+_YEARS = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE)
+_SEGMENT_SPLIT = re.compile(r"[,;\n|]")
+_TECH_SPLIT = re.compile(r"\s*(?:/|&|\band\b)\s*", re.IGNORECASE)
+
+# Lead-ins that say which field a segment holds
+_NAME_LEAD = re.compile(r"^(?:(?:hi|hello|hey)\b[\s,!.]*)?(?:my name is|my name's|i am|i'm|this is|name:)\s+", re.IGNORECASE)
+_LOCATION_LEAD = re.compile(r"^(?:i'm |i am )?(?:currently )?(?:based in|located in|living in|live in|from|in|location:)\s+", re.IGNORECASE)
+_TECH_LEAD = re.compile(
+    r"^(?:my (?:tech )?stack (?:is|includes)|i (?:mostly |mainly )?(?:work|code|program) (?:with|in)|"
+    r"i (?:mostly |mainly )?use|(?:tech )?stack:|skills:)\s+",
+    re.IGNORECASE
+)
+_POSITION_LEAD = re.compile(r"^(?:i'm |i am )?(?:applying for|looking for|interested in|position:|role:)\s+(?:an? |the )?", re.IGNORECASE)
+_GREETING = re.compile(r"^(?:hi|hello|hey|hi there|thanks|thank you|sure|ok|okay)$", re.IGNORECASE)
+_EXPERIENCE_FILLER = re.compile(r"\b(?:of|with|have|i|professional|experience|exp)\b", re.IGNORECASE)
+
+_ROLE_WORDS = re.compile(
+    r"\b(?:engineer|developer|programmer|architect|manager|scientist|analyst|designer|lead|intern|"
+    r"devops|sre|backend|back-end|frontend|front-end|full[- ]?stack|consultant|administrator|tester|qa)\b",
+    re.IGNORECASE
+)
+# Leading words that describe a role rather than name it ("mostly as a backend engineer")
+_ROLE_FILLER = re.compile(
+    r"^(?:(?:mostly|mainly|currently|now|working|work|worked|as|an?|the|i'm|i am|i)\s+)+", re.IGNORECASE
+)
+_NAME = re.compile(r"^[A-Za-z][A-Za-z\-.']*(?:\s+[A-Za-z][A-Za-z\-.']*){1,3}$")
+_PLACE = re.compile(r"^[A-Za-z][A-Za-z\s\-.']*$")
+# Where a place stops and the rest of a sentence begins ("New York and have 3 years ...")
+_CLAUSE = re.compile(r"\s+(?:and|or|but|with|since|because|where|who|have|has|had)\b.*$", re.IGNORECASE)
+
+
+def _known_techs(segment: str) -> Optional[List[str]]:
+    """Canonical names if every part of ``segment`` is a recognized technology."""
+    parts = [part for part in _TECH_SPLIT.split(segment) if part]
+    matches = [tech_normalizer.normalize(part) for part in parts]
+    if not matches or any(match.method == MatchMethod.UNKNOWN for match in matches):
+        return None
+    if any(match.confidence < 0.9 for match in matches):
+        return None
+    return [match.canonical for match in matches]
+
+
+def extract_candidate_fields(text: str, skip: Iterable[str] = (), labelled_only: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Pull every recognizable CandidateInfo field out of a message.
+
+    The message is split into comma, semicolon or line separated segments.
+    Emails, phone numbers and "N years" are found by pattern anywhere in a
+    segment; what is left of each segment is then read as technologies,
+    a position, a name or a location, in that order of precedence. Adjacent
+    leftover segments form one location ("San Francisco, CA"); text left
+    over after removing an email or phone number is never read as a name
+    or a place.
+
+    Args:
+        text: The candidate's message
+        skip: Fields already known, which are not extracted again
+        labelled_only: Of ``full_name``, ``tech_stack`` and ``current_location``, those
+            only taken from segments that introduce them ("I'm Ada Lovelace", "my stack
+            is Go, Rust", "based in Berlin"); an unlabelled location is then only taken
+            from a segment that is nothing but a place and could not be a name
+
+    Returns:
+        Validated field values keyed by CandidateInfo field name
+    """
+    skip = set(skip)
+    labelled_only = set(labelled_only)
+    fields: Dict[str, Any] = {}
+    techs: List[str] = []
+    # Whether the previous segment carried technologies introduced as such, so a listed stack carries on
+    tech_run = False
+    positions: List[str] = []
+    # Possible places as (segment index, text, introduced as a place, doubtful)
+    leftovers: List[tuple] = []
+
+    for index, segment in enumerate(_SEGMENT_SPLIT.split(text)):
+        segment = segment.strip(" \t.!")
+        if not segment:
+            continue
+
+        # Set once an email or phone number is cut out, leaving a sentence fragment
+        had_contact = False
+        email = _EMAIL.search(segment)
+        if email and "email" not in fields:
+            fields["email"] = email.group(0)
+            segment = (segment[:email.start()] + segment[email.end():]).strip(" \t.!:-")
+            had_contact = True
+        phone = _PHONE.search(segment)
+        if phone and "phone" not in fields and not _YEARS.match(segment, phone.start()):
+            fields["phone"] = phone.group(0).strip()
+            segment = (segment[:phone.start()] + segment[phone.end():]).strip(" \t.!:-")
+            had_contact = True
+        years = _YEARS.search(segment)
+        if years and "years_experience" not in fields:
+            fields["years_experience"] = int(years.group(1))
+            rest = segment[:years.start()] + segment[years.end():]
+            segment = _EXPERIENCE_FILLER.sub("", rest).strip(" \t.!:-")
+        if not segment or _GREETING.match(segment):
+            tech_run = False
+            continue
+
+        tech_lead = _TECH_LEAD.match(segment)
+        known = _known_techs(segment[tech_lead.end():] if tech_lead else segment)
+        tech_run = bool(known) and (tech_lead is not None or tech_run)
+        if known:
+            if tech_run or "tech_stack" not in labelled_only:
+                techs.extend(tech for tech in known if tech not in techs)
+            continue
+
+        position_lead = _POSITION_LEAD.match(segment)
+        if position_lead or _ROLE_WORDS.search(segment):
+            role = _ROLE_FILLER.sub("", segment[position_lead.end():] if position_lead else segment)
+            if role:
+                positions.append(role)
+            continue
+
+        name_lead = _NAME_LEAD.match(segment)
+        after_name_lead = segment[name_lead.end():] if name_lead else segment
+        location_lead = _LOCATION_LEAD.match(after_name_lead)
+        if location_lead:
+            # "I'm based in Berlin" introduces a place, not a name
+            place = _CLAUSE.sub("", after_name_lead[location_lead.end():]).strip()
+            if _PLACE.match(place):
+                leftovers.append((index, place, True, False))
+        elif name_lead:
+            fields.setdefault("full_name", segment[name_lead.end():].strip())
+        elif had_contact:
+            continue
+        elif ("full_name" not in fields and "full_name" not in skip and "full_name" not in labelled_only
+              and not leftovers and _NAME.match(segment)):
+            fields["full_name"] = segment
+        else:
+            place = _CLAUSE.sub("", segment)
+            if _PLACE.match(place):
+                # Out of turn a place must be nothing but a place, and not something that could be the name
+                doubtful = "current_location" in labelled_only and (
+                    place != segment or ("full_name" not in fields and bool(_NAME.match(place)))
+                )
+                leftovers.append((index, place, False, doubtful))
+
+    if techs:
+        fields["tech_stack"] = techs
+    if positions:
+        fields["desired_positions"] = positions
+    runs: List[List[tuple]] = []
+    for entry in leftovers:
+        if runs and not entry[2] and entry[0] == runs[-1][-1][0] + 1:
+            runs[-1].append(entry)
+        else:
+            runs.append([entry])
+    # The location is the run introduced as such, otherwise the first one with nothing doubtful in it
+    run = next((run for run in runs if run[0][2]), None) or next(
+        (run for run in runs if not any(doubtful for *_, doubtful in run)), None
+    )
+    if run:
+        fields["current_location"] = ", ".join(place for _, place, _, _ in run)
+
+    return _validate({name: value for name, value in fields.items() if name not in skip})
+
+
+def _validate(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the fields together, dropping any that fail."""
+    while fields:
+        try:
+            candidate = CandidateInfo.model_validate(fields)
+        except ValidationError as e:
+            invalid = {error["loc"][0] for error in e.errors() if error["loc"]}
+            if not invalid & fields.keys():
+                return {}
+            fields = {name: value for name, value in fields.items() if name not in invalid}
+            continue
+        return {name: getattr(candidate, name) for name in fields}
+    return {}
@@ -1,27 +1,426 @@
 """Gemini API client wrapper."""
 import google.generativeai as genai
-from typing import List, Dict, Optional
-from config.settings import GEMINI_API_KEY, GEMINI_MODEL, TEMPERATURE, MAX_OUTPUT_TOKENS
+from google.generativeai import client as genai_client
+from typing import List, Dict, Optional, Iterator, Generator, Callable, Awaitable, Any, Tuple
+from collections import deque, OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from config.settings import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+    GenerationProfile,
+    GENERATION_PROFILES,
+    LLM_MAX_CONCURRENCY,
+    LLM_BACKEND,
+    LOCAL_BACKEND_SEED,
+    LOCAL_BACKEND_LATENCY_MEDIAN_SECONDS,
+    LOCAL_BACKEND_LATENCY_SIGMA,
+    LOCAL_BACKEND_FAILURE_RATE,
+    LOCAL_BACKEND_RATE_LIMIT_RATE,
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_PATH,
+    CACHEABLE_PROMPT_TYPES,
+    BACKGROUND_PROMPT_TYPES
+)
+from utils.llm_backends import LLMBackend, LocalBackend, estimate_tokens
+from utils.metrics import LLMCallRecord, llm_metrics
+from utils.resilience import (
+    ErrorClass,
+    classify_error,
+    backoff_delay,
+    retry_budget,
+    circuit_breaker
+)
+from utils.rate_limiter import Priority, rate_limiter
+from utils.hedging import hedge_policy
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
 import time
 
 
+class ErrorResponse(str):
+    """Text returned in place of a generated response when the call failed."""
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker is rejecting calls to the API."""
+
+
+class AsyncConcurrencyLimiter:
+    """
+    Process-wide cap on in-flight async calls.
+    
+    Unlike ``asyncio.Semaphore`` this is not bound to a single event loop, so
+    every session in the process shares one limit no matter which loop it
+    awaits from.
+    """
+    
+    def __init__(self, limit: int):
+        """
+        Initialize the limiter.
+        
+        Args:
+            limit: Maximum number of concurrent holders
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+        self.limit = limit
+        self._in_flight = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+    
+    @property
+    def waiting(self) -> int:
+        """Number of calls queued for a slot."""
+        return len(self._waiters)
+    
+    async def acquire(self):
+        """Wait until a slot is free and take it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, waiter))
+                except ValueError:
+                    # Already handed a slot; _grant passes it on
+                    pass
+            raise
+    
+    def release(self):
+        """Give the slot back, handing it straight to the next waiter."""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._grant, waiter)
+                    return
+                except RuntimeError:
+                    # Waiter's loop has been closed
+                    continue
+            self._in_flight -= 1
+    
+    def _grant(self, waiter: asyncio.Future):
+        """Wake a waiter on its own loop, or pass the slot on if it gave up."""
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(None)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for generated responses.
+    
+    Entries live in an in-memory LRU with a TTL; when ``disk_path`` is set
+    they are also written to a SQLite file so they survive restarts.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400,
+                 disk_path: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in memory
+            ttl_seconds: Lifetime of an entry
+            disk_path: Optional SQLite file for the persistent tier
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    @staticmethod
+    def make_key(prompt: str, generation_config: Optional[Dict] = None) -> str:
+        """
+        Build a cache key from a normalized prompt and generation config.
+        
+        Args:
+            prompt: The prompt text
+            generation_config: Settings the response was generated with
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        normalized = re.sub(r'\s+', ' ', prompt).strip().lower()
+        config = json.dumps(generation_config or {}, sort_keys=True)
+        return hashlib.sha256(f"{config}\n{normalized}".encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key`` or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] > now:
+                    self._remember(key, row[0], row[1])
+                    self.disk_hits += 1
+                    return row[0]
+            
+            self.misses += 1
+            return None
+    
+    def set(self, key: str, value: str):
+        """Store ``value`` under ``key`` in every tier."""
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+                self._db.commit()
+    
+    def clear(self):
+        """Drop every entry from every tier."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the in-memory size."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+        }
+    
+    def _remember(self, key: str, value: str, expires_at: float):
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SingleFlight:
+    """
+    Coalesces identical requests that are in flight at the same time.
+    
+    The first caller for a key becomes the leader and makes the upstream
+    call; callers that arrive before it finishes wait on the leader's future
+    and share its result. Futures are thread-safe, so blocking and async
+    callers can join the same flight.
+    """
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self.coalesced = 0
+        self._flights: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    def join(self, key: str) -> Tuple[Future, bool]:
+        """
+        Join the flight for ``key``, starting one if none is in progress.
+        
+        Args:
+            key: Identity of the request
+            
+        Returns:
+            Tuple of the flight's future and whether the caller is its leader
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._flights[key] = future
+            return future, True
+    
+    def finish(self, key: str, future: Future, result: str):
+        """Land the leader's flight, handing ``result`` to every waiter."""
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+        if not future.done():
+            future.set_result(result)
+    
+    def stats(self) -> Dict[str, int]:
+        """Return the number of flights in progress and of coalesced callers."""
+        return {"in_flight": len(self._flights), "coalesced": self.coalesced}
+
+
+def get_generation_config(profile: Optional[str] = None) -> Dict:
+    """
+    Return the generation config for a named profile.
+    
+    Args:
+        profile: One of the GenerationProfile values; None for the default
+        
+    Returns:
+        Generation config dict, without empty stop sequences
+    """
+    settings = GENERATION_PROFILES.get(profile or GenerationProfile.DEFAULT)
+    if settings is None:
+        raise ValueError(f"Unknown generation profile: {profile}")
+    return {key: value for key, value in settings.items() if value != []}
+
+
+DEFAULT_GENERATION_CONFIG = get_generation_config()
+
+_model_lock = threading.Lock()
+_configured = False
+_shared_models: Dict[str, genai.GenerativeModel] = {}
+
+
+def get_shared_model(generation_config: Dict) -> genai.GenerativeModel:
+    """
+    Return the process-wide model for a generation config.
+    
+    ``genai.configure`` resets the SDK's cached transports, so it is only
+    called once per process; models are stateless and shared by every
+    session, while chat state stays on each GeminiClient.
+    
+    Args:
+        generation_config: Settings the model generates with
+        
+    Returns:
+        A configured GenerativeModel
+    """
+    global _configured
+    key = json.dumps(generation_config, sort_keys=True)
+    model = _shared_models.get(key)
+    if model is not None:
+        return model
+    
+    with _model_lock:
+        if not _configured:
+            if not GEMINI_API_KEY:
+                raise ValueError("GEMINI_API_KEY not found in environment variables")
+            genai.configure(api_key=GEMINI_API_KEY)
+            _configured = True
+        
+        model = _shared_models.get(key)
+        if model is None:
+            model = genai.GenerativeModel(
+                model_name=GEMINI_MODEL,
+                generation_config=generation_config
+            )
+            _shared_models[key] = model
+        return model
+
+
+_local_backend: Optional[LocalBackend] = None
+
+
+def get_backend(generation_config: Dict) -> LLMBackend:
+    """
+    Return the process-wide backend selected by ``LLM_BACKEND``.
+    
+    Args:
+        generation_config: Settings the model generates with
+        
+    Returns:
+        The shared Gemini model, or the shared local backend
+    """
+    global _local_backend
+    if LLM_BACKEND != "local":
+        return get_shared_model(generation_config)
+    
+    with _model_lock:
+        if _local_backend is None:
+            _local_backend = LocalBackend(
+                seed=LOCAL_BACKEND_SEED,
+                latency_median=LOCAL_BACKEND_LATENCY_MEDIAN_SECONDS,
+                latency_sigma=LOCAL_BACKEND_LATENCY_SIGMA,
+                failure_rate=LOCAL_BACKEND_FAILURE_RATE,
+                rate_limit_rate=LOCAL_BACKEND_RATE_LIMIT_RATE
+            )
+        return _local_backend
+
+
+def warm_up():
+    """Configure the SDK, build the default model and open its transport."""
+    get_backend(DEFAULT_GENERATION_CONFIG)
+    if LLM_BACKEND != "local":
+        genai_client.get_default_generative_client()
+
+
+# Shared by every GeminiClient in the process
+async_limiter = AsyncConcurrencyLimiter(LLM_MAX_CONCURRENCY)
+response_cache = ResponseCache(
+    max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=RESPONSE_CACHE_TTL_SECONDS,
+    disk_path=RESPONSE_CACHE_PATH or None
+) if RESPONSE_CACHE_ENABLED else None
+single_flight = SingleFlight()
+
+# Returned to callers sharing a flight whose leader gave up before finishing
+_ABANDONED_FLIGHT = "Error generating content: the shared request was abandoned"
+
+# Finish reason recorded for streams that broke off after text was delivered
+_INTERRUPTED = "INTERRUPTED"
+
+
 class GeminiClient:
     """Wrapper for Google Gemini API."""
     
-    def __init__(self):
-        """Initialize the Gemini client."""
-        if not GEMINI_API_KEY:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        genai.configure(api_key=GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(
-            model_name=GEMINI_MODEL,
-            generation_config={
-                "temperature": TEMPERATURE,
-                "max_output_tokens": MAX_OUTPUT_TOKENS,
-            }
-        )
+    def __init__(self, cache: Optional[ResponseCache] = None, backend: Optional[LLMBackend] = None):
+        """
+        Initialize the Gemini client.
+        
+        Args:
+            cache: Response cache to use; defaults to the shared process cache
+            backend: Model backend to call; defaults to the one set by LLM_BACKEND
+        """
+        self.generation_config = DEFAULT_GENERATION_CONFIG
+        self.model = backend if backend is not None else get_backend(self.generation_config)
         self.chat = None
+        self.cache = cache if cache is not None else response_cache
     
     def start_chat(self, history: Optional[List[Dict]] = None):
         """Start a new chat session."""
@@ -49,72 +448,522 @@ class GeminiClient:
         Returns:
             The response text
         """
-        for attempt in range(retry_count):
+        if self.chat is None:
+            self.start_chat()
+        
+        with self._track("send_message") as record:
             try:
-                if self.chat is None:
-                    self.start_chat()
-                
-                response = self.chat.send_message(message)
-                
-                # Extract text from response - handle both simple and multi-part responses
-                result_text = self._extract_text_from_response(response)
-                if result_text:
-                    return result_text
-                
-                # If we still can't get text, return fallback
-                return "I apologize, but I couldn't generate a proper response. Please try again."
-            
+                response = self._call_with_retries(
+                    lambda: self.chat.send_message(message), retry_count, record, message
+                )
             except Exception as e:
-                if attempt < retry_count - 1:
-                    time.sleep(1)  # Wait before retry
-                    continue
-                else:
-                    return f"I apologize, but I'm having trouble processing your request. Please try again. Error: {str(e)}"
+                return self._observe(record, None, ErrorResponse(
+                    f"I apologize, but I'm having trouble processing your request. Please try again. Error: {str(e)}"
+                ))
+            
+            # Extract text from response - handle both simple and multi-part responses
+            result_text = self._extract_text_from_response(response)
+            if result_text:
+                return self._observe(record, response, result_text)
+            
+            # If we still can't get text, return fallback
+            return self._observe(record, response, ErrorResponse(
+                "I apologize, but I couldn't generate a proper response. Please try again."
+            ))
     
-    def generate_content(self, prompt: str, retry_count: int = 3) -> str:
+    def generate_content(self, prompt: str, retry_count: int = 3,
+                         prompt_type: Optional[str] = None, profile: Optional[str] = None) -> str:
         """
         Generate content from a prompt without chat context.
         
         Args:
             prompt: The prompt to generate from
             retry_count: Number of retries on failure
+            prompt_type: Kind of prompt, used to decide whether it is cacheable
+            profile: Generation profile to use; defaults to GenerationProfile.DEFAULT
             
         Returns:
             The generated text
         """
-        for attempt in range(retry_count):
+        with self._track("generate_content", prompt_type) as record:
+            config = get_generation_config(profile)
+            cache_key = self._cache_key(prompt, prompt_type, config)
+            if not cache_key:
+                return self._generate(prompt, config, retry_count, record, None)
+            
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                record.cached = True
+                return cached
+            
+            # Identical cacheable calls already in flight share one upstream request
+            future, leader = single_flight.join(cache_key)
+            if not leader:
+                record.coalesced = True
+                return future.result()
+            
+            result = ErrorResponse(_ABANDONED_FLIGHT)
             try:
-                response = self.model.generate_content(prompt)
-                
-                # Check for blocked content or safety issues
-                if hasattr(response, 'prompt_feedback'):
-                    print(f"Prompt feedback: {response.prompt_feedback}")
-                
-                # Extract text from response - handle both simple and multi-part responses
-                result_text = self._extract_text_from_response(response)
-                if result_text:
-                    return result_text
-                
-                # Check finish reason
-                if hasattr(response, 'candidates') and response.candidates:
-                    candidate = response.candidates[0]
-                    if hasattr(candidate, 'finish_reason'):
-                        print(f"Finish reason: {candidate.finish_reason}")
-                        if candidate.finish_reason == 3:  # SAFETY
-                            return "I apologize, but I need to rephrase that question. Let me ask you something else about your technical experience."
-                        elif candidate.finish_reason == 2:  # MAX_TOKENS
-                            return "Let me ask you a more focused question about your experience."
-                
-                # If we still can't get text, return fallback
-                return "I apologize, but I couldn't generate a proper response. Please try again."
-                
+                result = self._generate(prompt, config, retry_count, record, cache_key)
+                return result
+            finally:
+                single_flight.finish(cache_key, future, result)
+    
+    def _generate(self, prompt: str, config: Dict, retry_count: int, record: LLMCallRecord,
+                  cache_key: Optional[str]) -> str:
+        """Make the upstream call for ``generate_content`` and cache a successful result."""
+        try:
+            response = self._call_with_retries(
+                lambda: self.model.generate_content(prompt, generation_config=config),
+                retry_count, record, prompt
+            )
+        except Exception as e:
+            return self._observe(record, None, ErrorResponse(f"Error generating content: {str(e)}"))
+        
+        # Extract text from response - handle both simple and multi-part responses
+        result_text = self._extract_text_from_response(response)
+        if result_text:
+            if cache_key:
+                self.cache.set(cache_key, result_text)
+            return self._observe(record, response, result_text)
+        
+        return self._observe(record, response, self._empty_response_message(response))
+    
+    def send_message_stream(self, message: str, retry_count: int = 3) -> Iterator[str]:
+        """
+        Send a message and yield the response text as it is generated.
+        
+        Retries only happen before the first chunk is delivered; once text
+        has been yielded a failure ends the stream with what was produced.
+        
+        Args:
+            message: The message to send
+            retry_count: Number of retries on failure
+            
+        Yields:
+            Chunks of response text
+        """
+        if self.chat is None:
+            self.start_chat()
+        
+        with self._track("send_message_stream") as record:
+            try:
+                response, first_text, chunks = self._call_with_retries(
+                    lambda: self._open_stream(self.chat.send_message(message, stream=True)),
+                    retry_count, record, message
+                )
             except Exception as e:
-                print(f"Error in generate_content (attempt {attempt + 1}): {str(e)}")
-                if attempt < retry_count - 1:
-                    time.sleep(1)
-                    continue
-                else:
-                    return f"Error generating content: {str(e)}"
+                yield self._observe(record, None, ErrorResponse(
+                    f"I apologize, but I'm having trouble processing your request. Please try again. Error: {str(e)}"
+                ))
+                return
+            
+            if first_text is None:
+                yield self._observe(record, response, ErrorResponse(
+                    "I apologize, but I couldn't generate a proper response. Please try again."
+                ))
+                return
+            
+            record.first_token_seconds = record.elapsed()
+            yield first_text
+            completed = yield from self._drain_stream(chunks)
+            self._observe(record, response, first_text)
+            if not completed:
+                record.finish_reason = _INTERRUPTED
+    
+    def generate_content_stream(self, prompt: str, retry_count: int = 3,
+                                prompt_type: Optional[str] = None,
+                                profile: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate content from a prompt, yielding text as it is generated.
+        
+        Retries only happen before the first chunk is delivered; once text
+        has been yielded a failure ends the stream with what was produced.
+        
+        Args:
+            prompt: The prompt to generate from
+            retry_count: Number of retries on failure
+            prompt_type: Kind of prompt, used to decide whether it is cacheable
+            profile: Generation profile to use; defaults to GenerationProfile.DEFAULT
+            
+        Yields:
+            Chunks of generated text
+        """
+        with self._track("generate_content_stream", prompt_type) as record:
+            config = get_generation_config(profile)
+            cache_key = self._cache_key(prompt, prompt_type, config)
+            if not cache_key:
+                yield from self._generate_stream(prompt, config, retry_count, record, None)
+                return
+            
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                record.cached = True
+                record.first_token_seconds = record.elapsed()
+                yield cached
+                return
+            
+            # Callers joining an in-flight stream get the whole text once it is done
+            future, leader = single_flight.join(cache_key)
+            if not leader:
+                record.coalesced = True
+                result = future.result()
+                record.first_token_seconds = record.elapsed()
+                yield result
+                return
+            
+            result = ErrorResponse(_ABANDONED_FLIGHT)
+            try:
+                result = yield from self._generate_stream(prompt, config, retry_count, record, cache_key)
+            finally:
+                single_flight.finish(cache_key, future, result)
+    
+    def _generate_stream(self, prompt: str, config: Dict, retry_count: int, record: LLMCallRecord,
+                         cache_key: Optional[str]) -> Generator[str, None, str]:
+        """
+        Stream the upstream call for ``generate_content_stream``.
+        
+        Returns:
+            The full text if the stream completed, otherwise an ErrorResponse
+        """
+        try:
+            response, first_text, chunks = self._call_with_retries(
+                lambda: self._open_stream(self.model.generate_content(prompt, stream=True, generation_config=config)),
+                retry_count, record, prompt
+            )
+        except Exception as e:
+            error = self._observe(record, None, ErrorResponse(f"Error generating content: {str(e)}"))
+            yield error
+            return error
+        
+        if first_text is None:
+            error = self._observe(record, response, self._empty_response_message(response))
+            yield error
+            return error
+        
+        record.first_token_seconds = record.elapsed()
+        parts = [first_text]
+        yield first_text
+        completed = yield from self._drain_stream(chunks, parts)
+        self._observe(record, response, first_text)
+        
+        # Only complete streams are cached or shared
+        if not completed:
+            record.finish_reason = _INTERRUPTED
+            return ErrorResponse("Error generating content: the stream was interrupted")
+        text = "".join(parts)
+        if cache_key:
+            self.cache.set(cache_key, text)
+        return text
+    
+    async def send_message_async(self, message: str, retry_count: int = 3) -> str:
+        """
+        Send a message without blocking the event loop.
+        
+        Args:
+            message: The message to send
+            retry_count: Number of retries on failure
+            
+        Returns:
+            The response text
+        """
+        if self.chat is None:
+            self.start_chat()
+        
+        with self._track("send_message_async") as record:
+            try:
+                response = await self._call_with_retries_async(
+                    lambda: self.chat.send_message_async(message), retry_count, record, message
+                )
+            except Exception as e:
+                return self._observe(record, None, ErrorResponse(
+                    f"I apologize, but I'm having trouble processing your request. Please try again. Error: {str(e)}"
+                ))
+            
+            result_text = self._extract_text_from_response(response)
+            if result_text:
+                return self._observe(record, response, result_text)
+            
+            return self._observe(record, response, ErrorResponse(
+                "I apologize, but I couldn't generate a proper response. Please try again."
+            ))
+    
+    async def generate_content_async(self, prompt: str, retry_count: int = 3,
+                                     prompt_type: Optional[str] = None,
+                                     profile: Optional[str] = None) -> str:
+        """
+        Generate content from a prompt without blocking the event loop.
+        
+        Args:
+            prompt: The prompt to generate from
+            retry_count: Number of retries on failure
+            prompt_type: Kind of prompt, used to decide whether it is cacheable
+            profile: Generation profile to use; defaults to GenerationProfile.DEFAULT
+            
+        Returns:
+            The generated text
+        """
+        with self._track("generate_content_async", prompt_type) as record:
+            config = get_generation_config(profile)
+            cache_key = self._cache_key(prompt, prompt_type, config)
+            if not cache_key:
+                return await self._generate_async(prompt, config, retry_count, record, None)
+            
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                record.cached = True
+                return cached
+            
+            future, leader = single_flight.join(cache_key)
+            if not leader:
+                record.coalesced = True
+                # Shielded so a cancelled waiter does not cancel the shared flight
+                return await asyncio.shield(asyncio.wrap_future(future))
+            
+            result = ErrorResponse(_ABANDONED_FLIGHT)
+            try:
+                result = await self._generate_async(prompt, config, retry_count, record, cache_key)
+                return result
+            finally:
+                single_flight.finish(cache_key, future, result)
+    
+    async def _generate_async(self, prompt: str, config: Dict, retry_count: int, record: LLMCallRecord,
+                              cache_key: Optional[str]) -> str:
+        """Make the upstream call for ``generate_content_async`` and cache a successful result."""
+        try:
+            response = await self._call_with_retries_async(
+                lambda: self.model.generate_content_async(prompt, generation_config=config),
+                retry_count, record, prompt
+            )
+        except Exception as e:
+            return self._observe(record, None, ErrorResponse(f"Error generating content: {str(e)}"))
+        
+        result_text = self._extract_text_from_response(response)
+        if result_text:
+            if cache_key:
+                self.cache.set(cache_key, result_text)
+            return self._observe(record, response, result_text)
+        
+        return self._observe(record, response, self._empty_response_message(response))
+    
+    def _call_with_retries(self, call: Callable[[], Any], retry_count: int,
+                           record: LLMCallRecord, prompt: str = "") -> Any:
+        """
+        Run an API call under the shared retry policy, circuit breaker and rate limiter.
+        
+        Args:
+            call: Function performing one attempt
+            retry_count: Maximum number of attempts
+            record: Metrics record for the call; its retry count and queue time are updated
+            prompt: Text sent by the call, used to estimate its token cost
+            
+        Returns:
+            The result of the first successful attempt
+            
+        Raises:
+            CircuitOpenError: If the breaker is rejecting calls
+            Exception: The last error if every attempt failed
+        """
+        if not circuit_breaker.allow_request():
+            raise CircuitOpenError("Gemini API is temporarily unavailable")
+        retry_budget.record_request()
+        
+        tokens, priority = estimate_tokens(prompt), self._priority(record)
+        attempt = 0
+        while True:
+            record.queue_seconds += rate_limiter.acquire(tokens, priority)
+            try:
+                result = self._attempt(call, record, tokens)
+            except Exception as e:
+                self._record_error(record, e)
+                if not self._should_retry(e, attempt, retry_count):
+                    raise
+                time.sleep(backoff_delay(attempt, classify_error(e)))
+                attempt += 1
+                record.retries = attempt
+                continue
+            circuit_breaker.record_success()
+            return result
+    
+    async def _call_with_retries_async(self, call: Callable[[], Awaitable[Any]], retry_count: int,
+                                       record: LLMCallRecord, prompt: str = "") -> Any:
+        """
+        Async counterpart of ``_call_with_retries``.
+        
+        Each attempt holds a concurrency slot; backoff and rate limit waits do not.
+        """
+        if not circuit_breaker.allow_request():
+            raise CircuitOpenError("Gemini API is temporarily unavailable")
+        retry_budget.record_request()
+        
+        tokens, priority = estimate_tokens(prompt), self._priority(record)
+        attempt = 0
+        while True:
+            record.queue_seconds += await rate_limiter.acquire_async(tokens, priority)
+            try:
+                result = await self._attempt_async(call, record, tokens)
+            except Exception as e:
+                self._record_error(record, e)
+                if not self._should_retry(e, attempt, retry_count):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, classify_error(e)))
+                attempt += 1
+                record.retries = attempt
+                continue
+            circuit_breaker.record_success()
+            return result
+    
+    @staticmethod
+    def _record_error(record: LLMCallRecord, error: Exception):
+        """Note a failed attempt on the call's metrics record."""
+        record.failed_attempts += 1
+        record.last_error = f"{type(error).__name__}: {str(error)}"
+    
+    def _attempt(self, call: Callable[[], Any], record: LLMCallRecord, tokens: int) -> Any:
+        """Make one attempt, hedging it if its prompt type is eligible."""
+        delay = hedge_policy.delay_for(record.prompt_type)
+        if delay is None:
+            return call()
+        result, hedged = hedge_policy.run(
+            call, record.prompt_type, delay, lambda: self._can_hedge(tokens)
+        )
+        record.hedged = record.hedged or hedged
+        return result
+    
+    async def _attempt_async(self, call: Callable[[], Awaitable[Any]], record: LLMCallRecord, tokens: int) -> Any:
+        """Async counterpart of ``_attempt``; every copy holds its own concurrency slot."""
+        async def limited_call():
+            async with async_limiter:
+                return await call()
+        
+        delay = hedge_policy.delay_for(record.prompt_type)
+        if delay is None:
+            return await limited_call()
+        result, hedged = await hedge_policy.run_async(
+            limited_call, record.prompt_type, delay, lambda: self._can_hedge(tokens)
+        )
+        record.hedged = record.hedged or hedged
+        return result
+    
+    @staticmethod
+    def _can_hedge(tokens: int) -> bool:
+        """Backups only go out when the breaker is closed and the rate limit has room to spare."""
+        return circuit_breaker.state == circuit_breaker.CLOSED and rate_limiter.try_acquire(tokens)
+    
+    @staticmethod
+    def _priority(record: LLMCallRecord) -> str:
+        """Rate limiter priority class for a call."""
+        if record.prompt_type in BACKGROUND_PROMPT_TYPES:
+            return Priority.BACKGROUND
+        return Priority.INTERACTIVE
+    
+    def _should_retry(self, error: Exception, attempt: int, retry_count: int) -> bool:
+        """Record a failed attempt and decide whether another one is allowed."""
+        if classify_error(error) == ErrorClass.FATAL:
+            # The API answered; the request itself is bad
+            circuit_breaker.record_success()
+            return False
+        
+        circuit_breaker.record_failure()
+        if attempt >= retry_count - 1:
+            return False
+        return retry_budget.try_spend() and circuit_breaker.allow_request()
+    
+    def _open_stream(self, response):
+        """
+        Pull chunks until one carries text, so stream start-up can be retried.
+        
+        Returns:
+            Tuple of the response, the first text (or None) and the chunk iterator
+        """
+        chunks = iter(response)
+        for chunk in chunks:
+            chunk_text = self._extract_text_from_response(chunk)
+            if chunk_text:
+                return response, chunk_text, chunks
+        return response, None, chunks
+    
+    def _drain_stream(self, chunks, parts: Optional[List[str]] = None) -> Generator[str, None, bool]:
+        """
+        Yield the text of the remaining chunks.
+        
+        Args:
+            chunks: Iterator returned by ``_open_stream``
+            parts: Optional list that collects every yielded piece
+            
+        Returns:
+            False if the stream broke off before finishing
+        """
+        try:
+            for chunk in chunks:
+                chunk_text = self._extract_text_from_response(chunk)
+                if chunk_text:
+                    if parts is not None:
+                        parts.append(chunk_text)
+                    yield chunk_text
+        except Exception:
+            # Text already shown can't be taken back, so end with what we have;
+            # callers mark the call record as interrupted
+            circuit_breaker.record_failure()
+            return False
+        return True
+    
+    @contextmanager
+    def _track(self, method: str, prompt_type: Optional[str] = None) -> Iterator[LLMCallRecord]:
+        """Time a call and hand its record to the shared metrics when it finishes."""
+        record = LLMCallRecord(method=method, prompt_type=prompt_type)
+        try:
+            yield record
+        finally:
+            record.latency_seconds = record.elapsed()
+            llm_metrics.record(record)
+    
+    def _observe(self, record: LLMCallRecord, response, result: str) -> str:
+        """Copy usage and finish reason from a response onto its record; returns ``result``."""
+        record.fallback = isinstance(result, ErrorResponse)
+        try:
+            usage = getattr(response, 'usage_metadata', None)
+            if usage is not None:
+                record.prompt_tokens = getattr(usage, 'prompt_token_count', None)
+                record.output_tokens = getattr(usage, 'candidates_token_count', None)
+            if getattr(response, 'candidates', None):
+                finish_reason = getattr(response.candidates[0], 'finish_reason', None)
+                if finish_reason is not None:
+                    record.finish_reason = getattr(finish_reason, 'name', str(finish_reason))
+        except Exception:
+            # Metrics must never break a call
+            pass
+        # Output size is only known now; charge it to the shared token budget
+        rate_limiter.debit(record.output_tokens or 0)
+        return result
+    
+    def _cache_key(self, prompt: str, prompt_type: Optional[str], config: Dict) -> Optional[str]:
+        """Return the cache key for a prompt and config, or None if it must not be cached."""
+        if self.cache is None or prompt_type not in CACHEABLE_PROMPT_TYPES:
+            return None
+        return ResponseCache.make_key(prompt, config)
+    
+    def _empty_response_message(self, response) -> str:
+        """
+        Build the message returned when a response carries no text.
+        
+        Args:
+            response: The response object from Gemini API
+            
+        Returns:
+            A candidate-facing message based on the finish reason
+        """
+        # Check finish reason
+        if hasattr(response, 'candidates') and response.candidates:
+            candidate = response.candidates[0]
+            if hasattr(candidate, 'finish_reason'):
+                if candidate.finish_reason == 3:  # SAFETY
+                    return ErrorResponse("I apologize, but I need to rephrase that question. Let me ask you something else about your technical experience.")
+                elif candidate.finish_reason == 2:  # MAX_TOKENS
+                    return ErrorResponse("Let me ask you a more focused question about your experience.")
+        
+        # If we still can't get text, return fallback
+        return ErrorResponse("I apologize, but I couldn't generate a proper response. Please try again.")
     
     def _extract_text_from_response(self, response) -> Optional[str]:
         """
@@ -0,0 +1,218 @@
+"""Hedged requests for tail latency on interactive model calls."""
+from typing import Dict, Optional, Callable, Awaitable, Any, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config.settings import (
+    HEDGE_ENABLED,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_INITIAL_DELAY_SECONDS,
+    HEDGE_MIN_DELAY_SECONDS,
+    HEDGE_MAX_WORKERS,
+    HEDGE_PROMPT_TYPES
+)
+import asyncio
+import threading
+import time
+
+
+class HedgePolicy:
+    """
+    Sends a second copy of a call that is slower than usual.
+
+    If an attempt has not answered after the configured latency percentile
+    of its prompt type, an identical backup goes out; the first successful
+    answer wins and the other copy is cancelled. Blocking calls that are
+    already running cannot be interrupted, so their losing copy finishes in
+    the background and its result is dropped.
+
+    The delay is the percentile of the most recent attempt latencies of each
+    prompt type, interpolated between samples, and counters record how often
+    calls were hedged and how often the backup won.
+    """
+
+    def __init__(self, enabled: bool = False, prompt_types: Optional[list] = None,
+                 percentile: float = 95, min_samples: int = 20, window: int = 200,
+                 initial_delay: float = 3.0, min_delay: float = 0.25, max_workers: int = 32):
+        """
+        Initialize the policy.
+
+        Args:
+            enabled: Whether calls are hedged at all
+            prompt_types: Prompt types eligible for hedging
+            percentile: Latency percentile after which the backup is sent
+            min_samples: Attempts to observe before trusting the percentile
+            window: Recent attempts per prompt type the percentile is taken over
+            initial_delay: Delay used until enough attempts were observed
+            min_delay: Lower bound on the delay
+            max_workers: Threads running blocking hedged attempts
+        """
+        self.enabled = enabled
+        self.prompt_types = set(prompt_types or [])
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self._latency: Dict[str, deque] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def delay_for(self, prompt_type: Optional[str]) -> Optional[float]:
+        """
+        Return how long to wait before hedging a call, or None if it is not hedged.
+
+        Args:
+            prompt_type: Kind of prompt being sent
+        """
+        if not self.enabled or prompt_type not in self.prompt_types:
+            return None
+        with self._lock:
+            return self._current_delay(prompt_type)
+
+    def run(self, call: Callable[[], Any], prompt_type: str, delay: float,
+            can_hedge: Callable[[], bool]) -> Tuple[Any, bool]:
+        """
+        Run a blocking attempt, hedging it once ``delay`` has passed.
+
+        Args:
+            call: Function performing one attempt
+            prompt_type: Kind of prompt being sent
+            delay: Seconds to wait before sending the backup
+            can_hedge: Checked before sending the backup; False skips it
+
+        Returns:
+            Tuple of the winning result and whether a backup was sent
+
+        Raises:
+            Exception: The primary's error if every copy failed
+        """
+        primary = self._submit(call, prompt_type)
+        if wait([primary], timeout=delay).done or not can_hedge():
+            self._count(prompt_type, hedged=False)
+            return primary.result(), False
+
+        backup = self._submit(call, prompt_type)
+        futures = [primary, backup]
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=futures.index):
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    self._count(prompt_type, hedged=True, backup_won=future is backup)
+                    return future.result(), True
+        self._count(prompt_type, hedged=True)
+        return primary.result(), True
+
+    async def run_async(self, call: Callable[[], Awaitable[Any]], prompt_type: str, delay: float,
+                        can_hedge: Callable[[], bool]) -> Tuple[Any, bool]:
+        """Async counterpart of ``run``; the losing copy is cancelled outright."""
+        primary = self._start_task(call, prompt_type)
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not can_hedge():
+                self._count(prompt_type, hedged=False)
+                return await primary, False
+
+            backup = self._start_task(call, prompt_type)
+            tasks.append(backup)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.index):
+                    if not task.cancelled() and task.exception() is None:
+                        self._count(prompt_type, hedged=True, backup_won=task is backup)
+                        return task.result(), True
+            self._count(prompt_type, hedged=True)
+            return await primary, True
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return hedge and backup win rates by prompt type."""
+        with self._lock:
+            return {
+                prompt_type: {
+                    **counts,
+                    "hedge_rate": counts["hedged"] / counts["calls"] if counts["calls"] else 0.0,
+                    "win_rate": counts["backup_wins"] / counts["hedged"] if counts["hedged"] else 0.0,
+                    "delay_seconds": self._current_delay(prompt_type),
+                }
+                for prompt_type, counts in self._counts.items()
+            }
+
+    def _current_delay(self, prompt_type: str) -> float:
+        """Percentile-based delay for a prompt type. Must be called with the lock held."""
+        samples = self._latency.get(prompt_type)
+        if samples is None or len(samples) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(samples)
+        position = (len(ordered) - 1) * self.percentile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        estimate = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+        return max(self.min_delay, estimate)
+
+    def _submit(self, call: Callable[[], Any], prompt_type: str) -> Future:
+        """Start a blocking attempt on the hedge pool, timing it when it finishes."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="llm-hedge"
+                    )
+        future = self._executor.submit(call)
+        self._time(future, prompt_type)
+        return future
+
+    def _start_task(self, call: Callable[[], Awaitable[Any]], prompt_type: str) -> asyncio.Task:
+        """Start an async attempt, timing it when it finishes."""
+        task = asyncio.ensure_future(call())
+        self._time(task, prompt_type)
+        return task
+
+    def _time(self, future, prompt_type: str):
+        """
+        Observe an attempt's latency once it finishes.
+
+        Cancelled attempts are observed at the moment they were cancelled, so
+        slow attempts still pull the percentile up instead of vanishing.
+        """
+        started = time.perf_counter()
+
+        def observe(done):
+            if done.cancelled() or done.exception() is None:
+                with self._lock:
+                    self._latency.setdefault(prompt_type, deque(maxlen=self.window)).append(
+                        time.perf_counter() - started
+                    )
+
+        future.add_done_callback(observe)
+
+    def _count(self, prompt_type: str, hedged: bool, backup_won: bool = False):
+        with self._lock:
+            counts = self._counts.setdefault(prompt_type, {"calls": 0, "hedged": 0, "backup_wins": 0})
+            counts["calls"] += 1
+            counts["hedged"] += int(hedged)
+            counts["backup_wins"] += int(backup_won)
+
+
+# Shared by every GeminiClient in the process
+hedge_policy = HedgePolicy(
+    enabled=HEDGE_ENABLED,
+    prompt_types=HEDGE_PROMPT_TYPES,
+    percentile=HEDGE_PERCENTILE,
+    min_samples=HEDGE_MIN_SAMPLES,
+    window=HEDGE_LATENCY_WINDOW,
+    initial_delay=HEDGE_INITIAL_DELAY_SECONDS,
+    min_delay=HEDGE_MIN_DELAY_SECONDS,
+    max_workers=HEDGE_MAX_WORKERS
+)
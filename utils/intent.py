@@ -0,0 +1,255 @@
+"""Local intent classification for candidate messages.
+
+Rebuild the shipped model after editing the training examples with:
+
+    python -m utils.intent --train data/intent_training.jsonl --output data/intent_model.json
+"""
+from typing import List, Dict, Optional, Iterable, Tuple
+from dataclasses import dataclass
+from config.settings import EXIT_KEYWORDS, INTENT_MODEL_PATH
+import argparse
+import json
+import math
+import os
+import re
+
+
+class Intent:
+    """Enum for what a candidate message is trying to do."""
+    EXIT = "exit"
+    QUESTION = "question"
+    OFF_TOPIC = "off_topic"
+    ANSWER = "answer"
+
+
+@dataclass
+class IntentResult:
+    """Classified intent with a confidence between 0 and 1."""
+    intent: str
+    confidence: float
+
+
+MODEL_FORMAT_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#']+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word unigrams and bigrams."""
+    words = _TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class NaiveBayesModel:
+    """Multinomial naive Bayes over word unigrams and bigrams."""
+
+    def __init__(self, classes: List[str], log_priors: List[float],
+                 log_likelihoods: Dict[str, List[float]], log_unseen: List[float]):
+        """
+        Initialize the model.
+
+        Args:
+            classes: Class labels, in the order of every per-class list
+            log_priors: Log prior of each class
+            log_likelihoods: Per-token log likelihood under each class
+            log_unseen: Log likelihood of a token not seen in training
+        """
+        self.classes = classes
+        self.log_priors = log_priors
+        self.log_likelihoods = log_likelihoods
+        self.log_unseen = log_unseen
+
+    @classmethod
+    def train(cls, examples: Iterable[Tuple[str, str]], alpha: float = 1.0) -> "NaiveBayesModel":
+        """
+        Fit the model with Laplace smoothing.
+
+        Args:
+            examples: Pairs of (text, label)
+            alpha: Smoothing added to every token count
+
+        Returns:
+            The trained model
+        """
+        doc_counts: Dict[str, int] = {}
+        token_counts: Dict[str, Dict[str, int]] = {}
+        for text, label in examples:
+            doc_counts[label] = doc_counts.get(label, 0) + 1
+            counts = token_counts.setdefault(label, {})
+            for token in tokenize(text):
+                counts[token] = counts.get(token, 0) + 1
+
+        classes = sorted(doc_counts)
+        vocabulary = sorted({token for counts in token_counts.values() for token in counts})
+        total_docs = sum(doc_counts.values())
+        log_priors = [math.log(doc_counts[label] / total_docs) for label in classes]
+        denominators = [sum(token_counts[label].values()) + alpha * (len(vocabulary) + 1) for label in classes]
+        log_likelihoods = {
+            token: [round(math.log((token_counts[label].get(token, 0) + alpha) / denominator), 4)
+                    for label, denominator in zip(classes, denominators)]
+            for token in vocabulary
+        }
+        log_unseen = [math.log(alpha / denominator) for denominator in denominators]
+        return cls(classes, log_priors, log_likelihoods, log_unseen)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["NaiveBayesModel"]:
+        """Load a saved model, returning None if it is missing or unreadable."""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not load intent model from {path}: {str(e)}")
+            return None
+        if data.get("version") != MODEL_FORMAT_VERSION:
+            print(f"Ignoring intent model {path}: unsupported version {data.get('version')}")
+            return None
+        return cls(data["classes"], data["log_priors"], data["log_likelihoods"], data["log_unseen"])
+
+    def save(self, path: str):
+        """Write the model as compact JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": MODEL_FORMAT_VERSION,
+                "classes": self.classes,
+                "log_priors": self.log_priors,
+                "log_likelihoods": self.log_likelihoods,
+                "log_unseen": self.log_unseen,
+            }, f, separators=(",", ":"))
+
+    def predict(self, text: str) -> Dict[str, float]:
+        """Return the probability of each class for ``text``."""
+        scores = list(self.log_priors)
+        for token in tokenize(text):
+            weights = self.log_likelihoods.get(token)
+            # Unknown tokens carry no evidence; skipping them keeps long answers from drifting
+            if weights is None:
+                continue
+            for index, weight in enumerate(weights):
+                scores[index] += weight
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return {label: value / total for label, value in zip(self.classes, exps)}
+
+
+class IntentClassifier:
+    """
+    Classifies messages as exit, question, off-topic or answer.
+
+    Precompiled word-boundary matchers decide the clear cases and gate the
+    exit intent: a message ends the interview on the rules alone only when
+    it says nothing beyond exit keywords and courtesies, so "backend" or
+    "front end engineer" never do. The naive Bayes model settles messages
+    the rules leave open.
+    """
+
+    # Questions start with an interrogative or end with a question mark
+    _QUESTION = re.compile(
+        r"\?\s*$|^\s*(?:what|when|where|why|who|whom|which|how|can|could|would|will|"
+        r"do|does|did|is|are|should|may)\b",
+        re.IGNORECASE
+    )
+
+    # Words that hint at leaving beyond the exit keywords; the model must agree
+    _EXIT_CUES = [
+        "leave", "leaving", "done", "withdraw", "cancel", "terminate",
+        "not continue", "not want to continue", "don't want to continue", "dont want to continue",
+        "have to go", "need to go", "got to go", "gotta go",
+    ]
+
+    # Courtesies and lead-ins that may surround an exit keyword in a bare goodbye
+    _COURTESY = re.compile(
+        r"\b(?:(?:the|this)\s+(?:interview|chat|conversation)|for\s+(?:now|today)|thank\s+you|"
+        r"i\s+(?:want|need|would\s+like)\s+to|i'd\s+like\s+to|let\s+us|let'?s|can\s+we|i\s+am|i'?m|"
+        r"please|thanks|ok(?:ay)?|sorry|well|so|now|then|here|this)\b",
+        re.IGNORECASE
+    )
+    _WORD = re.compile(r"\w")
+
+    def __init__(self, model: Optional[NaiveBayesModel] = None, exit_keywords: Optional[List[str]] = None,
+                 exit_threshold: float = 0.6, off_topic_threshold: float = 0.8):
+        """
+        Initialize the classifier.
+
+        Args:
+            model: Trained model; without one only the rules are used
+            exit_keywords: Keywords that end the interview when a message holds little else
+            exit_threshold: Model probability needed for an exit in a longer message
+            off_topic_threshold: Model probability needed to call a message off-topic
+        """
+        self.model = model
+        self.exit_threshold = exit_threshold
+        self.off_topic_threshold = off_topic_threshold
+        keywords = exit_keywords if exit_keywords is not None else EXIT_KEYWORDS
+        self._exit_keyword = self._word_matcher(keywords)
+        self._exit_cue = self._word_matcher(list(keywords) + self._EXIT_CUES)
+
+    @staticmethod
+    def _word_matcher(words: List[str]) -> re.Pattern:
+        """Match any of ``words`` as whole words."""
+        alternatives = "|".join(re.escape(word).replace(r"\ ", r"\s+") for word in sorted(words, key=len, reverse=True))
+        return re.compile(rf"\b(?:{alternatives})\b", re.IGNORECASE)
+
+    def classify(self, text: str) -> IntentResult:
+        """
+        Classify a candidate message.
+
+        Args:
+            text: The message
+
+        Returns:
+            The intent and how confident the classifier is
+        """
+        text = text.strip()
+        if not text:
+            return IntentResult(Intent.ANSWER, 0.0)
+
+        is_question = bool(self._QUESTION.search(text))
+        if not is_question and self._is_bare_exit(text):
+            return IntentResult(Intent.EXIT, 1.0)
+
+        scores = self.model.predict(text) if self.model is not None else {}
+        if self._exit_cue.search(text) and scores.get(Intent.EXIT, 0.0) >= self.exit_threshold:
+            return IntentResult(Intent.EXIT, scores[Intent.EXIT])
+        if scores.get(Intent.OFF_TOPIC, 0.0) >= self.off_topic_threshold:
+            return IntentResult(Intent.OFF_TOPIC, scores[Intent.OFF_TOPIC])
+        if is_question:
+            return IntentResult(Intent.QUESTION, max(scores.get(Intent.QUESTION, 0.0), 0.5))
+        return IntentResult(Intent.ANSWER, scores.get(Intent.ANSWER, 1.0))
+
+    def _is_bare_exit(self, text: str) -> bool:
+        """Check whether a message is only exit keywords, courtesies and punctuation."""
+        if not self._exit_keyword.search(text):
+            return False
+        rest = self._COURTESY.sub(" ", self._exit_keyword.sub(" ", text))
+        return not self._WORD.search(rest)
+
+
+def _read_examples(path: str) -> List[Tuple[str, str]]:
+    """Read (text, intent) pairs from a JSONL file."""
+    with open(path, encoding="utf-8") as f:
+        return [(item["text"], item["intent"]) for item in map(json.loads, f) if item]
+
+
+# Loaded once per process
+intent_classifier = IntentClassifier(NaiveBayesModel.load(INTENT_MODEL_PATH))
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for training the shipped model."""
+    parser = argparse.ArgumentParser(description="Train the local intent model.")
+    parser.add_argument("--train", required=True, help="JSONL file of {\"text\", \"intent\"} examples")
+    parser.add_argument("--output", default=INTENT_MODEL_PATH, help="Model file to write")
+    args = parser.parse_args(argv)
+
+    examples = _read_examples(args.train)
+    model = NaiveBayesModel.train(examples)
+    model.save(args.output)
+    print(f"Trained on {len(examples)} examples ({len(model.log_likelihoods)} features); wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
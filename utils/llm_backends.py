@@ -0,0 +1,260 @@
+"""Model backends that GeminiClient can run against."""
+from typing import List, Dict, Optional, Iterator, Any, Protocol, Tuple
+from enum import IntEnum
+from google.api_core import exceptions as api_exceptions
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+
+
+class LLMBackend(Protocol):
+    """
+    The model surface GeminiClient relies on.
+
+    ``google.generativeai.GenerativeModel`` satisfies it as-is; responses must
+    expose ``text`` and ``candidates`` like Gemini responses do.
+    """
+
+    def generate_content(self, contents: Any, *, stream: bool = False, **kwargs) -> Any:
+        ...
+
+    async def generate_content_async(self, contents: Any, **kwargs) -> Any:
+        ...
+
+    def start_chat(self, *, history: Optional[List[Dict]] = None) -> Any:
+        ...
+
+
+# Canned replies by the kind of prompt they answer, matched on prompt text
+CANNED_RESPONSES = {
+    "greeting": [
+        "Hello and welcome to TalentScout! I'm your hiring assistant, and I'll be running your initial "
+        "screening today. I'll ask about your background and technical skills, so answer as openly as you "
+        "can and ask me anything along the way. To begin, could you tell me your full name?",
+        "Hi there, and thanks for joining TalentScout's screening! I'm the hiring assistant who will guide "
+        "you through a few questions about your experience and skills. Feel free to ask questions at any "
+        "point. Let's start with your full name.",
+    ],
+    "tech_questions": [
+        "Great! Let's dive into some technical questions. Let's start with the first technology you listed. "
+        "Can you walk me through how you structured a recent project that used it, and why?",
+        "Great! Let's dive into some technical questions. Thinking about the first technology on your list, "
+        "what trade-offs have you run into when using it in production?",
+    ],
+    "followup": [
+        "That's a helpful answer, thanks. Building on that, how would you debug a performance problem in "
+        "that part of the system?",
+        "Nice, that makes sense. What would you change about that approach if the load grew tenfold?",
+        "Thanks for explaining. How do you test that kind of code to make sure it keeps working?",
+    ],
+    "exit": [
+        "Thank you for your time today! Any information you've shared will be reviewed by our team, and "
+        "we'll reach out about next steps. Best of luck!",
+    ],
+    "answer_scoring": [
+        '{"scores": [{"index": 0, "score": 7, "feedback": "Solid grasp of the basics with a relevant example."}, '
+        '{"index": 1, "score": 5, "feedback": "Correct in outline but stays shallow on trade-offs."}, '
+        '{"index": 2, "score": 8, "feedback": "Clear, accurate explanation with practical detail."}]}',
+        '{"scores": [{"index": 0, "score": 6, "feedback": "Mostly correct, missing edge cases."}, '
+        '{"index": 1, "score": 8, "feedback": "Well reasoned answer drawing on real experience."}, '
+        '{"index": 2, "score": 4, "feedback": "Vague; does not address the core of the question."}]}',
+    ],
+    "default": [
+        "Thanks for the question! Our recruiting team reviews every screening and typically follows up "
+        "within 2-3 business days with next steps.",
+    ],
+}
+
+_PROMPT_MARKERS = [
+    ("greeting", "greeting"),
+    ("technical interview", "tech_questions"),
+    ("follow-up", "followup"),
+    ("end the conversation", "exit"),
+    ("score each answer", "answer_scoring"),
+]
+
+
+class FinishReason(IntEnum):
+    """Subset of Gemini's finish reasons, with the same values."""
+    STOP = 1
+    MAX_TOKENS = 2
+    SAFETY = 3
+
+
+class _Part:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _Content:
+    def __init__(self, text: str):
+        self.parts = [_Part(text)] if text else []
+
+
+class _Candidate:
+    def __init__(self, text: str, finish_reason: FinishReason):
+        self.content = _Content(text)
+        self.finish_reason = finish_reason
+
+
+class _UsageMetadata:
+    def __init__(self, prompt_tokens: int, output_tokens: int):
+        self.prompt_token_count = prompt_tokens
+        self.candidates_token_count = output_tokens
+        self.total_token_count = prompt_tokens + output_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+class LocalResponse:
+    """Response object shaped like a Gemini ``GenerateContentResponse``."""
+
+    def __init__(self, text: str, prompt_tokens: int = 0, finish_reason: FinishReason = FinishReason.STOP):
+        self.text = text
+        self.candidates = [_Candidate(text, finish_reason)]
+        self.prompt_feedback = None
+        self.usage_metadata = _UsageMetadata(prompt_tokens, estimate_tokens(text))
+
+
+class LocalStreamResponse:
+    """Streaming response that yields ``LocalResponse`` chunks with simulated delays."""
+
+    def __init__(self, text: str, prompt_tokens: int, first_chunk_delay: float,
+                 chunk_delay: float, chunk_size: int, finish_reason: FinishReason = FinishReason.STOP):
+        self._text = text
+        self._first_chunk_delay = first_chunk_delay
+        self._chunk_delay = chunk_delay
+        self._chunk_size = chunk_size
+        self.candidates = [_Candidate(text, finish_reason)]
+        self.prompt_feedback = None
+        self.usage_metadata = _UsageMetadata(prompt_tokens, estimate_tokens(text))
+
+    def __iter__(self) -> Iterator[LocalResponse]:
+        time.sleep(self._first_chunk_delay)
+        for start in range(0, len(self._text), self._chunk_size):
+            if start:
+                time.sleep(self._chunk_delay)
+            yield LocalResponse(self._text[start:start + self._chunk_size])
+
+
+class LocalChatSession:
+    """Chat session for LocalBackend that keeps its own history."""
+
+    def __init__(self, backend: "LocalBackend", history: Optional[List[Dict]] = None):
+        self._backend = backend
+        self.history = list(history or [])
+
+    def send_message(self, content: str, *, stream: bool = False, **kwargs) -> Any:
+        response = self._backend.generate_content(content, stream=stream)
+        self.history.append({"role": "user", "parts": [content]})
+        self.history.append({"role": "model", "parts": [response.candidates[0].content.parts[0].text]})
+        return response
+
+    async def send_message_async(self, content: str, **kwargs) -> LocalResponse:
+        response = await self._backend.generate_content_async(content)
+        self.history.append({"role": "user", "parts": [content]})
+        self.history.append({"role": "model", "parts": [response.text]})
+        return response
+
+
+class LocalBackend:
+    """
+    Deterministic offline backend for load tests and benchmarks.
+
+    Replies are picked from canned responses by a hash of the seed and the
+    prompt, so the same prompt always gets the same reply; replies are cut at
+    the generation config's stop sequences and output token limit. Latency
+    follows a log-normal distribution and calls fail at the configured rates,
+    both drawn from a generator seeded with ``seed``.
+    """
+
+    def __init__(self, seed: int = 0, latency_median: float = 0.8, latency_sigma: float = 0.5,
+                 failure_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 chunk_size: int = 24, responses: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            seed: Seed for reply selection, latency and failures
+            latency_median: Median seconds until a full reply (0 disables delays)
+            latency_sigma: Spread of the log-normal latency distribution
+            failure_rate: Probability a call raises ServiceUnavailable
+            rate_limit_rate: Probability a call raises ResourceExhausted
+            chunk_size: Characters per streamed chunk
+            responses: Canned replies by prompt kind; defaults to CANNED_RESPONSES
+        """
+        self.seed = seed
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.chunk_size = chunk_size
+        self.responses = responses or CANNED_RESPONSES
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate_content(self, contents: Any, *, stream: bool = False,
+                         generation_config: Optional[Dict] = None, **kwargs) -> Any:
+        prompt = str(contents)
+        latency = self._draw_outcome()
+        text, finish_reason = self._apply_config(self.reply_for(prompt), generation_config)
+        if stream:
+            chunk_count = max(1, math.ceil(len(text) / self.chunk_size))
+            # Roughly a third of the time goes to the first token
+            return LocalStreamResponse(
+                text, estimate_tokens(prompt), latency / 3,
+                (latency * 2 / 3) / chunk_count, self.chunk_size, finish_reason
+            )
+        time.sleep(latency)
+        return LocalResponse(text, estimate_tokens(prompt), finish_reason)
+
+    async def generate_content_async(self, contents: Any, *, generation_config: Optional[Dict] = None,
+                                     **kwargs) -> LocalResponse:
+        prompt = str(contents)
+        latency = self._draw_outcome()
+        await asyncio.sleep(latency)
+        text, finish_reason = self._apply_config(self.reply_for(prompt), generation_config)
+        return LocalResponse(text, estimate_tokens(prompt), finish_reason)
+
+    def start_chat(self, *, history: Optional[List[Dict]] = None) -> LocalChatSession:
+        return LocalChatSession(self, history)
+
+    def reply_for(self, prompt: str) -> str:
+        """Return the canned reply for a prompt."""
+        prompt_lower = prompt.lower()
+        kind = next((kind for marker, kind in _PROMPT_MARKERS if marker in prompt_lower), "default")
+        options = self.responses.get(kind) or self.responses["default"]
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).digest()
+        return options[digest[0] % len(options)]
+
+    @staticmethod
+    def _apply_config(text: str, generation_config: Optional[Dict]) -> Tuple[str, FinishReason]:
+        """Cut a reply at stop sequences and the output token limit, returning it with its finish reason."""
+        config = generation_config or {}
+        for stop in config.get("stop_sequences") or []:
+            index = text.find(stop)
+            if index >= 0:
+                text = text[:index]
+        max_tokens = config.get("max_output_tokens")
+        if max_tokens and estimate_tokens(text) > max_tokens:
+            return text[:max_tokens * 4], FinishReason.MAX_TOKENS
+        return text, FinishReason.STOP
+
+    def _draw_outcome(self) -> float:
+        """Draw this call's latency, raising if the call is chosen to fail."""
+        with self._lock:
+            roll = self._rng.random()
+            latency = (self._rng.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+                       if self.latency_median > 0 else 0.0)
+
+        if roll < self.rate_limit_rate:
+            raise api_exceptions.ResourceExhausted("Simulated quota exhaustion")
+        if roll < self.rate_limit_rate + self.failure_rate:
+            raise api_exceptions.ServiceUnavailable("Simulated backend outage")
+        return latency
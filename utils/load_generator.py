@@ -0,0 +1,471 @@
+"""Headless load generator that runs scripted candidates through the interview.
+
+Run 200 interviews, 50 at a time, against the local backend:
+
+    python -m utils.load_generator --sessions 200 --concurrency 50
+
+Each simulated candidate follows a persona (answer length, typos, how
+often it leaves midway) and answers whatever the interview asks next, so
+every state from the greeting to ``ENDED`` is exercised. The report gives
+throughput, per-state turn latency percentiles and error rates.
+"""
+from typing import List, Dict, Optional, Callable, Tuple, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass, field, asdict
+from config.settings import ConversationState, COMMON_TECH_STACKS
+from utils.conversation_manager import ConversationManager
+from utils.gemini_client import GeminiClient
+from utils.llm_backends import LocalBackend
+from utils.metrics import llm_metrics
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import random
+import string
+import threading
+import time
+
+
+@dataclass
+class Persona:
+    """How a simulated candidate behaves."""
+    name: str
+    weight: float = 1.0
+    answer_words: Tuple[int, int] = (20, 60)
+    typo_rate: float = 0.0
+    exit_rate: float = 0.0
+    question_rate: float = 0.5
+    single_message_intake: bool = False
+    think_seconds: Tuple[float, float] = (0.0, 0.0)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Persona":
+        """Build a persona from JSON, where ranges are two-item lists."""
+        values = dict(data)
+        for key in ("answer_words", "think_seconds"):
+            if key in values:
+                values[key] = tuple(values[key])
+        return cls(**values)
+
+
+DEFAULT_PERSONAS = [
+    Persona("concise", weight=3, answer_words=(8, 25)),
+    Persona("thorough", weight=2, answer_words=(80, 200), question_rate=0.8),
+    Persona("hurried", weight=2, answer_words=(10, 40), typo_rate=0.08, single_message_intake=True),
+    Persona("dropout", weight=1, answer_words=(15, 50), typo_rate=0.03, exit_rate=0.6),
+]
+
+_FIRST_NAMES = ["Alex", "Priya", "Chen", "Maria", "Tom", "Aisha", "Lukas", "Sofia", "Kenji", "Olivia"]
+_LAST_NAMES = ["Johnson", "Sharma", "Wei", "Garcia", "Becker", "Khan", "Novak", "Rossi", "Tanaka", "Smith"]
+_PHONES = ["+14155552671", "+442071838750", "+919876543210", "+4930901820", "+61291234567"]
+_ROLES = ["Backend Engineer", "Frontend Developer", "Data Scientist", "DevOps Engineer", "Full Stack Developer"]
+_CITIES = ["Berlin", "Austin", "Bangalore", "London", "Sydney", "Toronto"]
+_ANSWER_WORDS = (
+    "we used it to build a service that handles requests from several teams and I focused on "
+    "keeping the data model simple while caching the expensive lookups so latency stayed low "
+    "under load the tricky part was testing failure cases and rolling out changes safely"
+).split()
+_QUESTIONS = [
+    "What are the next steps in the hiring process?",
+    "How long does the process usually take?",
+    "Will I hear back by email?",
+]
+_EXIT_MESSAGES = ["I have to go now, goodbye", "exit", "I need to stop here, bye"]
+
+# Turns after which an interview that has not ended counts as stalled
+_MAX_TURNS = 60
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class SimulatedCandidate:
+    """Produces a persona's reply to whatever state the interview is in."""
+
+    def __init__(self, persona: Persona, rng: random.Random):
+        self.persona = persona
+        self.rng = rng
+        self.name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        self.email = f"{self.name.lower().replace(' ', '.')}{rng.randint(1, 999)}@example.com"
+        self.phone = rng.choice(_PHONES)
+        self.years = rng.randint(0, 15)
+        self.role = rng.choice(_ROLES)
+        self.city = rng.choice(_CITIES)
+        self.tech_stack = rng.sample(COMMON_TECH_STACKS, rng.randint(1, 4))
+        # Turn at which the candidate walks away, if it does
+        self.exit_turn = rng.randint(2, 14) if rng.random() < persona.exit_rate else None
+        self.questions_asked = 0
+
+    def reply(self, state: str, turn: int) -> str:
+        """The message to send in ``state`` on the candidate's ``turn``-th message."""
+        if state == ConversationState.GREETING:
+            return ""
+        if self.exit_turn is not None and turn >= self.exit_turn:
+            return self.rng.choice(_EXIT_MESSAGES)
+        if state == ConversationState.COLLECT_NAME:
+            if self.persona.single_message_intake:
+                return (f"Hi, I'm {self.name}, {self.email}, {self.phone}, {self.years} years of experience, "
+                        f"applying for {self.role}, based in {self.city}")
+            return self.name
+        if state == ConversationState.COLLECT_EMAIL:
+            return self.email
+        if state == ConversationState.COLLECT_PHONE:
+            return self.phone
+        if state == ConversationState.COLLECT_EXPERIENCE:
+            return f"{self.years} years"
+        if state == ConversationState.COLLECT_POSITION:
+            return self.role
+        if state == ConversationState.COLLECT_LOCATION:
+            return self.city
+        if state == ConversationState.COLLECT_TECH_STACK:
+            return ", ".join(self._typos(tech) for tech in self.tech_stack)
+        if state == ConversationState.TECHNICAL_QA:
+            count = self.rng.randint(*self.persona.answer_words)
+            return " ".join(self._typos(self.rng.choice(_ANSWER_WORDS)) for _ in range(count))
+        if state == ConversationState.WRAP_UP:
+            if self.questions_asked < 2 and self.rng.random() < self.persona.question_rate:
+                self.questions_asked += 1
+                return self.rng.choice(_QUESTIONS)
+            return "No, thank you."
+        return "Thanks"
+
+    def think_time(self) -> float:
+        """Seconds the candidate pauses before replying, drawn from the persona's range."""
+        low, high = self.persona.think_seconds
+        return self.rng.uniform(low, high) if high > 0 else 0.0
+
+    def _typos(self, word: str) -> str:
+        """Swap, drop or replace one letter with probability ``typo_rate``."""
+        if len(word) < 3 or self.rng.random() >= self.persona.typo_rate:
+            return word
+        i = self.rng.randrange(len(word) - 1)
+        kind = self.rng.randrange(3)
+        if kind == 0:
+            return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+        if kind == 1:
+            return word[:i] + word[i + 1:]
+        return word[:i] + self.rng.choice(string.ascii_lowercase) + word[i + 1:]
+
+
+@dataclass
+class InterviewResult:
+    """How one simulated interview went."""
+    persona: str
+    outcome: str
+    turns: int
+    seconds: float
+    # (state at turn start, seconds, seconds to first chunk or None, failed, served a fallback)
+    samples: List[Tuple[str, float, Optional[float], bool, bool]] = field(default_factory=list)
+
+
+class LoadReport:
+    """Aggregates interview results into throughput, latency and error figures."""
+
+    def __init__(self):
+        self.results: List[InterviewResult] = []
+        self.wall_seconds = 0.0
+        self.scoring_drain_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, result: InterviewResult):
+        """Record a finished interview; safe to call from worker threads."""
+        with self._lock:
+            self.results.append(result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the run."""
+        turns: Dict[str, List[float]] = {}
+        first_chunks: Dict[str, List[float]] = {}
+        errors: Dict[str, int] = {}
+        degraded: Dict[str, int] = {}
+        outcomes: Dict[str, int] = {}
+        personas: Dict[str, Dict[str, int]] = {}
+        for result in self.results:
+            outcomes[result.outcome] = outcomes.get(result.outcome, 0) + 1
+            by_outcome = personas.setdefault(result.persona, {})
+            by_outcome[result.outcome] = by_outcome.get(result.outcome, 0) + 1
+            for state, seconds, first_chunk, failed, fallback in result.samples:
+                turns.setdefault(state, []).append(seconds)
+                if first_chunk is not None:
+                    first_chunks.setdefault(state, []).append(first_chunk)
+                errors[state] = errors.get(state, 0) + int(failed)
+                degraded[state] = degraded.get(state, 0) + int(fallback)
+
+        states = {}
+        for state, samples in turns.items():
+            samples.sort()
+            summary = {
+                "turns": len(samples),
+                "errors": errors[state],
+                "error_rate": errors[state] / len(samples),
+                "degraded": degraded[state],
+                "degraded_rate": degraded[state] / len(samples),
+                "p50": _percentile(samples, 50),
+                "p90": _percentile(samples, 90),
+                "p95": _percentile(samples, 95),
+                "p99": _percentile(samples, 99),
+                "max": samples[-1],
+            }
+            if state in first_chunks:
+                ordered = sorted(first_chunks[state])
+                summary["first_chunk_p50"] = _percentile(ordered, 50)
+                summary["first_chunk_p95"] = _percentile(ordered, 95)
+            states[state] = summary
+
+        turn_count = sum(len(samples) for samples in turns.values())
+        error_count = sum(errors.values())
+        degraded_count = sum(degraded.values())
+        wall = self.wall_seconds or 1e-9
+        return {
+            "interviews": len(self.results),
+            "outcomes": outcomes,
+            "personas": personas,
+            "turns": turn_count,
+            "errors": error_count,
+            "error_rate": error_count / turn_count if turn_count else 0.0,
+            "degraded": degraded_count,
+            "degraded_rate": degraded_count / turn_count if turn_count else 0.0,
+            "wall_seconds": self.wall_seconds,
+            "interviews_per_second": len(self.results) / wall,
+            "turns_per_second": turn_count / wall,
+            "scoring_drain_seconds": self.scoring_drain_seconds,
+            "states": states,
+            "model_calls": llm_metrics.snapshot(),
+        }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Render a report summary as a plain-text table."""
+    lines = [
+        f"Interviews: {summary['interviews']} "
+        + " ".join(f"{outcome}={count}" for outcome, count in sorted(summary["outcomes"].items())),
+        f"Turns: {summary['turns']}  errors: {summary['errors']} ({summary['error_rate']:.2%})  "
+        f"served a fallback: {summary['degraded']} ({summary['degraded_rate']:.2%})",
+        f"Wall time: {summary['wall_seconds']:.2f}s  "
+        f"throughput: {summary['interviews_per_second']:.2f} interviews/s, {summary['turns_per_second']:.2f} turns/s",
+        f"Background scoring drained {summary['scoring_drain_seconds']:.2f}s after the last interview",
+        "",
+        f"{'state':<20}{'turns':>7}{'err%':>7}{'fallback%':>10}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+    ]
+    order = [getattr(ConversationState, name) for name in vars(ConversationState) if name.isupper()]
+    for state in sorted(summary["states"], key=lambda s: order.index(s) if s in order else len(order)):
+        s = summary["states"][state]
+        lines.append(
+            f"{state:<20}{s['turns']:>7}{s['error_rate']:>7.1%}{s['degraded_rate']:>10.1%}{s['p50']:>9.3f}{s['p90']:>9.3f}"
+            f"{s['p95']:>9.3f}{s['p99']:>9.3f}{s['max']:>9.3f}"
+        )
+    calls = summary["model_calls"]
+    if calls:
+        lines += ["", f"{'model calls':<20}{'calls':>7}{'cached':>8}{'retries':>9}{'fallback':>10}{'p95':>9}"]
+        for prompt_type, totals in sorted(calls.items()):
+            lines.append(
+                f"{prompt_type:<20}{totals['calls']:>7}{totals['cached']:>8}{totals['retries']:>9}"
+                f"{totals['fallbacks']:>10}{totals['latency']['p95']:>9.3f}"
+            )
+    return "\n".join(lines)
+
+
+def _choose_persona(personas: List[Persona], rng: random.Random) -> Persona:
+    """Pick a persona at random in proportion to its weight."""
+    return rng.choices(personas, weights=[persona.weight for persona in personas])[0]
+
+
+def _set_outcome(result: InterviewResult, manager: ConversationManager, candidate: SimulatedCandidate):
+    """Classify an interview that ran without raising."""
+    if manager.state != ConversationState.ENDED:
+        return
+    left_early = candidate.exit_turn is not None and candidate.exit_turn <= result.turns
+    result.outcome = "exited" if left_early else "completed"
+
+
+def run_interview(client: GeminiClient, persona: Persona, seed: int,
+                  stream: bool = True) -> Tuple[InterviewResult, List[Future]]:
+    """
+    Run one interview to completion on the calling thread.
+
+    Args:
+        client: Client for the interview's manager
+        persona: Behaviour of the simulated candidate
+        seed: Seed for the candidate's details and replies
+        stream: Drive turns through ``process_message_stream``, as the app does,
+            recording time to the first chunk
+
+    Returns:
+        The result and the interview's pending scoring calls
+    """
+    rng = random.Random(seed)
+    candidate = SimulatedCandidate(persona, rng)
+    manager = ConversationManager(client)
+    result = InterviewResult(persona.name, "stalled", 0, 0.0)
+    started = turn_start = time.perf_counter()
+    try:
+        while manager.state != ConversationState.ENDED and result.turns < _MAX_TURNS:
+            if result.turns:
+                time.sleep(candidate.think_time())
+            state = manager.state
+            message = candidate.reply(state, result.turns)
+            turn_start = time.perf_counter()
+            first_chunk = None
+            if stream:
+                parts = []
+                for chunk in manager.process_message_stream(message):
+                    if first_chunk is None:
+                        first_chunk = time.perf_counter() - turn_start
+                    parts.append(chunk)
+                reply = "".join(parts)
+            else:
+                reply = manager.process_message(message)
+            elapsed = time.perf_counter() - turn_start
+            result.samples.append((state, elapsed, first_chunk, ConversationManager._is_failed_response(reply),
+                                   manager.turn_degraded))
+            result.turns += 1
+    except Exception as e:
+        result.samples.append((manager.state, time.perf_counter() - turn_start, None, True, False))
+        result.outcome = "failed"
+        print(f"Interview {seed} failed: {str(e)}")
+    else:
+        _set_outcome(result, manager, candidate)
+    result.seconds = time.perf_counter() - started
+    return result, manager.pending_scores()
+
+
+async def run_interview_async(client: GeminiClient, persona: Persona, seed: int) -> Tuple[InterviewResult, List[Future]]:
+    """Run one interview through ``process_message_async``; see ``run_interview``."""
+    rng = random.Random(seed)
+    candidate = SimulatedCandidate(persona, rng)
+    manager = ConversationManager(client)
+    result = InterviewResult(persona.name, "stalled", 0, 0.0)
+    started = turn_start = time.perf_counter()
+    try:
+        while manager.state != ConversationState.ENDED and result.turns < _MAX_TURNS:
+            if result.turns:
+                await asyncio.sleep(candidate.think_time())
+            state = manager.state
+            message = candidate.reply(state, result.turns)
+            turn_start = time.perf_counter()
+            reply = await manager.process_message_async(message)
+            elapsed = time.perf_counter() - turn_start
+            result.samples.append((state, elapsed, None, ConversationManager._is_failed_response(reply),
+                                   manager.turn_degraded))
+            result.turns += 1
+    except Exception as e:
+        result.samples.append((manager.state, time.perf_counter() - turn_start, None, True, False))
+        result.outcome = "failed"
+        print(f"Interview {seed} failed: {str(e)}")
+    else:
+        _set_outcome(result, manager, candidate)
+    result.seconds = time.perf_counter() - started
+    return result, manager.pending_scores()
+
+
+def run_load(client_factory: Callable[[], GeminiClient], sessions: int, concurrency: int,
+             personas: Optional[List[Persona]] = None, seed: int = 0, driver: str = "threads",
+             scoring_timeout: float = 60.0) -> LoadReport:
+    """
+    Run simulated interviews concurrently and collect a report.
+
+    Args:
+        client_factory: Builds the client for each interview
+        sessions: Number of interviews to run
+        concurrency: Interviews in progress at once
+        personas: Persona mix; defaults to DEFAULT_PERSONAS
+        seed: Seed for persona choice and candidate behaviour
+        driver: "threads" for one blocking, streamed interview per thread
+            (like the Streamlit app), "async" for one event loop
+        scoring_timeout: Seconds to wait for background scoring after the last interview
+
+    Returns:
+        The report
+    """
+    personas = personas or DEFAULT_PERSONAS
+    rng = random.Random(seed)
+    plan = [(_choose_persona(personas, rng), seed * 1_000_003 + index) for index in range(sessions)]
+    report = LoadReport()
+    pending_scores: List[Future] = []
+
+    started = time.perf_counter()
+    if driver == "async":
+        async def run_all():
+            limit = asyncio.Semaphore(concurrency)
+
+            async def one(persona: Persona, interview_seed: int):
+                async with limit:
+                    result, scores = await run_interview_async(client_factory(), persona, interview_seed)
+                report.add(result)
+                pending_scores.extend(scores)
+
+            await asyncio.gather(*(one(persona, interview_seed) for persona, interview_seed in plan))
+
+        asyncio.run(run_all())
+    elif driver == "threads":
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load-interview") as executor:
+            futures = [executor.submit(run_interview, client_factory(), persona, interview_seed)
+                       for persona, interview_seed in plan]
+            for future in futures:
+                result, scores = future.result()
+                report.add(result)
+                pending_scores.extend(scores)
+    else:
+        raise ValueError(f"Unknown driver: {driver}")
+    report.wall_seconds = time.perf_counter() - started
+
+    drain_start = time.perf_counter()
+    wait_futures(pending_scores, timeout=scoring_timeout)
+    report.scoring_drain_seconds = time.perf_counter() - drain_start
+    return report
+
+
+def load_client_factory(spec: str) -> Callable[[], GeminiClient]:
+    """Import a ``module:callable`` that returns a client for each interview."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Client factory must look like module:callable, got {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for load runs."""
+    parser = argparse.ArgumentParser(description="Run simulated candidates through the interview.")
+    parser.add_argument("--sessions", type=int, default=100, help="Interviews to run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Interviews in progress at once")
+    parser.add_argument("--driver", choices=["threads", "async"], default="threads")
+    parser.add_argument("--personas", help="JSON file with a list of persona objects")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--client", help="module:callable returning a GeminiClient; defaults to a local backend")
+    parser.add_argument("--latency-median", type=float, default=0.8, help="Local backend median call seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Local backend latency spread")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Local backend failure probability")
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    personas = None
+    if args.personas:
+        with open(args.personas, "r", encoding="utf-8") as f:
+            personas = [Persona.from_dict(item) for item in json.load(f)]
+
+    if args.client:
+        client_factory = load_client_factory(args.client)
+    else:
+        # One backend for the whole run, as one server process shares one model
+        backend = LocalBackend(seed=args.seed, latency_median=args.latency_median,
+                               latency_sigma=args.latency_sigma, failure_rate=args.failure_rate)
+        client_factory = lambda: GeminiClient(backend=backend)
+
+    llm_metrics.reset()
+    report = run_load(client_factory, args.sessions, args.concurrency, personas, args.seed, args.driver)
+    summary = report.to_dict()
+    print(format_report(summary))
+    if args.json:
+        summary["results"] = [asdict(result) for result in report.results]
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
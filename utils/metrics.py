@@ -0,0 +1,175 @@
+"""Per-call instrumentation for model requests."""
+from typing import List, Dict, Optional
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from config.settings import METRICS_DUMP_PATH, METRICS_RECENT_RECORDS
+import atexit
+import bisect
+import json
+import threading
+import time
+
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+
+
+@dataclass
+class LLMCallRecord:
+    """Outcome of one model call."""
+    method: str
+    prompt_type: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+    latency_seconds: float = 0.0
+    first_token_seconds: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    retries: int = 0
+    failed_attempts: int = 0
+    last_error: Optional[str] = None  # Type and message of the latest failed attempt
+    queue_seconds: float = 0.0
+    finish_reason: Optional[str] = None
+    cached: bool = False
+    coalesced: bool = False
+    hedged: bool = False
+    fallback: bool = False
+    _clock_start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def elapsed(self) -> float:
+        """Seconds since the call started."""
+        return time.perf_counter() - self._clock_start
+
+    def to_dict(self) -> Dict[str, object]:
+        """Public fields as a plain dict."""
+        return {key: value for key, value in asdict(self).items() if not key.startswith("_")}
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution with percentile estimates."""
+
+    def __init__(self, buckets: Optional[List[float]] = None):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Ascending bucket upper bounds in seconds
+        """
+        self.buckets = buckets or LATENCY_BUCKETS
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """Add one latency sample."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile (the observed
+            maximum for the overflow bucket)
+        """
+        if not self.total:
+            return 0.0
+        rank = q / 100 * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        """Summarize the histogram."""
+        return {
+            "count": self.total,
+            "mean": self.sum / self.total if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["inf"], self.counts)),
+        }
+
+
+class LLMMetrics:
+    """Aggregates call records by prompt type."""
+
+    def __init__(self, recent_records: int = 1000):
+        """
+        Initialize the aggregator.
+
+        Args:
+            recent_records: Number of raw records kept for inspection
+        """
+        self.recent = deque(maxlen=recent_records)
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: LLMCallRecord):
+        """Add a finished call."""
+        key = record.prompt_type or "untyped"
+        with self._lock:
+            self.recent.append(record)
+            self._latency.setdefault(key, LatencyHistogram()).observe(record.latency_seconds)
+            totals = self._totals.setdefault(key, {
+                "calls": 0, "cached": 0, "coalesced": 0, "hedged": 0, "fallbacks": 0, "retries": 0, "failed_attempts": 0,
+                "prompt_tokens": 0, "output_tokens": 0, "queue_seconds": 0.0,
+            })
+            totals["calls"] += 1
+            totals["cached"] += int(record.cached)
+            totals["coalesced"] += int(record.coalesced)
+            totals["hedged"] += int(record.hedged)
+            totals["fallbacks"] += int(record.fallback)
+            totals["retries"] += record.retries
+            totals["failed_attempts"] += record.failed_attempts
+            totals["prompt_tokens"] += record.prompt_tokens or 0
+            totals["output_tokens"] += record.output_tokens or 0
+            totals["queue_seconds"] += record.queue_seconds
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return totals and latency summaries for every prompt type."""
+        with self._lock:
+            return {
+                prompt_type: {**self._totals[prompt_type], "latency": histogram.to_dict()}
+                for prompt_type, histogram in self._latency.items()
+            }
+
+    def dump(self, path: str, include_records: bool = True):
+        """
+        Write the snapshot, and optionally the recent records, as JSON.
+
+        Args:
+            path: File to write
+            include_records: Whether to include the raw recent records
+        """
+        data = {"generated_at": time.time(), "prompt_types": self.snapshot()}
+        if include_records:
+            with self._lock:
+                data["records"] = [record.to_dict() for record in self.recent]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        with self._lock:
+            self.recent.clear()
+            self._latency.clear()
+            self._totals.clear()
+
+
+# Shared by every GeminiClient in the process
+llm_metrics = LLMMetrics(recent_records=METRICS_RECENT_RECORDS)
+
+if METRICS_DUMP_PATH:
+    atexit.register(llm_metrics.dump, METRICS_DUMP_PATH)
@@ -0,0 +1,165 @@
+"""Precomputed technical question bank.
+
+Build the bank with:
+
+    python -m utils.question_bank --output data/question_bank.json
+"""
+from typing import List, Dict, Optional, Tuple, Iterable
+from models import PlannedQuestion, QuestionPlan
+from config.settings import QUESTION_BANK_PATH, COMMON_TECH_STACKS
+from prompts.question_generator import generate_question_bank_prompt, QUESTION_BANK_PROFILE
+import argparse
+import json
+import os
+import random
+import sys
+
+BANK_FORMAT_VERSION = 1
+EXPERIENCE_LEVELS = ["beginner", "intermediate", "advanced"]
+
+
+class QuestionBank:
+    """
+    Questions indexed by (technology, level).
+
+    Entries are held as tuples of (topic, question) with interned topic
+    strings, keyed by the lower-cased technology name.
+    """
+
+    def __init__(self, questions: Optional[Dict[str, Dict[str, List[List[str]]]]] = None):
+        """
+        Initialize the bank.
+
+        Args:
+            questions: Mapping of technology -> level -> [topic, question] pairs
+        """
+        self._names: Dict[str, str] = {}
+        self._index: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]] = {}
+        for tech, levels in (questions or {}).items():
+            key = tech.lower()
+            self._names[key] = tech
+            for level, entries in levels.items():
+                self._index[(key, level)] = tuple(
+                    (sys.intern(topic), question) for topic, question in entries
+                )
+
+    @classmethod
+    def load(cls, path: str) -> "QuestionBank":
+        """
+        Load a bank file, returning an empty bank if it is missing or unreadable.
+
+        Args:
+            path: Path of the JSON bank file
+
+        Returns:
+            The loaded bank
+        """
+        if not path or not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not load question bank from {path}: {str(e)}")
+            return cls()
+        if data.get("version") != BANK_FORMAT_VERSION:
+            print(f"Ignoring question bank {path}: unsupported version {data.get('version')}")
+            return cls()
+        return cls(data.get("questions"))
+
+    def save(self, path: str):
+        """Write the bank as compact JSON."""
+        questions: Dict[str, Dict[str, List[List[str]]]] = {}
+        for (key, level), entries in self._index.items():
+            questions.setdefault(self._names[key], {})[level] = [list(entry) for entry in entries]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": BANK_FORMAT_VERSION, "questions": questions}, f, separators=(",", ":"))
+
+    def add(self, tech: str, level: str, entries: Iterable[Tuple[str, str]]):
+        """Add (topic, question) pairs for a technology and level."""
+        key = tech.lower()
+        self._names.setdefault(key, tech)
+        existing = self._index.get((key, level), ())
+        self._index[(key, level)] = existing + tuple((sys.intern(topic), question) for topic, question in entries)
+
+    def has(self, tech: str, level: str) -> bool:
+        """Check whether the bank holds questions for a technology and level."""
+        return bool(self._index.get((tech.lower(), level)))
+
+    def draw(self, tech: str, level: str, count: int, exclude: Optional[set] = None,
+             rng: Optional[random.Random] = None) -> List[PlannedQuestion]:
+        """
+        Draw distinct random questions for a technology and level.
+
+        Args:
+            tech: Technology as the candidate wrote it
+            level: Experience level
+            count: Number of questions wanted
+            exclude: Question texts already asked; drawn questions are added to it
+            rng: Random generator to draw with
+
+        Returns:
+            Up to ``count`` questions, empty if the technology is not in the bank
+        """
+        exclude = exclude if exclude is not None else set()
+        entries = [entry for entry in self._index.get((tech.lower(), level), ()) if entry[1] not in exclude]
+        picked = (rng or random).sample(entries, min(count, len(entries)))
+        for _, question in picked:
+            exclude.add(question)
+        return [PlannedQuestion(technology=tech, question=question, topic=topic) for topic, question in picked]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._index.values())
+
+
+def build_question_bank(technologies: List[str], per_level: int, client=None) -> QuestionBank:
+    """
+    Generate a bank with one model call per (technology, level).
+
+    Args:
+        technologies: Technologies to cover
+        per_level: Questions to request for each level
+        client: GeminiClient to generate with; created if omitted
+
+    Returns:
+        The generated bank
+    """
+    if client is None:
+        from utils.gemini_client import GeminiClient
+        client = GeminiClient()
+
+    bank = QuestionBank()
+    for tech in technologies:
+        for level in EXPERIENCE_LEVELS:
+            text = client.generate_content(
+                generate_question_bank_prompt(tech, level, per_level), profile=QUESTION_BANK_PROFILE
+            )
+            plan = QuestionPlan.from_response(text, [tech], per_level)
+            bank.add(tech, level, [(q.topic or "general", q.question) for q in plan.questions])
+            print(f"{tech} ({level}): {len(plan.questions)} questions")
+    return bank
+
+
+# Loaded once per process
+question_bank = QuestionBank.load(QUESTION_BANK_PATH)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for building the bank."""
+    parser = argparse.ArgumentParser(description="Build the offline technical question bank.")
+    parser.add_argument("--output", default=QUESTION_BANK_PATH, help="Bank file to write")
+    parser.add_argument("--per-level", type=int, default=8, help="Questions per technology and level")
+    parser.add_argument("--technologies", nargs="+", default=COMMON_TECH_STACKS,
+                        help="Technologies to cover (defaults to COMMON_TECH_STACKS)")
+    args = parser.parse_args(argv)
+
+    bank = build_question_bank(args.technologies, args.per_level)
+    bank.save(args.output)
+    print(f"Wrote {len(bank)} questions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
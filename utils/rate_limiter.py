@@ -0,0 +1,250 @@
+"""Process-wide request and token rate limiting for model calls."""
+from typing import Dict, List, Optional
+from collections import deque
+from config.settings import (
+    RATE_LIMIT_REQUESTS_PER_MINUTE,
+    RATE_LIMIT_TOKENS_PER_MINUTE,
+    RATE_LIMIT_BACKGROUND_RESERVE
+)
+from utils.metrics import LatencyHistogram
+import asyncio
+import threading
+import time
+
+
+class Priority:
+    """Enum for rate limiter priority classes."""
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+# Most urgent first
+PRIORITY_ORDER = [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+
+class _Bucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self._updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def seconds_until(self, amount: float, floor: float = 0.0) -> float:
+        """Seconds until ``amount`` can be taken without dropping below ``floor``."""
+        shortfall = amount + floor - self.level
+        return shortfall / self.rate if shortfall > 0 else 0.0
+
+
+class RateLimiter:
+    """
+    Budgets requests per minute and tokens per minute across the process.
+
+    Callers queue instead of failing. A call is let through once it is the
+    oldest waiter of the most urgent class that has waiters and both buckets
+    can cover it. Background calls must also leave ``background_reserve`` of
+    each bucket untouched, so interactive turns find capacity even while
+    background work is being throttled.
+
+    Token usage is charged up front from the prompt estimate; output tokens
+    are debited once the response reports them, which can put the token
+    bucket into debt that later calls wait out.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 background_reserve: float = 0.2, poll_interval: float = 0.05):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request budget (0 for unlimited)
+            tokens_per_minute: Token budget (0 for unlimited)
+            background_reserve: Fraction of each bucket background calls may not use
+            poll_interval: Longest sleep between checks for async waiters
+        """
+        self.background_reserve = background_reserve
+        self.poll_interval = poll_interval
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._queues: Dict[str, deque] = {priority: deque() for priority in PRIORITY_ORDER}
+        self._waits: Dict[str, LatencyHistogram] = {priority: LatencyHistogram() for priority in PRIORITY_ORDER}
+        self._cond = threading.Condition()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is configured."""
+        return self._requests is not None or self._tokens is not None
+
+    def queue_depth(self, priority: Optional[str] = None) -> int:
+        """Number of calls waiting, for one priority class or all of them."""
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def acquire(self, tokens: int = 0, priority: str = Priority.INTERACTIVE) -> float:
+        """
+        Block until a call may go out, then charge it to the budgets.
+
+        Args:
+            tokens: Estimated prompt tokens of the call
+            priority: Priority class of the call
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+        started = time.perf_counter()
+        ticket = object()
+        with self._cond:
+            self._queues[priority].append(ticket)
+            try:
+                while True:
+                    wait = self._try_grant(ticket, tokens, priority)
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+            except BaseException:
+                self._leave(ticket, priority)
+                raise
+            # The next waiter may be able to go now
+            self._cond.notify_all()
+        return self._record_wait(priority, started)
+
+    async def acquire_async(self, tokens: int = 0, priority: str = Priority.INTERACTIVE) -> float:
+        """Async counterpart of ``acquire`` that sleeps instead of blocking the loop."""
+        if not self.enabled:
+            return 0.0
+        started = time.perf_counter()
+        ticket = object()
+        with self._cond:
+            self._queues[priority].append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(ticket, tokens, priority)
+                    if wait <= 0:
+                        self._cond.notify_all()
+                        break
+                await asyncio.sleep(min(wait, self.poll_interval))
+        except BaseException:
+            with self._cond:
+                self._leave(ticket, priority)
+            raise
+        return self._record_wait(priority, started)
+
+    def try_acquire(self, tokens: int = 0, priority: str = Priority.INTERACTIVE) -> bool:
+        """
+        Charge a call only if it can go out right now without jumping the queue.
+
+        Args:
+            tokens: Estimated prompt tokens of the call
+            priority: Priority class of the call
+
+        Returns:
+            True if the call was charged and may proceed
+        """
+        if not self.enabled:
+            return True
+        with self._cond:
+            for other in PRIORITY_ORDER[:PRIORITY_ORDER.index(priority) + 1]:
+                if self._queues[other]:
+                    return False
+            return self._take(tokens, priority) == 0
+
+    def debit(self, tokens: int):
+        """Charge tokens that were only known after the call, such as output tokens."""
+        if self._tokens is None or not tokens:
+            return
+        with self._cond:
+            self._tokens.refill(time.monotonic())
+            self._tokens.level -= tokens
+
+    def stats(self) -> Dict[str, object]:
+        """Return queue depths, wait time summaries and remaining budgets."""
+        with self._cond:
+            now = time.monotonic()
+            for bucket in (self._requests, self._tokens):
+                if bucket is not None:
+                    bucket.refill(now)
+            return {
+                "queue_depth": {priority: len(queue) for priority, queue in self._queues.items()},
+                "wait_seconds": {priority: histogram.to_dict() for priority, histogram in self._waits.items()},
+                "requests_available": self._requests.level if self._requests is not None else None,
+                "tokens_available": self._tokens.level if self._tokens is not None else None,
+            }
+
+    def _try_grant(self, ticket: object, tokens: int, priority: str) -> float:
+        """
+        Let ``ticket`` through if it is next in line and the budgets allow.
+
+        Must be called with the lock held.
+
+        Returns:
+            0 if the call was granted, otherwise seconds to wait before checking again
+        """
+        for other in PRIORITY_ORDER[:PRIORITY_ORDER.index(priority)]:
+            if self._queues[other]:
+                return self.poll_interval
+        if self._queues[priority][0] is not ticket:
+            return self.poll_interval
+
+        wait = self._take(tokens, priority)
+        if wait == 0:
+            self._queues[priority].popleft()
+        return wait
+
+    def _take(self, tokens: int, priority: str) -> float:
+        """
+        Charge a call to the buckets if they can cover it.
+
+        Must be called with the lock held.
+
+        Returns:
+            0 if the call was charged, otherwise seconds until it could be
+        """
+        now = time.monotonic()
+        reserve = self.background_reserve if priority == Priority.BACKGROUND else 0.0
+        charges = []
+        for bucket, amount in ((self._requests, 1), (self._tokens, tokens)):
+            if bucket is None:
+                continue
+            bucket.refill(now)
+            floor = bucket.capacity * reserve
+            # A call larger than the whole bucket would otherwise never fit
+            charges.append((bucket, min(amount, bucket.capacity - floor), floor))
+
+        wait = max((bucket.seconds_until(amount, floor) for bucket, amount, floor in charges), default=0.0)
+        if wait > 0:
+            return wait
+
+        for bucket, amount, _ in charges:
+            bucket.level -= amount
+        return 0.0
+
+    def _leave(self, ticket: object, priority: str):
+        """Remove a waiter that gave up. Must be called with the lock held."""
+        try:
+            self._queues[priority].remove(ticket)
+        except ValueError:
+            pass
+        self._cond.notify_all()
+
+    def _record_wait(self, priority: str, started: float) -> float:
+        waited = time.perf_counter() - started
+        with self._cond:
+            self._waits[priority].observe(waited)
+        return waited
+
+
+# Shared by every GeminiClient in the process
+rate_limiter = RateLimiter(
+    requests_per_minute=RATE_LIMIT_REQUESTS_PER_MINUTE,
+    tokens_per_minute=RATE_LIMIT_TOKENS_PER_MINUTE,
+    background_reserve=RATE_LIMIT_BACKGROUND_RESERVE
+)
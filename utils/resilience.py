@@ -0,0 +1,207 @@
+"""Retry policy and circuit breaker for model calls."""
+from typing import Dict
+from google.api_core import exceptions as api_exceptions
+from config.settings import (
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_DELAY_SECONDS,
+    RATE_LIMIT_BASE_DELAY_SECONDS,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MIN_PER_SECOND,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS
+)
+import random
+import threading
+import time
+
+
+class ErrorClass:
+    """Enum for how a failed call should be handled."""
+    RETRYABLE = "retryable"
+    RATE_LIMITED = "rate_limited"
+    FATAL = "fatal"
+
+
+# Client errors that will fail the same way however often they are retried
+_FATAL_ERRORS = (
+    api_exceptions.BadRequest,
+    api_exceptions.Unauthorized,
+    api_exceptions.Forbidden,
+    api_exceptions.NotFound,
+)
+
+
+def classify_error(error: Exception) -> str:
+    """
+    Decide how a failed model call should be treated.
+
+    Args:
+        error: The exception raised by the call
+
+    Returns:
+        One of the ErrorClass values
+    """
+    if isinstance(error, api_exceptions.TooManyRequests):
+        return ErrorClass.RATE_LIMITED
+    if isinstance(error, _FATAL_ERRORS):
+        return ErrorClass.FATAL
+    # Server errors, timeouts and transport failures are worth another try
+    return ErrorClass.RETRYABLE
+
+
+def backoff_delay(attempt: int, error_class: str = ErrorClass.RETRYABLE) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        error_class: Classification of the failure
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    base = RATE_LIMIT_BASE_DELAY_SECONDS if error_class == ErrorClass.RATE_LIMITED else RETRY_BASE_DELAY_SECONDS
+    ceiling = min(RETRY_MAX_DELAY_SECONDS, base * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries.
+
+    Every first attempt deposits ``ratio`` tokens and the balance also refills
+    at ``min_per_second``; each retry spends one token. When the budget is
+    empty failures are returned instead of retried, so an outage cannot
+    multiply the load on the API.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 20.0):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries earned per first attempt
+            min_per_second: Retries always allowed per second
+            capacity: Maximum number of banked retries
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.exhausted = 0
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """Credit the budget for a first attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget if any is left."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def _refill(self):
+        """Add the time-based allowance accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.min_per_second)
+        self._updated_at = now
+
+
+class CircuitBreaker:
+    """
+    Stops calling the API after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls for ``reset_timeout`` seconds, then lets a single trial
+    call through; its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.opened_count = 0
+        self.closed_count = 0
+        self.rejected_count = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go to the API right now."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self.rejected_count += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    self.rejected_count += 1
+                    return False
+                self._trial_in_flight = True
+
+            return True
+
+    def record_success(self):
+        """Note that the API answered."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self.closed_count += 1
+
+    def record_failure(self):
+        """Note that the API failed, opening the breaker if needed."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.opened_count += 1
+
+    def stats(self) -> Dict[str, object]:
+        """Return the current state and transition counters."""
+        return {
+            "state": self.state,
+            "opened": self.opened_count,
+            "closed": self.closed_count,
+            "rejected": self.rejected_count,
+        }
+
+
+# Shared by every GeminiClient in the process
+retry_budget = RetryBudget(
+    ratio=RETRY_BUDGET_RATIO,
+    min_per_second=RETRY_BUDGET_MIN_PER_SECOND
+)
+circuit_breaker = CircuitBreaker(
+    failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=CIRCUIT_RESET_SECONDS
+)
@@ -0,0 +1,200 @@
+"""Durable interview checkpoints, resumable by session token."""
+from typing import List, Dict, Optional, Tuple, Any, Iterator
+from config.settings import SESSION_STORE_PATH, SESSION_TTL_SECONDS
+from utils.conversation_manager import ConversationManager
+from utils.gemini_client import GeminiClient
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class SessionStore:
+    """
+    Checkpoints of ConversationManager state in a SQLite file.
+
+    Each session token maps to the manager's latest ``to_dict`` snapshot and
+    the transcript shown to the candidate, stored as compressed JSON. A
+    question prefetch or answer scoring call still running when a checkpoint
+    is written is added to that checkpoint once it finishes, so a restored
+    interview regenerates nothing; a newer checkpoint for the same token wins
+    over late results.
+
+    The database runs in WAL mode, so exports reading it never block the
+    checkpoints written after every turn.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 604800):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite file to write, created if missing
+            ttl_seconds: Age after which an untouched session is deleted
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(token TEXT PRIMARY KEY, seq INTEGER NOT NULL, data BLOB NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._seq: Dict[str, int] = {}
+
+    @staticmethod
+    def new_token() -> str:
+        """Return a fresh, unguessable session token."""
+        return secrets.token_urlsafe(16)
+
+    def save(self, token: str, manager: ConversationManager, messages: Optional[List[Dict[str, str]]] = None) -> bool:
+        """
+        Write a checkpoint for ``token``.
+
+        Args:
+            token: Session token
+            manager: ConversationManager to snapshot
+            messages: Transcript shown to the candidate
+
+        Returns:
+            False if the checkpoint could not be written; the interview carries on without it
+        """
+        # Checked first so a prefetch finishing in between is still picked up
+        pending = manager.pending_prefetch()
+        snapshot = {"manager": manager.to_dict(), "messages": list(messages or [])}
+        with self._lock:
+            seq = self._seq.get(token, 0) + 1
+            self._seq[token] = seq
+            if not self._write(token, seq, snapshot):
+                return False
+
+        if pending is not None:
+            tech, future = pending
+            future.add_done_callback(lambda done: self._add_prefetch(token, seq, snapshot, tech, done))
+        # Scores land on the manager's answers first, since its callback was registered earlier
+        for future in manager.pending_scores():
+            future.add_done_callback(lambda done: self._add_scores(token, seq, snapshot, manager))
+        return True
+
+    def load(self, token: str, gemini_client: GeminiClient) -> Optional[Tuple[ConversationManager, List[Dict[str, str]]]]:
+        """
+        Restore the checkpoint for ``token``.
+
+        Args:
+            token: Session token
+            gemini_client: Instance of GeminiClient for the restored manager
+
+        Returns:
+            Tuple of the manager and transcript, or None if there is no usable checkpoint
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT seq, data, updated_at FROM sessions WHERE token = ?", (token,)
+            ).fetchone()
+        if row is None or row[2] + self.ttl_seconds < time.time():
+            return None
+        try:
+            snapshot = json.loads(zlib.decompress(row[1]))
+            manager = ConversationManager.from_dict(snapshot["manager"], gemini_client)
+        except (ValueError, KeyError, TypeError, zlib.error) as e:
+            print(f"Could not restore session {token}: {str(e)}")
+            return None
+        with self._lock:
+            self._seq[token] = max(self._seq.get(token, 0), row[0])
+        return manager, snapshot["messages"]
+
+    def iter_snapshots(self, batch_size: int = 500) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream every stored checkpoint without loading them all at once.
+
+        Each batch is a short query that continues after the last token seen,
+        so no read stays open between batches and checkpoints keep being
+        written while a long export runs. A session saved during the export
+        is read once, in whichever version its batch finds.
+
+        Args:
+            batch_size: Rows fetched from SQLite at a time
+
+        Yields:
+            Tuples of (token, snapshot) in token order
+        """
+        last_token = ""
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT token, data FROM sessions WHERE token > ? ORDER BY token LIMIT ?",
+                    (last_token, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_token = rows[-1][0]
+            for token, data in rows:
+                try:
+                    yield token, json.loads(zlib.decompress(data))
+                except (ValueError, zlib.error) as e:
+                    print(f"Skipping unreadable session {token}: {str(e)}")
+
+    def delete(self, token: str):
+        """Forget a session."""
+        with self._lock:
+            self._seq.pop(token, None)
+            self._db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+            self._db.commit()
+
+    def prune(self) -> int:
+        """Delete sessions older than the TTL, returning how many were removed."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM sessions WHERE updated_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._db.commit()
+            return cursor.rowcount
+
+    def _add_prefetch(self, token: str, seq: int, snapshot: Dict[str, Any], tech: str, future):
+        """Rewrite a checkpoint with its finished prefetch unless a newer one exists."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        text = future.result()
+        if ConversationManager._is_failed_response(text):
+            return
+        snapshot["manager"]["prefetched"] = [tech, text]
+        with self._lock:
+            if self._seq.get(token) == seq:
+                self._write(token, seq, snapshot)
+
+    def _add_scores(self, token: str, seq: int, snapshot: Dict[str, Any], manager: ConversationManager):
+        """Rewrite a checkpoint with the scores of the answers it holds unless a newer one exists."""
+        answers = snapshot["manager"]["candidate"]["scored_answers"]
+        current = manager.candidate.scored_answers
+        for index in range(min(len(answers), len(current))):
+            answers[index] = current[index].model_dump()
+        with self._lock:
+            if self._seq.get(token) == seq:
+                self._write(token, seq, snapshot)
+
+    def _write(self, token: str, seq: int, snapshot: Dict[str, Any]) -> bool:
+        """Store a snapshot, returning False if SQLite refused it. Must be called with the lock held."""
+        data = zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sessions (token, seq, data, updated_at) VALUES (?, ?, ?, ?)",
+                (token, seq, data, time.time())
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._db.rollback()
+            print(f"Could not checkpoint session {token}: {str(e)}")
+            return False
+        return True
+
+
+# Shared by every session in the process; None when checkpointing is disabled
+session_store = SessionStore(SESSION_STORE_PATH, SESSION_TTL_SECONDS) if SESSION_STORE_PATH else None
@@ -0,0 +1,239 @@
+"""Normalization of tech stack entries to canonical technology names."""
+from typing import List, Dict, Optional, Iterable, Tuple
+from dataclasses import dataclass
+from config.settings import COMMON_TECH_STACKS, TECH_ALIASES, TECH_MATCH_MIN_CONFIDENCE
+import re
+
+
+class MatchMethod:
+    """Enum for how an entry was matched."""
+    EXACT = "exact"
+    VERSION = "version"
+    PREFIX = "prefix"
+    FUZZY = "fuzzy"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class TechMatch:
+    """A tech stack entry resolved to a canonical name."""
+    text: str
+    canonical: str
+    confidence: float
+    method: str
+
+
+_SEPARATORS = re.compile(r"[\s.\-_]+")
+_VERSION_SUFFIX = re.compile(r"[\s\-_]*v?\d+(?:\.\d+)*(?:\.x)?\+?$")
+
+
+def compact_key(text: str) -> str:
+    """Lower-case ``text`` and drop spaces, dots, hyphens and underscores."""
+    return _SEPARATORS.sub("", text.lower())
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """
+    Edit distance counting adjacent transpositions, or None if it exceeds ``limit``.
+
+    Only the diagonal band of width ``limit`` is computed, and the search
+    stops as soon as every cell in a row is over the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return None
+    over = limit + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        current[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = min(value, over)
+        if min(current) > limit:
+            return None
+        previous2, previous = previous, current
+    return previous[len(b)] if previous[len(b)] <= limit else None
+
+
+def is_transposition(a: str, b: str) -> bool:
+    """Check whether ``b`` is ``a`` with one pair of adjacent characters swapped."""
+    if len(a) != len(b):
+        return False
+    differences = [index for index, (x, y) in enumerate(zip(a, b)) if x != y]
+    return (len(differences) == 2 and differences[1] == differences[0] + 1
+            and a[differences[0]] == b[differences[1]] and a[differences[1]] == b[differences[0]])
+
+
+class _TrieNode:
+    __slots__ = ("children", "canonical")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # The single canonical name reachable below this node, or None if there are several
+        self.canonical: Optional[str] = None
+
+
+class TechStackNormalizer:
+    """
+    Resolves free-form technology names to canonical ones.
+
+    Every canonical name and alias is indexed by its compact key. An entry
+    is tried as an exact key, then without a trailing version ("python 3.11",
+    "vue3"), then as an unambiguous prefix in a trie of the keys ("kubern"),
+    and finally against every key within a small edit distance ("kubernets").
+    Short names are often one letter away from a different technology
+    (Preact and React, NestJS and Next.js), so keys under seven characters
+    only match a swapped pair of letters ("pyhton"). Entries that match
+    nothing keep their own spelling with zero confidence.
+    """
+
+    _MIN_PREFIX = 3
+    _MIN_FUZZY = 4
+    _MIN_FUZZY_EDIT = 7
+    _FUZZY_CONFIDENCE_CAP = 0.95
+
+    def __init__(self, technologies: Optional[Iterable[str]] = None,
+                 aliases: Optional[Dict[str, List[str]]] = None, cache_size: int = 4096):
+        """
+        Initialize the normalizer.
+
+        Args:
+            technologies: Canonical technology names
+            aliases: Mapping of canonical name -> alternate spellings
+            cache_size: Resolved entries remembered between calls
+        """
+        self._index: Dict[str, str] = {}
+        self._root = _TrieNode()
+        self._cache: Dict[str, TechMatch] = {}
+        self.cache_size = cache_size
+        for tech in technologies if technologies is not None else COMMON_TECH_STACKS:
+            self.add_alias(tech, tech)
+        for tech, spellings in (aliases if aliases is not None else TECH_ALIASES).items():
+            self.add_alias(tech, tech)
+            for spelling in spellings:
+                self.add_alias(tech, spelling)
+
+    def add_alias(self, canonical: str, alias: str):
+        """Index ``alias`` as a spelling of ``canonical``."""
+        key = compact_key(alias)
+        if not key:
+            return
+        self._index[key] = canonical
+        self._cache.clear()
+
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        self._mark_prefixes(key)
+
+    def normalize(self, text: str) -> TechMatch:
+        """
+        Resolve one tech stack entry.
+
+        Args:
+            text: The entry as the candidate wrote it
+
+        Returns:
+            The canonical name, how confident the match is and how it was found
+        """
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+        match = self._resolve(text)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[text] = match
+        return match
+
+    def normalize_stack(self, entries: Iterable[str],
+                        min_confidence: float = TECH_MATCH_MIN_CONFIDENCE) -> List[TechMatch]:
+        """
+        Resolve a tech stack, dropping entries that name a technology already listed.
+
+        Matches below ``min_confidence`` keep the candidate's spelling.
+        """
+        seen = set()
+        matches = []
+        for entry in entries:
+            match = self.normalize(entry)
+            if match.confidence < min_confidence:
+                match = TechMatch(match.text, " ".join(match.text.split()), match.confidence, MatchMethod.UNKNOWN)
+            key = match.canonical.lower()
+            if key and key not in seen:
+                seen.add(key)
+                matches.append(match)
+        return matches
+
+    def _resolve(self, text: str) -> TechMatch:
+        key = compact_key(text)
+        if key in self._index:
+            return TechMatch(text, self._index[key], 1.0, MatchMethod.EXACT)
+
+        unversioned = compact_key(_VERSION_SUFFIX.sub("", text.strip().lower()))
+        if len(unversioned) >= 2 and unversioned in self._index:
+            return TechMatch(text, self._index[unversioned], 0.95, MatchMethod.VERSION)
+        key = unversioned or key
+
+        prefix = self._prefix_match(key)
+        if prefix is not None:
+            return TechMatch(text, prefix[0], prefix[1], MatchMethod.PREFIX)
+
+        fuzzy = self._fuzzy_match(key)
+        if fuzzy is not None:
+            return TechMatch(text, fuzzy[0], fuzzy[1], MatchMethod.FUZZY)
+        return TechMatch(text, " ".join(text.split()), 0.0, MatchMethod.UNKNOWN)
+
+    def _prefix_match(self, key: str) -> Optional[Tuple[str, float]]:
+        """Canonical name of the only technology whose keys start with ``key``."""
+        if len(key) < self._MIN_PREFIX:
+            return None
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        if node.canonical is None:
+            return None
+        # Shortest completion decides how much of the name was typed
+        shortest = min(len(k) for k, v in self._index.items() if v == node.canonical and k.startswith(key))
+        return node.canonical, 0.7 + 0.3 * len(key) / shortest
+
+    def _fuzzy_match(self, key: str) -> Optional[Tuple[str, float]]:
+        """Closest canonical name within an edit distance that grows with the key length."""
+        if len(key) < self._MIN_FUZZY:
+            return None
+        limit = 1 if len(key) < 10 else 2
+        transpositions_only = len(key) < self._MIN_FUZZY_EDIT
+        best: Optional[Tuple[int, int, str]] = None
+        for candidate, canonical in self._index.items():
+            distance = bounded_edit_distance(key, candidate, limit)
+            if distance is None or (transpositions_only and not is_transposition(key, candidate)):
+                continue
+            ranked = (distance, len(candidate), canonical)
+            if best is None or ranked < best:
+                best = ranked
+        if best is None:
+            return None
+        distance, length, canonical = best
+        confidence = (1 - distance / max(len(key), length)) * self._FUZZY_CONFIDENCE_CAP
+        return canonical, confidence
+
+    def _mark_prefixes(self, key: str):
+        """Recompute which canonical name each node on ``key``'s path leads to."""
+        path = [self._root]
+        for char in key:
+            path.append(path[-1].children[char])
+        for depth in range(len(path) - 1, 0, -1):
+            node = path[depth]
+            names = {self._index[key[:depth]]} if key[:depth] in self._index else set()
+            for child in node.children.values():
+                names.add(child.canonical)
+            node.canonical = names.pop() if len(names) == 1 and None not in names else None
+
+
+# Built once per process
+tech_normalizer = TechStackNormalizer()
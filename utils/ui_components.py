@@ -99,9 +99,9 @@ def render_feature_cards():
         """, unsafe_allow_html=True)
 
 
-def render_progress_ring(percentage, label):
-    """Render a circular progress indicator"""
-    st.markdown(f"""
+def progress_ring_html(percentage, label):
+    """Build the HTML for a circular progress indicator"""
+    return f"""
         <style>
         .progress-ring-container {{
             text-align: center;
@@ -164,11 +164,16 @@ def render_progress_ring(percentage, label):
             <div class="progress-ring-text">{percentage}%</div>
             <div class="progress-label">{label}</div>
         </div>
-    """, unsafe_allow_html=True)
+    """
 
 
-def render_stage_timeline(current_stage, all_stages):
-    """Render a visual timeline of interview stages"""
+def render_progress_ring(percentage, label):
+    """Render a circular progress indicator"""
+    st.markdown(progress_ring_html(percentage, label), unsafe_allow_html=True)
+
+
+def stage_timeline_html(current_stage, all_stages):
+    """Build the HTML for a timeline of interview stages"""
     stage_emojis = {
         "Initial Greeting": "👋",
         "Collecting Name": "✍️",
@@ -185,20 +190,23 @@ def render_stage_timeline(current_stage, all_stages):
     
     current_idx = all_stages.index(current_stage) if current_stage in all_stages else 0
     
-    timeline_html = '<div class="timeline">'
+    items = []
     for idx, stage in enumerate(all_stages):
         status = "completed" if idx < current_idx else "current" if idx == current_idx else "pending"
         emoji = stage_emojis.get(stage, "📌")
         
-        timeline_html += f"""
+        items.append(f"""
             <div class="timeline-item {status}">
                 <div class="timeline-marker">{emoji}</div>
                 <div class="timeline-content">{stage}</div>
             </div>
-        """
-    
-    timeline_html += '</div>'
+        """)
     
+    return '<div class="timeline">' + "".join(items) + '</div>'
+
+
+def render_stage_timeline(current_stage, all_stages):
+    """Render a visual timeline of interview stages"""
     st.markdown("""
         <style>
         .timeline {
@@ -241,7 +249,7 @@ def render_stage_timeline(current_stage, all_stages):
         </style>
     """, unsafe_allow_html=True)
     
-    st.markdown(timeline_html, unsafe_allow_html=True)
+    st.markdown(stage_timeline_html(current_stage, all_stages), unsafe_allow_html=True)
 
 
 def render_typing_indicator():
@@ -292,6 +300,23 @@ def render_typing_indicator():
     """, unsafe_allow_html=True)
 
 
+def render_streaming_response(chunks):
+    """Render a response as its chunks arrive and return the full text"""
+    placeholder = st.empty()
+    
+    # Keep the typing indicator up until the first token lands
+    with placeholder.container():
+        render_typing_indicator()
+    
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        placeholder.markdown(text + "▌")
+    
+    placeholder.markdown(text)
+    return text
+
+
 def render_success_animation():
     """Render success animation"""
     st.markdown("""
@@ -335,9 +360,9 @@ def render_success_animation():
     """, unsafe_allow_html=True)
 
 
-def render_info_tooltip(text, tooltip_text):
-    """Render text with info tooltip"""
-    st.markdown(f"""
+def info_tooltip_html(text, tooltip_text):
+    """Build the HTML for text with an info tooltip"""
+    return f"""
         <style>
         .tooltip-container {{
             position: relative;
@@ -387,4 +412,9 @@ def render_info_tooltip(text, tooltip_text):
             <span class="tooltip-icon">i</span>
             <span class="tooltip-text">{tooltip_text}</span>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def render_info_tooltip(text, tooltip_text):
+    """Render text with info tooltip"""
+    st.markdown(info_tooltip_html(text, tooltip_text), unsafe_allow_html=True)